@@ -7,12 +7,13 @@ import io
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from typing import IO, Any, Iterable, List, Mapping, Union, cast
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
+from airbyte_cdk.utils.message_serializer import loads
 from pydantic import ValidationError
 
 logger = logging.getLogger("airbyte")
@@ -21,6 +22,12 @@ logger = logging.getLogger("airbyte")
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
 
+    # Set to True to skip pydantic validation of RECORD messages read from stdin. Records are then built with `construct()` from the
+    # parsed JSON, only checking the envelope has a stream name and a data object, while other messages are still fully validated.
+    lightweight_record_parsing: bool = False
+    # Size of the chunks read from stdin when lightweight_record_parsing is enabled
+    input_buffer_size: int = 1024 * 1024
+
     @abstractmethod
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
@@ -39,11 +46,33 @@ class Destination(Connector, ABC):
             except ValidationError:
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    def _parse_input_stream_lightweight(self, input_stream: IO[bytes]) -> Iterable[AirbyteMessage]:
+        """Reads binary lines from stdin, converting them to Airbyte messages without validating RECORD messages"""
+        for line in input_stream:
+            try:
+                message = loads(line)
+            except ValueError:
+                logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line.decode('utf-8', errors='replace')}")
+                continue
+            record = message.get("record") if isinstance(message, dict) else None
+            if isinstance(record, dict) and message.get("type") == Type.RECORD.value:
+                if isinstance(record.get("stream"), str) and isinstance(record.get("data"), dict):
+                    yield AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(**record))
+                    continue
+            try:
+                yield AirbyteMessage.parse_obj(message)
+            except ValidationError:
+                logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line.decode('utf-8', errors='replace')}")
+
     def _run_write(
-        self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
+        self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: Union[io.TextIOWrapper, IO[bytes]]
     ) -> Iterable[AirbyteMessage]:
         catalog = ConfiguredAirbyteCatalog.parse_file(configured_catalog_path)
-        input_messages = self._parse_input_stream(input_stream)
+        # run_cmd opens stdin in binary mode for lightweight_record_parsing and in text mode otherwise
+        if self.lightweight_record_parsing:
+            input_messages = self._parse_input_stream_lightweight(cast(IO[bytes], input_stream))
+        else:
+            input_messages = self._parse_input_stream(cast(io.TextIOWrapper, input_stream))
         logger.info("Begin writing to the destination...")
         yield from self.write(config=config, configured_catalog=catalog, input_messages=input_messages)
         logger.info("Writing complete.")
@@ -100,8 +129,13 @@ class Destination(Connector, ABC):
         if cmd == "check":
             yield self._run_check(config=config)
         elif cmd == "write":
-            # Wrap in UTF-8 to override any other input encodings
-            wrapped_stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+            wrapped_stdin: Union[io.TextIOWrapper, IO[bytes]]
+            if self.lightweight_record_parsing:
+                # Read raw bytes in large chunks, JSON is decoded as UTF-8 by the parser
+                wrapped_stdin = io.BufferedReader(io.FileIO(sys.stdin.fileno(), "rb", closefd=False), buffer_size=self.input_buffer_size)
+            else:
+                # Wrap in UTF-8 to override any other input encodings
+                wrapped_stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
             yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=wrapped_stdin)
 
     def run(self, args: List[str]):
@@ -18,6 +18,7 @@ from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
+from airbyte_cdk.utils.message_serializer import airbyte_message_to_json
 
 logger = init_logger("airbyte")
 
@@ -112,7 +113,7 @@ class AirbyteEntrypoint(object):
                     state = self.source.read_state(parsed_args.state)
                     generator = self.source.read(self.logger, config, config_catalog, state)
                     for message in generator:
-                        yield message.json(exclude_unset=True)
+                        yield airbyte_message_to_json(message)
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -120,8 +121,12 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    # Write to the same stream the logger uses so messages and logs keep their order, flushing is left to the stream's buffering
+    try:
+        for message in source_entrypoint.run(parsed_args):
+            sys.stdout.write(f"{message}\n")
+    finally:
+        sys.stdout.flush()
 
 
 def main():
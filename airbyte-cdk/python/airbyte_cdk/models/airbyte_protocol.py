@@ -76,6 +76,7 @@ class AirbyteLogMessage(BaseModel):
 
 class TraceType(Enum):
     ERROR = "ERROR"
+    METRICS = "METRICS"
 
 
 class FailureType(Enum):
@@ -93,6 +94,16 @@ class AirbyteErrorTraceMessage(BaseModel):
     failure_type: Optional[FailureType] = Field(None, description="The type of error")
 
 
+class AirbyteMetricsHistogramBucket(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    upper_bound_ms: Optional[float] = Field(
+        None, description="Inclusive upper bound of the bucket, not set for the last bucket which has none"
+    )
+    count: int
+
+
 class Status(Enum):
     SUCCEEDED = "SUCCEEDED"
     FAILED = "FAILED"
@@ -190,6 +201,27 @@ class AirbyteGlobalState(BaseModel):
     stream_states: List[AirbyteStreamState]
 
 
+class AirbyteMetricsTraceMessage(BaseModel):
+    class Config:
+        extra = Extra.allow
+
+    stream_descriptor: StreamDescriptor
+    elapsed_ms: Optional[float] = Field(None, description="Time since the stream started being read")
+    request_count: Optional[int] = Field(None, description="Number of HTTP requests sent, retries included")
+    request_time_ms: Optional[float] = Field(None, description="Time spent waiting on the responses of HTTP requests")
+    request_latency_histogram: Optional[List[AirbyteMetricsHistogramBucket]] = Field(
+        None, description="Number of HTTP requests by latency, by ascending upper bound"
+    )
+    bytes_received: Optional[int] = Field(None, description="Size of the bodies of the HTTP responses read")
+    records_emitted: Optional[int] = Field(None, description="Number of records emitted")
+    parse_time_ms: Optional[float] = Field(None, description="Time spent extracting records from responses")
+    transform_time_ms: Optional[float] = Field(None, description="Time spent transforming records to the stream schema")
+    backoff_time_ms: Optional[float] = Field(
+        None, description="Time spent waiting before sending or retrying HTTP requests, on backoff or on rate limits"
+    )
+    output_time_ms: Optional[float] = Field(None, description="Time spent waiting on the output of the emitted messages")
+
+
 class AirbyteTraceMessage(BaseModel):
     class Config:
         extra = Extra.allow
@@ -197,6 +229,7 @@ class AirbyteTraceMessage(BaseModel):
     type: TraceType = Field(..., description="the type of trace message", title="trace type")
     emitted_at: float = Field(..., description="the time in ms that the message was emitted")
     error: Optional[AirbyteErrorTraceMessage] = Field(None, description="error trace message: the error object")
+    metrics: Optional[AirbyteMetricsTraceMessage] = Field(None, description="metrics trace message: the performance counters of a stream")
 
 
 class AirbyteStream(BaseModel):
@@ -5,32 +5,53 @@
 
 import copy
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from queue import Queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateBlob,
     AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
     Status,
+    StreamDescriptor,
     SyncMode,
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http.async_http import AsyncHttpStream
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.concurrency import put_unless_cancelled, read_slices, read_slices_async
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.transform import TypeTransformer
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+@dataclass
+class _StreamReadCompleted:
+    """Sentinel put on the output queue by a concurrent stream reader once it is done, successfully or not"""
+
+    stream_instance: Stream
+    stream_name: str
+    exception: Optional[Exception] = None
+
+
 class AbstractSource(Source, ABC):
     """
     Abstract base class for an Airbyte Source. Consumers should implement any abstract methods
@@ -60,12 +81,54 @@ class AbstractSource(Source, ABC):
 
     # Stream name to instance map for applying output object transformation
     _stream_to_instance_map: Dict[str, Stream] = {}
+    # Whether the records of the current read are timed, only when stream metrics are emitted since it is done for every record
+    _time_records: bool = False
+
+    # Maximum number of messages buffered between the stream reader threads and the output when reading streams concurrently
+    concurrent_read_queue_size: int = 10000
 
     @property
     def name(self) -> str:
         """Source name"""
         return self.__class__.__name__
 
+    @property
+    def max_concurrent_streams(self) -> Optional[int]:
+        """
+        Decides how many configured streams are read at the same time. E.g: if this returns a value of 4, up to 4 streams are read in parallel
+        on a thread pool and their messages are interleaved on the output. STATE messages of a stream are always emitted after the records
+        they account for, so checkpoints stay correct.
+
+        Only override this if the streams of the source can safely be read from different threads (e.g: they don't share mutable state).
+
+        return None to read streams one after another, which is the default.
+        """
+        return None
+
+    @property
+    def per_stream_state_enabled(self) -> bool:
+        """
+        Decides how STATE messages are emitted. By default, every STATE message holds the state of all the streams of the connector,
+        so each checkpoint serializes the state of every stream again. If this returns True, STATE messages are of the STREAM type and
+        hold the state of the checkpointed stream only, which keeps them small for sources with many streams or large stream states.
+
+        Only override this if the platform running the connector supports per-stream state.
+        """
+        return False
+
+    @property
+    def stream_metrics_interval(self) -> Optional[float]:
+        """
+        Decides how often the performance counters of a stream being read are emitted, as METRICS trace messages, see Stream.metrics.
+        E.g: if this returns a value of 60, the counters of each stream are emitted every minute while it is read, and once it is done.
+        They tell whether a slow stream is waiting on the API, on parsing its responses or on the output.
+
+        Only override this if the platform running the connector supports METRICS trace messages.
+
+        return None to not emit them, which is the default.
+        """
+        return None
+
     def discover(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteCatalog:
         """Implements the Discover operation from the Airbyte Specification.
         See https://docs.airbyte.io/architecture/airbyte-protocol.
@@ -101,7 +164,20 @@ class AbstractSource(Source, ABC):
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
         self._stream_to_instance_map = stream_instances
+        self._time_records = bool(self.stream_metrics_interval)
         with create_timer(self.name) as timer:
+            if self.max_concurrent_streams and self.max_concurrent_streams > 1:
+                yield from self._read_streams_concurrently(
+                    logger=logger,
+                    catalog=catalog,
+                    stream_instances=stream_instances,
+                    connector_state=connector_state,
+                    internal_config=internal_config,
+                    timer=timer,
+                )
+                logger.info(f"Finished syncing {self.name}")
+                return
+
             for configured_stream in catalog.streams:
                 stream_instance = stream_instances.get(configured_stream.stream.name)
                 if not stream_instance:
@@ -133,6 +209,112 @@ class AbstractSource(Source, ABC):
 
         logger.info(f"Finished syncing {self.name}")
 
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        connector_state: MutableMapping[str, Any],
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        """Read the configured streams on a bounded thread pool and interleave their messages.
+
+        Every stream checkpoints into its own state dict. STATE messages are merged into the connector state here, in output order,
+        so a STATE message never accounts for records of another stream which have not been emitted yet.
+        """
+        configured_streams = []
+        for configured_stream in catalog.streams:
+            stream_instance = stream_instances.get(configured_stream.stream.name)
+            if not stream_instance:
+                raise KeyError(
+                    f"The requested stream {configured_stream.stream.name} was not found in the source."
+                    f" Available streams: {stream_instances.keys()}"
+                )
+            configured_streams.append((configured_stream, stream_instance))
+
+        output: Queue = Queue(maxsize=self.concurrent_read_queue_size)
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix=f"{self.name}-read")
+        logger.info(f"Reading {len(configured_streams)} streams with up to {self.max_concurrent_streams} streams at a time")
+        try:
+            for configured_stream, stream_instance in configured_streams:
+                stream_name = configured_stream.stream.name
+                stream_state = {stream_name: connector_state[stream_name]} if stream_name in connector_state else {}
+                executor.submit(
+                    self._read_stream_to_queue,
+                    logger=logger,
+                    stream_instance=stream_instance,
+                    configured_stream=configured_stream,
+                    stream_state=stream_state,
+                    internal_config=internal_config,
+                    timer=timer,
+                    output=output,
+                    cancelled=cancelled,
+                )
+
+            pending_streams = len(configured_streams)
+            while pending_streams:
+                item = output.get()
+                if isinstance(item, _StreamReadCompleted):
+                    pending_streams -= 1
+                    logger.info(f"Finished syncing {item.stream_name}")
+                    if item.exception:
+                        self._raise_stream_exception(logger, item.stream_instance, item.stream_name, item.exception)
+                    continue
+                if item.type == MessageType.STATE and item.state.data is not None:
+                    connector_state.update(item.state.data)
+                    item = AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
+                yield item
+            logger.info(timer.report())
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _read_stream_to_queue(
+        self,
+        logger: logging.Logger,
+        stream_instance: Stream,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_state: MutableMapping[str, Any],
+        internal_config: InternalConfig,
+        timer: EventTimer,
+        output: Queue,
+        cancelled: threading.Event,
+    ):
+        stream_name = configured_stream.stream.name
+        event_name = f"Syncing stream {stream_name}"
+        exception = None
+        timer.start_event(event_name)
+        try:
+            for message in self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                connector_state=stream_state,
+                internal_config=internal_config,
+            ):
+                if message.type == MessageType.STATE and message.state:
+                    # Snapshot the state now, the stream keeps mutating it while earlier messages wait in the queue
+                    message = AirbyteMessage(type=MessageType.STATE, state=message.state.copy(deep=True))
+                if not put_unless_cancelled(output, message, cancelled):
+                    return
+        except Exception as e:
+            exception = e
+        finally:
+            timer.finish_event(event_name)
+        put_unless_cancelled(output, _StreamReadCompleted(stream_instance, stream_name, exception), cancelled)
+
+    @staticmethod
+    def _raise_stream_exception(logger: logging.Logger, stream_instance: Stream, stream_name: str, exception: Exception):
+        if isinstance(exception, AirbyteTracedException):
+            raise exception
+        logger.error(f"Encountered an exception while reading stream {stream_name}", exc_info=exception)
+        display_message = stream_instance.get_error_display_message(exception)
+        if display_message:
+            raise AirbyteTracedException.from_exception(exception, message=display_message) from exception
+        raise exception
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -175,13 +357,32 @@ class AbstractSource(Source, ABC):
 
         record_counter = 0
         stream_name = configured_stream.stream.name
+        metrics = stream_instance.metrics
+        metrics.reset()
+        metrics_interval = self.stream_metrics_interval
+        next_metrics_at = time.monotonic() + metrics_interval if metrics_interval else None
         logger.info(f"Syncing stream: {stream_name} ")
-        for record in record_iterator:
-            if record.type == MessageType.RECORD:
-                record_counter += 1
-            yield record
+        if next_metrics_at is None:
+            for record in record_iterator:
+                if record.type == MessageType.RECORD:
+                    record_counter += 1
+                yield record
+            metrics.records_emitted = record_counter
+        else:
+            for record in record_iterator:
+                if record.type == MessageType.RECORD:
+                    record_counter += 1
+                    metrics.records_emitted = record_counter
+                start = time.perf_counter()
+                yield record
+                metrics.output_time += time.perf_counter() - start
+                if time.monotonic() >= next_metrics_at:
+                    yield metrics.as_airbyte_message(stream_name)
+                    next_metrics_at = time.monotonic() + metrics_interval
 
         logger.info(f"Read {record_counter} records from {stream_name} stream")
+        if next_metrics_at is not None:
+            yield metrics.as_airbyte_message(stream_name)
 
     @staticmethod
     def _limit_reached(internal_config: InternalConfig, records_counter: int) -> bool:
@@ -226,36 +427,71 @@ class AbstractSource(Source, ABC):
         )
         logger.debug(f"Processing stream slices for {stream_name}", extra={"stream_slices": slices})
         total_records_counter = 0
+        checkpoint_policy = stream_instance.checkpoint_policy
+        if checkpoint_policy:
+            checkpoint_policy.reset()
+        # State of the last STATE message of the stream, checkpoints which would not change it are skipped
+        last_checkpointed_state = None
+
+        def checkpoint(stream_state: MutableMapping[str, Any]) -> Iterator[AirbyteMessage]:
+            nonlocal last_checkpointed_state
+            if checkpoint_policy:
+                checkpoint_policy.reset()
+            message = self._checkpoint_state(stream_instance, stream_state, connector_state)
+            if last_checkpointed_state is not None and connector_state[stream_name] == last_checkpointed_state:
+                return
+            last_checkpointed_state = copy.deepcopy(connector_state[stream_name])
+            yield message
+
         if not slices:
             # Safety net to ensure we always emit at least one state message even if there are no slices
-            checkpoint = self._checkpoint_state(stream_instance, stream_instance.state, connector_state)
-            yield checkpoint
-        for _slice in slices:
-            logger.debug("Processing stream slice", extra={"slice": _slice})
-            records = stream_instance.read_records(
+            yield from checkpoint(stream_instance.state)
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        if (
+            max_concurrent_slices
+            and max_concurrent_slices > 1
+            and "state" in dir(stream_instance)
+            and not stream_instance.commits_state_by_slice
+        ):
+            # The stream advances its own state while reading records, slices read ahead would checkpoint records not emitted yet
+            logger.warning(f"Reading the slices of {stream_name} one after another, since it updates its state while reading records")
+            max_concurrent_slices = None
+        sliced_records = self._read_slices(
+            stream_instance,
+            slices,
+            max_concurrent_slices,
+            lambda _slice: dict(
                 sync_mode=SyncMode.incremental,
                 stream_slice=_slice,
                 stream_state=stream_state,
                 cursor_field=configured_stream.cursor_field or None,
-            )
-            for record_counter, record_data in enumerate(records, start=1):
-                yield self._as_airbyte_record(stream_name, record_data)
-                stream_state = stream_instance.get_updated_state(stream_state, record_data)
-                checkpoint_interval = stream_instance.state_checkpoint_interval
-                if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                    yield self._checkpoint_state(stream_instance, stream_state, connector_state)
-
-                total_records_counter += 1
-                # This functionality should ideally live outside of this method
-                # but since state is managed inside this method, we keep track
-                # of it here.
-                if self._limit_reached(internal_config, total_records_counter):
-                    # Break from slice loop to save state and exit from _read_incremental function.
-                    break
-
-            yield self._checkpoint_state(stream_instance, stream_state, connector_state)
-            if self._limit_reached(internal_config, total_records_counter):
-                return
+            ),
+        )
+        # close the slice readers as soon as reading stops, rather than whenever the generator gets garbage collected
+        with closing(sliced_records):
+            for _slice, records in sliced_records:
+                logger.debug("Processing stream slice", extra={"slice": _slice})
+                for record_data in records:
+                    message = self._as_airbyte_record(stream_name, record_data)
+                    yield message
+                    stream_state = stream_instance.get_updated_state(stream_state, record_data)
+                    if checkpoint_policy and checkpoint_policy.record_emitted(message.record.data):
+                        yield from checkpoint(stream_state)
+
+                    total_records_counter += 1
+                    # This functionality should ideally live outside of this method
+                    # but since state is managed inside this method, we keep track
+                    # of it here.
+                    if self._limit_reached(internal_config, total_records_counter):
+                        # Break from slice loop to save state and exit from _read_incremental function.
+                        break
+
+                limit_reached = self._limit_reached(internal_config, total_records_counter)
+                if not limit_reached:
+                    stream_instance.commit_slice(_slice)
+                yield from checkpoint(stream_state)
+                if limit_reached:
+                    return
 
     def _read_full_refresh(
         self,
@@ -267,18 +503,48 @@ class AbstractSource(Source, ABC):
         slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
         logger.debug(f"Processing stream slices for {configured_stream.stream.name}", extra={"stream_slices": slices})
         total_records_counter = 0
-        for _slice in slices:
-            logger.debug("Processing stream slice", extra={"slice": _slice})
-            records = stream_instance.read_records(
+        sliced_records = self._read_slices(
+            stream_instance,
+            slices,
+            stream_instance.max_concurrent_slices,
+            lambda _slice: dict(
                 stream_slice=_slice,
                 sync_mode=SyncMode.full_refresh,
                 cursor_field=configured_stream.cursor_field,
+            ),
+        )
+        with closing(sliced_records):
+            for _slice, records in sliced_records:
+                logger.debug("Processing stream slice", extra={"slice": _slice})
+                for record in records:
+                    yield self._as_airbyte_record(configured_stream.stream.name, record)
+                    total_records_counter += 1
+                    if self._limit_reached(internal_config, total_records_counter):
+                        return
+
+    @staticmethod
+    def _read_slices(
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        max_concurrent_slices: Optional[int],
+        read_records_kwargs: Callable[[Optional[Mapping[str, Any]]], Mapping[str, Any]],
+    ) -> Iterator[Tuple[Optional[Mapping[str, Any]], Iterable[Mapping[str, Any]]]]:
+        """
+        Reads the slices of a stream, up to max_concurrent_slices at the same time.
+        Slices of an AsyncHttpStream are read as tasks of an event loop, slices of other streams on threads.
+        """
+        if isinstance(stream_instance, AsyncHttpStream):
+            return read_slices_async(
+                slices,
+                lambda _slice: stream_instance.read_records_async(**read_records_kwargs(_slice)),
+                max_concurrent_slices=max_concurrent_slices,
+                cleanup=stream_instance.close_async_client,
             )
-            for record in records:
-                yield self._as_airbyte_record(configured_stream.stream.name, record)
-                total_records_counter += 1
-                if self._limit_reached(internal_config, total_records_counter):
-                    return
+        return read_slices(
+            slices,
+            lambda _slice: stream_instance.read_records(**read_records_kwargs(_slice)),
+            max_concurrent_slices=max_concurrent_slices,
+        )
 
     def _checkpoint_state(self, stream, stream_state, connector_state):
         try:
@@ -286,6 +552,12 @@ class AbstractSource(Source, ABC):
         except AttributeError:
             connector_state[stream.name] = stream_state
 
+        if self.per_stream_state_enabled:
+            stream_state_message = AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name=stream.name), stream_state=AirbyteStateBlob.parse_obj(connector_state[stream.name])
+            )
+            state_message = AirbyteStateMessage(type=AirbyteStateType.STREAM, stream=stream_state_message)
+            return AirbyteMessage(type=MessageType.STATE, state=state_message)
         return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
 
     @lru_cache(maxsize=None)
@@ -307,9 +579,16 @@ class AbstractSource(Source, ABC):
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        if self._time_records:
+            start = time.perf_counter()
+            transformer.transform(data, schema)  # type: ignore
+            self._stream_to_instance_map[stream_name].metrics.transform_time += time.perf_counter() - start
+        else:
+            transformer.transform(data, schema)  # type: ignore
+        # Skip pydantic validation, which would copy every record, the fields are already of the expected types
+        data = data if isinstance(data, dict) else dict(data)
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream):
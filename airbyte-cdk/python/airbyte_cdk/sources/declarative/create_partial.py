@@ -3,6 +3,8 @@
 #
 
 import inspect
+from functools import lru_cache
+from typing import FrozenSet
 
 OPTIONS_STR = "$options"
 
@@ -64,16 +66,19 @@ def create(func, /, *args, **keywords):
 
 
 def _get_kwargs_to_pass_to_func(func, options):
-    argspec = inspect.getfullargspec(func)
-    kwargs_to_pass_down = set(argspec.kwonlyargs)
-    args_to_pass_down = set(argspec.args)
-    all_args = args_to_pass_down.union(kwargs_to_pass_down)
+    all_args = _get_arg_names(func)
     kwargs_to_pass_down = {k: v for k, v in options.items() if k in all_args}
     if "options" in all_args:
         kwargs_to_pass_down["options"] = options
     return kwargs_to_pass_down
 
 
+@lru_cache(maxsize=None)
+def _get_arg_names(func) -> FrozenSet[str]:
+    argspec = inspect.getfullargspec(func)
+    return frozenset(argspec.args).union(argspec.kwonlyargs)
+
+
 def _create_inner_objects(keywords, kwargs):
     fully_created = dict()
     for k, v in keywords.items():
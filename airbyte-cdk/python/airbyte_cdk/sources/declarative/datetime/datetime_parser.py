@@ -3,7 +3,29 @@
 #
 
 import datetime
-from typing import Union
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Union
+
+# Patterns of the directives parsed without strptime. They only match the zero-padded values strptime matches first, values they don't
+# match are parsed by strptime
+_DIRECTIVE_PATTERNS = {
+    "Y": "([0-9]{4})",
+    "m": "([0-9]{2})",
+    "d": "([0-9]{2})",
+    "H": "([0-9]{2})",
+    "M": "([0-9]{2})",
+    "S": "([0-9]{2})",
+    "f": "([0-9]{1,6})",
+    # The offset is validated but not used, the parsed datetime gets the timezone passed to parse
+    "z": "(?:(?-i:Z)|[+-](?:[01][0-9]|2[0-3]):?[0-5][0-9])",
+}
+# Positions of the directives' values in the arguments of datetime.datetime, and strptime's defaults for the missing ones
+_FIELD_POSITIONS = {"Y": 0, "m": 1, "d": 2, "H": 3, "M": 4, "S": 5, "f": 6}
+_DEFAULT_FIELDS = [1900, 1, 1, 0, 0, 0, 0]
+_FORMAT_TOKENS = re.compile(r"%.?|\s+|[^%\s]+", re.DOTALL)
+
+Parser = Callable[[str, Optional[datetime.tzinfo]], datetime.datetime]
 
 
 class DatetimeParser:
@@ -14,6 +36,12 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    %ms is the number of milliseconds since the Epoch.
+
+    Formats made of numeric directives (%Y, %m, %d, %H, %M, %S, %f and %z), e.g: ISO-8601 formats, are parsed by a regular expression built
+    once per format instead of strptime, which is much slower. Values it doesn't match are parsed by strptime, so both give the same
+    results. Parsed values are cached for all the instances, cursor values are often parsed several times.
     """
 
     def parse(self, date: Union[str, int], format: str, timezone):
@@ -23,10 +51,13 @@ class DatetimeParser:
         #
         # The recommended way to parse a date from its timestamp representation is to use datetime.fromtimestamp
         # See https://stackoverflow.com/a/4974930
+        # Timestamps are parsed faster than they would be looked up in the cache
         if format == "%s":
             return datetime.datetime.fromtimestamp(int(date), tz=timezone)
-        else:
-            return datetime.datetime.strptime(str(date), format).replace(tzinfo=timezone)
+        elif format == "%ms":
+            seconds, milliseconds = divmod(int(date), 1000)
+            return datetime.datetime.fromtimestamp(seconds, tz=timezone).replace(microsecond=milliseconds * 1000)
+        return _parse(date, format, timezone)
 
     def format(self, dt: datetime.datetime, format: str) -> str:
         # strftime("%s") is unreliable because it ignores the time zone information and assumes the time zone of the system it's running on
@@ -34,5 +65,80 @@ class DatetimeParser:
         # See https://stackoverflow.com/a/4974930
         if format == "%s":
             return str(int(dt.timestamp()))
+        elif format == "%ms":
+            return str(int(dt.timestamp()) * 1000 + dt.microsecond // 1000)
         else:
             return dt.strftime(format)
+
+
+# Values parsed by streams are mostly cursor values, the cache bound only matters when a sync parses many distinct values
+@lru_cache(maxsize=10000)
+def _parse(date: Union[str, int], format: str, timezone: Optional[datetime.tzinfo]) -> datetime.datetime:
+    return _get_parser(format)(str(date), timezone)
+
+
+@lru_cache(maxsize=None)
+def _get_parser(format: str) -> Parser:
+    return _build_parser(format)
+
+
+def _parse_with_strptime(date: str, format: str, timezone: Optional[datetime.tzinfo]) -> datetime.datetime:
+    return datetime.datetime.strptime(date, format).replace(tzinfo=timezone)
+
+
+def _build_parser(format: str) -> Parser:
+    """
+    Builds the parser of a format: a regular expression matching the same values as the one strptime builds, for formats it supports,
+    or strptime itself.
+    """
+    pattern: List[str] = []
+    directives: List[str] = []
+    for token in _FORMAT_TOKENS.findall(format):
+        if token == "%%":
+            pattern.append("%")
+        elif token.startswith("%"):
+            directive = token[1:]
+            # strptime rejects formats with a repeated directive
+            if directive not in _DIRECTIVE_PATTERNS or directive in directives:
+                return lambda date, timezone: _parse_with_strptime(date, format, timezone)
+            directives.append(directive)
+            pattern.append(_DIRECTIVE_PATTERNS[directive])
+        elif token.isspace():
+            # strptime matches any whitespace where the format has some
+            pattern.append(r"\s+")
+        else:
+            pattern.append(re.escape(token))
+    positions = [_FIELD_POSITIONS[directive] for directive in directives if directive in _FIELD_POSITIONS]
+    # strptime matches the literals of the format regardless of their case
+    regex = re.compile("".join(pattern), re.IGNORECASE)
+    microsecond_index = positions.index(_FIELD_POSITIONS["f"]) if "f" in directives else None
+    # e.g: %Y-%m-%dT%H:%M:%S, whose values are the first arguments of datetime.datetime
+    in_order = positions == list(range(len(positions)))
+
+    def parse(date: str, timezone: Optional[datetime.tzinfo]) -> datetime.datetime:
+        match = regex.fullmatch(date)
+        if match:
+            values = match.groups()
+            fields = list(map(int, values))
+            if microsecond_index is not None:
+                # strptime reads the fraction of a second, e.g: "5" is 500000 microseconds
+                fields[microsecond_index] = int(values[microsecond_index].ljust(6, "0"))
+            if in_order:
+                fields.extend(_DEFAULT_FIELDS[len(fields) :])
+            else:
+                fields = _arrange_fields(positions, fields)
+            try:
+                return datetime.datetime(*fields, tzinfo=timezone)
+            except ValueError:
+                # e.g: a day out of the range of the month, strptime raises the error
+                pass
+        return _parse_with_strptime(date, format, timezone)
+
+    return parse
+
+
+def _arrange_fields(positions: List[int], values: List[int]) -> List[int]:
+    fields = list(_DEFAULT_FIELDS)
+    for position, value in zip(positions, values):
+        fields[position] = value
+    return fields
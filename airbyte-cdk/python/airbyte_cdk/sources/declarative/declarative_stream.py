@@ -3,14 +3,17 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
+from airbyte_cdk.sources.declarative.stream_slicers.cartesian_product_stream_slicer import CartesianProductStreamSlicer
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
-from airbyte_cdk.sources.declarative.types import Config, StreamSlice
+from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.stream_metrics import StreamMetrics
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
@@ -29,6 +32,10 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         transformations (List[RecordTransformation]): A list of transformations to be applied to each output record in the
         stream. Transformations are applied in the order in which they are defined.
         checkpoint_interval (Optional[int]): How often the stream will checkpoint state (i.e: emit a STATE message)
+        max_concurrent_slices (Optional[int]): How many slices are read at the same time, e.g: how many parent records of a
+        SubstreamSlicer have their requests in flight. Requires a SimpleRetriever. Defaults to the max_concurrent_slices of a
+        CartesianProductStreamSlicer. In incremental syncs, the cursor updates of a slice read ahead are held until its records are
+        emitted, so the records of a slice are kept in memory until then.
     """
 
     schema_loader: SchemaLoader
@@ -42,10 +49,22 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
     stream_cursor_field: Optional[Union[List[str], str]] = None
     transformations: List[RecordTransformation] = None
     checkpoint_interval: Optional[int] = None
+    max_concurrent_slices: Optional[int] = None
 
     def __post_init__(self, options: Mapping[str, Any]):
         self.stream_cursor_field = self.stream_cursor_field or []
         self.transformations = self.transformations or []
+        stream_slicer = getattr(self.retriever, "stream_slicer", None)
+        if self.max_concurrent_slices is None and isinstance(stream_slicer, CartesianProductStreamSlicer):
+            self.max_concurrent_slices = stream_slicer.max_concurrent_slices
+        if self.max_concurrent_slices and self.max_concurrent_slices > 1 and not isinstance(self.retriever, SimpleRetriever):
+            raise ValueError(f"Stream {self.name} can only read slices concurrently with a SimpleRetriever")
+        # SimpleRetriever hands over the records of each page, so that transformations are prepared once per page
+        self._transforms_pages = bool(self.transformations) and isinstance(self.retriever, SimpleRetriever)
+        if self._transforms_pages:
+            self.retriever.page_transformer = self._transform_page
+        # Cursor updates of the slices read ahead, by id of the slice, until the slice is committed
+        self._cursor_updates: Dict[int, List[Tuple[StreamSlice, Optional[Record]]]] = {}
 
     @property
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
@@ -94,6 +113,22 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         return self.state
 
+    @property
+    def commits_state_by_slice(self) -> bool:
+        return bool(self.max_concurrent_slices and self.max_concurrent_slices > 1)
+
+    def commit_slice(self, stream_slice: Optional[StreamSlice]):
+        cursor_updates = self._cursor_updates.pop(id(stream_slice), None)
+        if cursor_updates and isinstance(self.retriever, SimpleRetriever):
+            self.retriever.apply_cursor_updates(cursor_updates)
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        # Requests are sent and parsed by the retriever, counters of both are shared
+        if isinstance(self.retriever, Stream):
+            return self.retriever.metrics
+        return super().metrics
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -109,9 +144,26 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
-        for record in self.retriever.read_records(sync_mode, cursor_field, stream_slice, stream_state):
+        retriever = self.retriever
+        if self.commits_state_by_slice:
+            # slices are read from several threads, each one paginates on its own
+            retriever = retriever.copy()
+            if sync_mode == SyncMode.incremental:
+                # the cursor is updated in slice order, by commit_slice once the records of the slice are emitted
+                retriever.cursor_updates = self._cursor_updates[id(stream_slice)] = []
+        records = retriever.read_records(sync_mode, cursor_field, stream_slice, stream_state)
+        if self._transforms_pages:
+            # already transformed by the retriever
+            yield from records
+            return
+        for record in records:
             yield self._apply_transformations(record, self.config, stream_slice)
 
+    def _transform_page(self, records: List[Record], stream_slice: Optional[StreamSlice]) -> List[Record]:
+        for transformation in self.transformations:
+            records = transformation.transform_records(records, config=self.config, stream_state=self.state, stream_slice=stream_slice)
+        return records
+
     def _apply_transformations(self, record: Mapping[str, Any], config: Config, stream_slice: StreamSlice):
         output_record = record
         for transformation in self.transformations:
@@ -139,5 +191,7 @@ class DeclarativeStream(Stream, JsonSchemaMixin):
         :param stream_state:
         :return:
         """
+        # the cursor updates of the slices of an interrupted read are never committed
+        self._cursor_updates.clear()
         # this is not passing the cursor field because it is known at init time
         return self.retriever.stream_slices(sync_mode=sync_mode, stream_state=stream_state)
@@ -0,0 +1,49 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import InitVar, dataclass
+from typing import Any, Iterator, List, Mapping
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.types import Record
+from airbyte_cdk.sources.utils import json_stream
+from dataclasses_jsonschema import JsonSchemaMixin
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder, JsonSchemaMixin):
+    """
+    Decoder strategy for large JSON responses: requests are sent with stream=True, and the DpathExtractor parses the records out of the
+    body as it is read, so that neither the body nor the decoded response are ever fully in memory. The records of a page are still
+    collected before they are selected, so memory grows with the number of records per page.
+
+    Once the records are extracted, the response decodes to the rest of its body, with an empty array in place of the records, e.g: for
+    the paginator to read the next page token.
+    Requires ijson, install it with `pip install airbyte-cdk[json-stream]`.
+
+    Example:
+    ```
+      extractor:
+        type: DpathExtractor
+        field_pointer: ["data", "records"]
+        decoder:
+          type: StreamingJsonDecoder
+    ```
+    """
+
+    options: InitVar[Mapping[str, Any]]
+
+    def __post_init__(self, options: Mapping[str, Any]):
+        if json_stream.ijson is None:
+            raise ImportError("StreamingJsonDecoder requires ijson, install it with `pip install airbyte-cdk[json-stream]`")
+
+    def decode_records(self, response: requests.Response, path: List[str]) -> Iterator[Record]:
+        """
+        Parses the records found at path out of the body of the response as it is read
+        :param response: the response to decode
+        :param path: keys of the nested objects leading to the records, the whole body if empty
+        :return: the records, yielded as they are parsed
+        """
+        return json_stream.iter_response_records(response, path)
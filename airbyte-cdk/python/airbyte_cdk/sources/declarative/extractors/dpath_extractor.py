@@ -2,18 +2,24 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Callable, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config, Record
 from dataclasses_jsonschema import JsonSchemaMixin
 
+# Characters making a field of the pointer a glob, e.g: "*" matching all the fields of an object
+_GLOB_CHARACTERS = re.compile(r"[*?\[]")
+_NOT_FOUND = object()
+
 
 @dataclass
 class DpathExtractor(RecordExtractor, JsonSchemaMixin):
@@ -48,6 +54,12 @@ class DpathExtractor(RecordExtractor, JsonSchemaMixin):
         field_pointer: []
     ```
 
+    The field pointer is interpolated once. Unless it contains globs, records are extracted by looking the fields up directly instead of
+    searching the response with dpath.
+
+    With a StreamingJsonDecoder, records are parsed out of the JSON body as the response is read, so that the raw body and its decoded form
+    are never fully in memory. The records of the page are still returned as a list. The field pointer must then be a path of object keys.
+
     Attributes:
         transform (Union[InterpolatedString, str]): Pointer to the field that should be extracted
         config (Config): The user-provided configuration as specified by the source's spec
@@ -60,20 +72,58 @@ class DpathExtractor(RecordExtractor, JsonSchemaMixin):
     decoder: Decoder = JsonDecoder(options={})
 
     def __post_init__(self, options: Mapping[str, Any]):
-        for pointer_index in range(len(self.field_pointer)):
-            if isinstance(self.field_pointer[pointer_index], str):
-                self.field_pointer[pointer_index] = InterpolatedString.create(self.field_pointer[pointer_index], options=options)
+        interpolated_pointer = [
+            InterpolatedString.create(field, options=options) if isinstance(field, str) else field for field in self.field_pointer
+        ]
+        self.field_pointer[:] = interpolated_pointer
+        # The field pointer is interpolated once
+        self._pointer: List[Any] = [field.eval(self.config) for field in interpolated_pointer]
+        self._get: Callable[[Any], Any] = _compile_pointer(self._pointer)
 
     def extract_records(self, response: requests.Response) -> List[Record]:
-        response_body = self.decoder.decode(response)
-        if len(self.field_pointer) == 0:
-            extracted = response_body
-        else:
-            pointer = [pointer.eval(self.config) for pointer in self.field_pointer]
-            extracted = dpath.util.get(response_body, pointer, default=[])
+        if isinstance(self.decoder, StreamingJsonDecoder):
+            return list(self.decoder.decode_records(response, self._streaming_path()))
+        extracted = self._get(self.decoder.decode(response))
         if isinstance(extracted, list):
             return extracted
         elif extracted:
             return [extracted]
         else:
             return []
+
+    def _streaming_path(self) -> List[str]:
+        path = [str(field) if type(field) is int else field for field in self._pointer]
+        if not all(isinstance(field, str) and not _GLOB_CHARACTERS.search(field) for field in path):
+            raise ValueError(f"Streaming extraction needs a field pointer made of object keys, got {self._pointer}")
+        return path
+
+
+def _compile_pointer(pointer: List[Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function getting the value at the pointer, the same as dpath.util.get(body, pointer, default=[]) when the body is decoded
+    JSON. Fields match object keys, and list indices when they are numbers.
+    """
+    if not pointer:
+        return lambda body: body
+    fields = [str(field) if type(field) is int else field for field in pointer]
+    if not all(isinstance(field, str) and not _GLOB_CHARACTERS.search(field) for field in fields):
+        return lambda body: dpath.util.get(body, pointer, default=[])
+
+    def get(body: Any) -> Any:
+        current = body
+        for field in fields:
+            if isinstance(current, Mapping):
+                current = current.get(field, _NOT_FOUND)
+            elif isinstance(current, list):
+                index = int(field) if field.isdigit() and str(int(field)) == field else len(current)
+                current = current[index] if index < len(current) else _NOT_FOUND
+            elif isinstance(current, (str, bytes, int, float, type(None))):
+                # dpath doesn't look into values which aren't objects or arrays
+                current = _NOT_FOUND
+            else:
+                return dpath.util.get(body, pointer, default=[])
+            if current is _NOT_FOUND:
+                return []
+        return current
+
+    return get
@@ -3,10 +3,10 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Final, List, Mapping
+from typing import Any, Callable, Final, List, Mapping
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
-from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.declarative.types import Config, Record
 from dataclasses_jsonschema import JsonSchemaMixin
 
 FALSE_VALUES: Final[List[Any]] = ["False", "false", "{}", "[]", "()", "", "0", "0.0", "False", "false", {}, False, [], (), set()]
@@ -45,3 +45,17 @@ class InterpolatedBoolean(JsonSchemaMixin):
                 return False
             # The presence of a value is generally regarded as truthy, so we treat it as such
             return True
+
+    def record_evaluator(self, config: Config, **additional_options) -> Callable[[Record], bool]:
+        """
+        Returns a function evaluating the condition for a record, the same as eval(config, record=record, **additional_options) but faster
+        when called for all the records of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param additional_options: Optional parameters used for interpolation, the same for all records
+        :return: The function evaluating the condition
+        """
+        if isinstance(self.condition, bool):
+            return lambda record: self.condition
+        evaluate = self._interpolation.record_evaluator(self.condition, config, self._default, options=self._options, **additional_options)
+        return lambda record: evaluate(record) not in FALSE_VALUES
@@ -3,10 +3,10 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Callable, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
-from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.declarative.types import Config, Record
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
@@ -40,6 +40,17 @@ class InterpolatedString(JsonSchemaMixin):
         """
         return self._interpolation.eval(self.string, config, self.default, options=self._options, **kwargs)
 
+    def record_evaluator(self, config: Config, **kwargs) -> Callable[[Record], Any]:
+        """
+        Returns a function interpolating the input string for a record, the same as eval(config, record=record, **kwargs) but faster
+        when called for all the records of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param kwargs: Optional parameters used for interpolation, the same for all records
+        :return: The function interpolating the string
+        """
+        return self._interpolation.record_evaluator(self.string, config, self.default, options=self._options, **kwargs)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
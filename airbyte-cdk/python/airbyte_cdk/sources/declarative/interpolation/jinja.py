@@ -3,14 +3,82 @@
 #
 
 import ast
-from typing import Optional
+import re
+from typing import Any, Callable, Dict, Optional
 
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
-from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import Environment
+from airbyte_cdk.sources.declarative.types import Config, Record
+from jinja2 import Environment, Template
 from jinja2.exceptions import UndefinedError
 
+# How a string accepted by ast.literal_eval can start, once leading whitespace is stripped: numbers, signs, ellipsis, quotes,
+# brackets, comments, line continuations, prefixed strings, True, False, None and set()
+_LITERAL_FIRST_CHARACTERS = frozenset("0123456789+-.\"'[{(#\\")
+_LITERAL_WORD = re.compile(r"[bBrRuUfF]{1,2}[\"']|True|False|None|set\s*\(")
+_LITERAL_WORD_PREFIX = re.compile(r"[bBrRuUfF]{1,2}|T(r(ue?)?)?|F(a(l(se?)?)?)?|N(o(ne?)?)?|s(et?)?|set\s*")
+# Syntax starting a jinja expression, statement or comment with the default delimiters
+_JINJA_SYNTAX = re.compile(r"{[{%#]")
+_IMMUTABLE_LITERALS = (str, bytes, int, float, complex, bool, type(None))
+
+
+def _may_be_literal(text: str, complete: bool = True) -> bool:
+    """
+    False when ast.literal_eval is certain to fail on the text, skipping the cost of parsing it.
+    :param complete: False if the text is only the beginning of the string to evaluate
+    """
+    stripped = text.lstrip()
+    if not stripped or stripped[0] in _LITERAL_FIRST_CHARACTERS or _LITERAL_WORD.match(stripped):
+        return True
+    return not complete and _LITERAL_WORD_PREFIX.fullmatch(stripped) is not None
+
+
+def _literal_eval(result):
+    try:
+        return ast.literal_eval(result)
+    except (ValueError, SyntaxError):
+        return result
+
+
+class _CompiledTemplate:
+    """
+    A template string parsed once. Strings without jinja syntax are rendered once, their output doesn't depend on the context.
+    """
+
+    def __init__(self, environment: Environment, source: str):
+        self.source = source
+        self.template: Optional[Template] = None
+        self.static_output: Optional[str] = None
+        self.static_value: Any = None
+        prefix = _JINJA_SYNTAX.split(source, 1)[0]
+        # the text before the first jinja tag starts every output of the template
+        self.may_be_literal = _may_be_literal(prefix, complete=False)
+        if _JINJA_SYNTAX.search(source):
+            self.template = environment.from_string(source)
+        else:
+            # still rendered by jinja, which normalizes newlines
+            self.static_output = environment.from_string(source).render()
+            self.static_value = _literal_eval(self.static_output)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        if self.template is None:
+            return self.static_output
+        try:
+            return self.template.render(context)
+        except TypeError:
+            # The template can't be rendered with this context, it is returned as is
+            return self.source
+
+    def literal_eval(self, output: str):
+        if self.template is None and output is self.static_output:
+            if isinstance(self.static_value, _IMMUTABLE_LITERALS):
+                return self.static_value
+            # evaluate mutable values again so that callers don't share them
+            return _literal_eval(output)
+        if not self.may_be_literal or not isinstance(output, str) or not _may_be_literal(output):
+            return output
+        return _literal_eval(output)
+
 
 class JinjaInterpolation(Interpolation):
     """
@@ -28,37 +96,84 @@ class JinjaInterpolation(Interpolation):
     "{{ max(2, 3) }}" will return 3
 
     Additional information on jinja templating can be found at https://jinja.palletsprojects.com/en/3.1.x/templates/#
+
+    Templates are compiled once and cached by their text for all the instances, strings without jinja syntax skip rendering.
     """
 
-    def __init__(self):
-        self._environment = Environment()
-        self._environment.globals.update(**macros)
+    # Templates come from the connector's definition, the cache bound only matters for callers building a template per evaluation
+    MAX_CACHED_TEMPLATES = 10000
+
+    _environment = Environment()
+    _environment.globals.update(**macros)
+    _templates: Dict[str, _CompiledTemplate] = {}
 
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_options):
         context = {"config": config, **additional_options}
         try:
             if isinstance(input_str, str):
-                result = self._eval(input_str, context)
+                template = self._compile(input_str)
+                result = template.render(context)
                 if result:
-                    return self._literal_eval(result)
+                    return template.literal_eval(result)
             else:
                 # If input is not a string, return it as is
                 raise Exception(f"Expected a string. got {input_str}")
         except UndefinedError:
             pass
         # If result is empty or resulted in an undefined error, evaluate and return the default string
-        return self._literal_eval(self._eval(default, context))
+        if not isinstance(default, str):
+            # The default is a static value, not a jinja template
+            return self._literal_eval(default)
+        template = self._compile(default)
+        return template.literal_eval(template.render(context))
 
     def _literal_eval(self, result):
-        try:
-            return ast.literal_eval(result)
-        except (ValueError, SyntaxError):
-            return result
+        return _literal_eval(result)
+
+    def _compile(self, s: str) -> _CompiledTemplate:
+        compiled = self._templates.get(s)
+        if compiled is None:
+            compiled = _CompiledTemplate(self._environment, s)
+            if len(self._templates) >= self.MAX_CACHED_TEMPLATES:
+                self._templates.pop(next(iter(self._templates)), None)
+            self._templates[s] = compiled
+        return compiled
 
     def _eval(self, s: str, context):
-        try:
-            return self._environment.from_string(s).render(context)
-        except TypeError:
+        if not isinstance(s, str):
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+        return self._compile(s).render(context)
+
+    def record_evaluator(
+        self, input_str: str, config: Config, default: Optional[str] = None, **additional_options
+    ) -> Callable[[Record], Any]:
+        """
+        Returns a function evaluating input_str for a record, the same as eval(input_str, config, default, record=record, ...).
+
+        The rendering context is built once and reused for every record, so evaluating a page of records only pays for rendering the
+        template. Records whose evaluation is empty or fails go through eval to get the default or the error.
+        """
+        if not isinstance(input_str, str) or self._compile(input_str).template is None:
+            return lambda record: self.eval(input_str, config, default, record=record, **additional_options)
+
+        compiled = self._compile(input_str)
+        template = compiled.template
+        context = template.new_context({"config": config, **additional_options, "record": None})
+        concat = self._environment.concat
+
+        def evaluate(record: Record) -> Any:
+            # values assigned by the template while rendering the previous record must not leak into this one
+            context.vars.clear()
+            context.exported_vars.clear()
+            context.vars["record"] = record
+            try:
+                result = concat(template.root_render_func(context))
+            except Exception:
+                result = None
+            if result:
+                return compiled.literal_eval(result)
+            return self.eval(input_str, config, default, record=record, **additional_options)
+
+        return evaluate
@@ -9,6 +9,7 @@ from airbyte_cdk.sources.declarative.auth.oauth import DeclarativeOauth2Authenti
 from airbyte_cdk.sources.declarative.auth.token import ApiKeyAuthenticator, BasicHttpAuthenticator, BearerAuthenticator
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
@@ -20,6 +21,7 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategie
 from airbyte_cdk.sources.declarative.requesters.error_handlers.composite_error_handler import CompositeErrorHandler
 from airbyte_cdk.sources.declarative.requesters.error_handlers.default_error_handler import DefaultErrorHandler
 from airbyte_cdk.sources.declarative.requesters.http_requester import HttpRequester
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
 from airbyte_cdk.sources.declarative.requesters.paginators.limit_paginator import LimitPaginator
 from airbyte_cdk.sources.declarative.requesters.paginators.no_pagination import NoPagination
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
@@ -38,6 +40,7 @@ CLASS_TYPES_REGISTRY contains a mapping of developer-friendly string -> class to
 """
 CLASS_TYPES_REGISTRY: Mapping[str, Type] = {
     "AddFields": AddFields,
+    "AdaptivePageSize": AdaptivePageSize,
     "ApiKeyAuthenticator": ApiKeyAuthenticator,
     "BasicHttpAuthenticator": BasicHttpAuthenticator,
     "BearerAuthenticator": BearerAuthenticator,
@@ -64,5 +67,6 @@ CLASS_TYPES_REGISTRY: Mapping[str, Type] = {
     "RecordSelector": RecordSelector,
     "RemoveFields": RemoveFields,
     "SimpleRetriever": SimpleRetriever,
+    "StreamingJsonDecoder": StreamingJsonDecoder,
     "SubstreamSlicer": SubstreamSlicer,
 }
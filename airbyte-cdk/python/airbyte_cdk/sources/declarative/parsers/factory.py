@@ -4,13 +4,13 @@
 
 from __future__ import annotations
 
-import copy
 import enum
 import importlib
 import inspect
 import typing
 import warnings
 from dataclasses import fields
+from functools import lru_cache
 from typing import Any, List, Literal, Mapping, Type, Union, get_args, get_origin, get_type_hints
 
 from airbyte_cdk.sources.declarative.create_partial import OPTIONS_STR, create
@@ -19,7 +19,8 @@ from airbyte_cdk.sources.declarative.parsers.class_types_registry import CLASS_T
 from airbyte_cdk.sources.declarative.parsers.default_implementation_registry import DEFAULT_IMPLEMENTATIONS_REGISTRY
 from airbyte_cdk.sources.declarative.types import Config
 from dataclasses_jsonschema import JsonSchemaMixin
-from jsonschema.validators import validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 ComponentDefinition: Union[Literal, Mapping, List]
 
@@ -100,6 +101,8 @@ class DeclarativeComponentFactory:
     ```
     In this example, outer.inner.k2 will evaluate to "MyValue"
 
+    Component definitions are never modified: definitions referenced several times, e.g: through a YAML reference, are shared by the
+    components created from them instead of being copied for each of them.
     """
 
     def __init__(self):
@@ -115,7 +118,7 @@ class DeclarativeComponentFactory:
         :param instantiate: The factory should create the component when True or instead perform schema validation when False
         :return: The object to create
         """
-        kwargs = copy.deepcopy(component_definition)
+        kwargs = dict(component_definition)
         if "class_name" in kwargs:
             class_name = kwargs.pop("class_name")
         elif "type" in kwargs:
@@ -139,10 +142,13 @@ class DeclarativeComponentFactory:
         else:
             class_ = class_or_class_name
 
-        # create components in options before propagating them
+        # create components in options before propagating them. The options propagated to a component defined in the options don't
+        # include its own definition, which would otherwise be created again and again
         if OPTIONS_STR in kwargs:
+            options = kwargs[OPTIONS_STR]
             kwargs[OPTIONS_STR] = {
-                k: self._create_subcomponent(k, v, kwargs, config, class_, instantiate) for k, v in kwargs[OPTIONS_STR].items()
+                k: self._create_subcomponent(k, v, {OPTIONS_STR: self._without_key(options, k)}, config, class_, instantiate)
+                for k, v in options.items()
             }
 
         updated_kwargs = {k: self._create_subcomponent(k, v, kwargs, config, class_, instantiate) for k, v in kwargs.items()}
@@ -150,23 +156,15 @@ class DeclarativeComponentFactory:
         if instantiate:
             return create(class_, config=config, **updated_kwargs)
         else:
-            # Because the component's data fields definitions use interfaces, we need to resolve the underlying types into the
-            # concrete classes that implement the interface before generating the schema
-            class_copy = copy.deepcopy(class_)
-            DeclarativeComponentFactory._transform_interface_to_union(class_copy)
-
-            # dataclasses_jsonschema can throw warnings when a declarative component has a fields cannot be turned into a schema.
-            # Some builtin field types like Any or DateTime get flagged, but are not as critical to schema generation and validation
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=UserWarning)
-                schema = class_copy.json_schema()
-
             component_definition = {
                 **updated_kwargs,
                 **{k: v for k, v in updated_kwargs.get(OPTIONS_STR, {}).items() if k not in updated_kwargs},
                 "config": config,
             }
-            validate(component_definition, schema)
+            # Raises the same error as jsonschema.validate, without checking the schema against its metaschema for every component
+            error = best_match(_get_validator(class_).iter_errors(component_definition))
+            if error is not None:
+                raise error
             return lambda: component_definition
 
     @staticmethod
@@ -180,6 +178,10 @@ class DeclarativeComponentFactory:
     def _merge_dicts(d1, d2):
         return {**d1, **d2}
 
+    @staticmethod
+    def _without_key(d, key):
+        return {k: v for k, v in d.items() if k != key}
+
     def _create_subcomponent(self, key, definition, kwargs, config, parent_class, instantiate: bool = True):
         """
         There are 5 ways to define a component.
@@ -189,26 +191,19 @@ class DeclarativeComponentFactory:
         4. list: loop over the list and create objects for its items
         5. anything else -> return as is
         """
-        if self.is_object_definition_with_class_name(definition):
-            # propagate kwargs to inner objects
-            definition[OPTIONS_STR] = self._merge_dicts(kwargs.get(OPTIONS_STR, dict()), definition.get(OPTIONS_STR, dict()))
-            return self.create_component(definition, config, instantiate)()
-        elif self.is_object_definition_with_type(definition):
-            # If type is set instead of class_name, get the class_name from the CLASS_TYPES_REGISTRY
-            definition[OPTIONS_STR] = self._merge_dicts(kwargs.get(OPTIONS_STR, dict()), definition.get(OPTIONS_STR, dict()))
-            object_type = definition.pop("type")
-            class_name = CLASS_TYPES_REGISTRY[object_type]
-            definition["class_name"] = class_name
-            return self.create_component(definition, config, instantiate)()
+        if self.is_object_definition_with_class_name(definition) or self.is_object_definition_with_type(definition):
+            # propagate kwargs to inner objects. If type is set instead of class_name, create_component gets the class_name from the
+            # CLASS_TYPES_REGISTRY
+            options = self._merge_dicts(kwargs.get(OPTIONS_STR, dict()), definition.get(OPTIONS_STR, dict()))
+            return self.create_component({**definition, OPTIONS_STR: options}, config, instantiate)()
         elif isinstance(definition, dict):
             # Try to infer object type
             expected_type = self.get_default_type(key, parent_class)
             # if there is an expected type, and it's not a builtin type, then instantiate it
             # We don't have to instantiate builtin types (eg string and dict) because definition is already going to be of that type
             if expected_type and not self._is_builtin_type(expected_type):
-                definition["class_name"] = expected_type
-                definition[OPTIONS_STR] = self._merge_dicts(kwargs.get(OPTIONS_STR, dict()), definition.get(OPTIONS_STR, dict()))
-                return self.create_component(definition, config, instantiate)()
+                options = self._merge_dicts(kwargs.get(OPTIONS_STR, dict()), definition.get(OPTIONS_STR, dict()))
+                return self.create_component({**definition, "class_name": expected_type, OPTIONS_STR: options}, config, instantiate)()
             else:
                 return definition
         elif isinstance(definition, list):
@@ -249,7 +244,7 @@ class DeclarativeComponentFactory:
 
     @staticmethod
     def get_default_type(parameter_name, parent_class):
-        type_hints = get_type_hints(parent_class.__init__)
+        type_hints = _get_type_hints(parent_class)
         interface = type_hints.get(parameter_name)
         while True:
             origin = get_origin(interface)
@@ -317,3 +312,28 @@ class DeclarativeComponentFactory:
                 # be another container
                 return Union[tuple(unpacked_types)]
         return field_type
+
+
+@lru_cache(maxsize=None)
+def _get_type_hints(class_: type) -> Mapping[str, Any]:
+    return get_type_hints(class_.__init__)
+
+
+@lru_cache(maxsize=None)
+def _get_validator(class_: type):
+    schema = _get_schema(class_)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def _get_schema(class_: type) -> Mapping[str, Any]:
+    # Because the component's data fields definitions use interfaces, we need to resolve the underlying types into the
+    # concrete classes that implement the interface before generating the schema
+    DeclarativeComponentFactory._transform_interface_to_union(class_)
+
+    # dataclasses_jsonschema can throw warnings when a declarative component has a fields cannot be turned into a schema.
+    # Some builtin field types like Any or DateTime get flagged, but are not as critical to schema generation and validation
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        return class_.json_schema()
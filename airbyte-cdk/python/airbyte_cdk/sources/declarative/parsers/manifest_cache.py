@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib import metadata
+from typing import Any, Mapping, Optional
+
+from airbyte_cdk.sources.declarative.types import ConnectionDefinition
+
+MANIFEST_CACHE_DIR_ENV_VAR = "AIRBYTE_MANIFEST_CACHE_DIR"
+
+logger = logging.getLogger("airbyte.manifest_cache")
+
+
+class ManifestCache:
+    """
+    Keeps the manifests of declarative sources once parsed and validated, so that the check, discover and read commands of a
+    connector, each run by a process of its own, parse and validate the manifest once.
+
+    Manifests are stored as JSON files named after the hash of the manifest and of the versions of the CDK, which validated it, and of
+    the connector, whose custom components were validated: a manifest is parsed and validated again whenever it, the CDK or the connector
+    changes. Manifests whose JSON representation isn't equal to them, e.g: holding dates, are not cached, nor are the manifests of a CDK or
+    a connector whose version is unknown, e.g: not installed as a package.
+
+    Sources only cache their manifest when the AIRBYTE_MANIFEST_CACHE_DIR environment variable is set, see from_environment. Connector
+    images can point it to a directory of the image, filled by running the connector once at build time.
+    """
+
+    def __init__(self, directory: str, connector_package: Optional[str] = None):
+        """
+        :param directory: directory of the cache files
+        :param connector_package: name of the package of the connector, whose version is part of the cache key
+        """
+        self.directory = directory
+        self._cdk_version = _package_version("airbyte-cdk")
+        self._connector_version = _package_version(connector_package) if connector_package else ""
+
+    @classmethod
+    def from_environment(cls, connector_package: Optional[str] = None) -> Optional["ManifestCache"]:
+        """
+        :param connector_package: name of the package of the connector, whose version is part of the cache key
+        :return: the cache in the directory set by the AIRBYTE_MANIFEST_CACHE_DIR environment variable, None if it isn't set
+        """
+        directory = os.environ.get(MANIFEST_CACHE_DIR_ENV_VAR)
+        return cls(directory, connector_package) if directory else None
+
+    def get(self, manifest: str) -> Optional[ConnectionDefinition]:
+        """
+        :param manifest: the YAML manifest
+        :return: the parsed manifest if it was cached, else None
+        """
+        path = self._path(manifest)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to read the cached manifest {path}: {e}")
+            return None
+
+    def set(self, manifest: str, parsed_manifest: Mapping[str, Any]):
+        """
+        Caches a manifest, to be called once it is validated. Errors writing the cache file are ignored.
+        :param manifest: the YAML manifest
+        :param parsed_manifest: the manifest parsed by YamlParser
+        """
+        path = self._path(manifest)
+        if path is None:
+            return
+        try:
+            serialized_manifest = json.dumps(parsed_manifest)
+        except (TypeError, ValueError):
+            return
+        # e.g: YAML mappings with integer keys
+        if json.loads(serialized_manifest) != parsed_manifest:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # the file is renamed once written, so that concurrent processes never read partially written manifests
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w") as file:
+                    file.write(serialized_manifest)
+                os.replace(temporary_path, path)
+            except BaseException:
+                os.remove(temporary_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to cache the manifest in {path}: {e}")
+
+    def _path(self, manifest: str) -> Optional[str]:
+        # Validation depends on the versions of the CDK and of the connector, manifests are not cached when either is unknown
+        if self._cdk_version is None or self._connector_version is None:
+            return None
+        key = hashlib.sha256(f"{self._cdk_version}\n{self._connector_version}\n{manifest}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+
+def _package_version(package: str) -> Optional[str]:
+    # Distributions of connectors are named after their package with dashes, e.g: source-foo for source_foo
+    for name in (package, package.replace("_", "-")):
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            pass
+    return None
@@ -2,7 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from copy import deepcopy
+from copy import copy
 from typing import Any, Mapping, Tuple, Union
 
 import yaml
@@ -123,7 +123,8 @@ class YamlParser(ConnectionDefinitionParser):
         d = {}
         if self.ref_tag in input_mapping:
             partial_ref_string = input_mapping[self.ref_tag]
-            d = deepcopy(self._preprocess(partial_ref_string, evaluated_mapping, path))
+            # the keys of input_mapping override those of the referenced mapping, whose values are shared rather than copied
+            d = copy(self._preprocess(partial_ref_string, evaluated_mapping, path))
 
         for key, value in input_mapping.items():
             if key == self.ref_tag:
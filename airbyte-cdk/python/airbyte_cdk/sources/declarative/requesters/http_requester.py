@@ -149,7 +149,7 @@ class HttpRequester(Requester, JsonSchemaMixin):
     @property
     def cache_filename(self) -> str:
         # FIXME: this should be declarative
-        return f"{self.name}.yml"
+        return f"{self.name}.sqlite"
 
     @property
     def use_cache(self) -> bool:
@@ -2,9 +2,10 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
 from airbyte_cdk.sources.declarative.requesters.paginators.limit_paginator import LimitPaginator
 from airbyte_cdk.sources.declarative.requesters.paginators.no_pagination import NoPagination
 from airbyte_cdk.sources.declarative.requesters.paginators.paginator import Paginator
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 
-__all__ = ["LimitPaginator", "NoPagination", "PaginationStrategy", "Paginator"]
+__all__ = ["AdaptivePageSize", "LimitPaginator", "NoPagination", "PaginationStrategy", "Paginator"]
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from dataclasses import InitVar, dataclass
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+from dataclasses_jsonschema import JsonSchemaMixin
+
+
+@dataclass
+class AdaptivePageSize(JsonSchemaMixin):
+    """
+    Tunes the page size of a LimitPaginator between min_page_size and max_page_size, to read the records of a stream as fast as the API
+    allows.
+
+    Starting from the page size of the paginator, the page size is doubled as long as full pages are read faster, in records per second,
+    than at the current size, and halved when smaller pages were read faster. Pages answered slower than max_response_time, larger than
+    max_response_size, or whose request timed out or failed with a server error halve the page size, which is never increased above it
+    again. The response time of a page is the time until its response headers are received.
+
+    The page size is kept across the slices of the stream: each slice starts with the page size the previous ones settled on.
+
+    Examples:
+          paginator:
+            type: "LimitPaginator"
+            page_size: 100
+            adaptive_page_size:
+              min_page_size: 10
+              max_page_size: 1000
+              max_response_time: 30
+            limit_option:
+              inject_into: request_parameter
+              field_name: page_size
+            pagination_strategy:
+              type: "CursorPagination"
+              cursor_value: "{{ response._metadata.next }}"
+
+    Attributes:
+        min_page_size (int): the smallest page size to request
+        max_page_size (int): the largest page size to request
+        max_response_time (Optional[int]): number of seconds above which the response time of a page is too long
+        max_response_size (Optional[int]): number of bytes above which the body of a response is too large
+    """
+
+    min_page_size: int
+    max_page_size: int
+    options: InitVar[Mapping[str, Any]]
+    max_response_time: Optional[int] = None
+    max_response_size: Optional[int] = None
+
+    def __post_init__(self, options: Mapping[str, Any]):
+        if not 0 < self.min_page_size <= self.max_page_size:
+            raise ValueError(f"Invalid page size bounds: min_page_size={self.min_page_size}, max_page_size={self.max_page_size}")
+        self._page_size: Optional[int] = None
+        self._ceiling = self.max_page_size
+        # Records per second of the full pages read at each page size
+        self._throughputs: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # The paginators of the slices read concurrently are copies of the stream's paginator, they tune the same page size
+        return self
+
+    def get_page_size(self, default_page_size: int) -> int:
+        """
+        :param default_page_size: the page size of the paginator, used until pages are read
+        :return: the page size to request
+        """
+        with self._lock:
+            if self._page_size is None:
+                self._page_size = min(max(default_page_size, self.min_page_size), self.max_page_size)
+            return self._page_size
+
+    def page_read(self, page_size: int, response: requests.Response, number_of_records: int):
+        """
+        Called for each page read
+        :param page_size: the page size the page was requested with
+        :param response: the response of the page
+        :param number_of_records: the number of records of the page
+        """
+        response_time = response.elapsed.total_seconds()
+        response_size = _get_response_size(response)
+        with self._lock:
+            if (self.max_response_time is not None and response_time > self.max_response_time) or (
+                self.max_response_size is not None and response_size is not None and response_size > self.max_response_size
+            ):
+                self._decrease(page_size)
+                return
+            # The last page of a slice tells nothing about larger pages
+            if number_of_records < page_size:
+                return
+            throughput = number_of_records / max(response_time, 0.001)
+            previous_throughput = self._throughputs.get(page_size)
+            self._throughputs[page_size] = throughput if previous_throughput is None else (previous_throughput + throughput) / 2
+            # Pages requested before the page size last changed don't change it
+            if page_size == self._page_size:
+                self._page_size = self._next_page_size(page_size)
+
+    def page_failed(self, page_size: int):
+        """
+        Called when the request of a page timed out or failed with a server error
+        :param page_size: the page size the page was requested with
+        """
+        with self._lock:
+            self._decrease(page_size)
+
+    def _decrease(self, page_size: int):
+        self._ceiling = min(self._ceiling, max(self.min_page_size, page_size // 2))
+        self._page_size = min(self._page_size or page_size, self._ceiling)
+
+    def _next_page_size(self, page_size: int) -> int:
+        throughput = self._throughputs[page_size]
+        smaller_page_size = max(self.min_page_size, page_size // 2)
+        if smaller_page_size < page_size and self._throughputs.get(smaller_page_size, 0) > throughput:
+            return smaller_page_size
+        # Larger page sizes are tried once before being compared
+        larger_page_size = min(self._ceiling, page_size * 2)
+        if larger_page_size > page_size and self._throughputs.get(larger_page_size, float("inf")) > throughput:
+            return larger_page_size
+        return page_size
+
+
+def _get_response_size(response: requests.Response) -> Optional[int]:
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        return int(content_length)
+    # The content of streamed responses is replaced once their records are read, the bytes read from the connection are counted instead
+    if hasattr(response.raw, "tell"):
+        return response.raw.tell()
+    if response._content is not False:
+        return len(response.content)
+    return None
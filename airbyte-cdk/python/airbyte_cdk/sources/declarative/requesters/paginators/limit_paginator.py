@@ -9,7 +9,9 @@ import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
 from airbyte_cdk.sources.declarative.requesters.paginators.paginator import Paginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
@@ -71,6 +73,10 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
               option_type: "request_parameter"
               field_name: "page"
 
+    With adaptive_page_size, the page size is tuned as pages are read, see AdaptivePageSize. The page size of the pagination strategy,
+    if any, follows the page size of the paginator. Pages numbered by a PageIncrement strategy keep the same size within a slice. Other
+    pages whose request timed out or failed with a server error are retried with the smaller page size.
+
     Attributes:
         page_size (int): the number of records to request
         limit_option (RequestOption): the request option to set the limit. Cannot be injected in the path.
@@ -79,6 +85,7 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
         config (Config): connection config
         url_base (Union[InterpolatedString, str]): endpoint's base url
         decoder (Decoder): decoder to decode the response
+        adaptive_page_size (Optional[AdaptivePageSize]): tunes the page size, which is fixed if not set
     """
 
     page_size: int
@@ -89,6 +96,7 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
     url_base: Union[InterpolatedString, str]
     options: InitVar[Mapping[str, Any]]
     decoder: Decoder = JsonDecoder(options={})
+    adaptive_page_size: Optional[AdaptivePageSize] = None
     _token: Optional[Any] = field(init=False, repr=False, default=None)
 
     def __post_init__(self, options: Mapping[str, Any]):
@@ -96,9 +104,14 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
             raise ValueError("Limit parameter cannot be a path")
         if isinstance(self.url_base, str):
             self.url_base = InterpolatedString(string=self.url_base, options=options)
+        self._page_size = self.page_size
 
     def next_page_token(self, response: requests.Response, last_records: List[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        if self.adaptive_page_size:
+            self.adaptive_page_size.page_read(self._page_size, response, len(last_records or []))
         self._token = self.pagination_strategy.next_page_token(response, last_records)
+        if self.adaptive_page_size and not isinstance(self.pagination_strategy, PageIncrement):
+            self._set_page_size(self.adaptive_page_size.get_page_size(self.page_size))
         if self._token:
             return {"next_page_token": self._token}
         else:
@@ -149,6 +162,21 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
 
     def reset(self):
         self.pagination_strategy.reset()
+        if self.adaptive_page_size:
+            self._set_page_size(self.adaptive_page_size.get_page_size(self.page_size))
+
+    def request_failed(self, response: Optional[requests.Response]):
+        if self.adaptive_page_size:
+            self.adaptive_page_size.page_failed(self._page_size)
+            # The failed page is retried with the smaller page size, unless pages are numbered
+            if not isinstance(self.pagination_strategy, PageIncrement):
+                self._set_page_size(self.adaptive_page_size.get_page_size(self.page_size))
+
+    def _set_page_size(self, page_size: int):
+        self._page_size = page_size
+        # e.g: OffsetIncrement, which stops at the first page smaller than its page size
+        if hasattr(self.pagination_strategy, "page_size"):
+            self.pagination_strategy.page_size = page_size
 
     def _get_request_options(self, option_type: RequestOptionType) -> Mapping[str, Any]:
         options = {}
@@ -157,5 +185,5 @@ class LimitPaginator(Paginator, JsonSchemaMixin):
                 options[self.page_token_option.field_name] = self._token
         if self.limit_option.inject_into == option_type:
             if option_type != RequestOptionType.path:
-                options[self.limit_option.field_name] = self.page_size
+                options[self.limit_option.field_name] = self._page_size
         return options
@@ -37,6 +37,14 @@ class Paginator(RequestOptionsProvider, JsonSchemaMixin):
         """
         pass
 
+    def request_failed(self, response: Optional[requests.Response]):
+        """
+        Called when the request of a page timed out or failed with a server error, before it is retried. Does nothing by default.
+        The retry is built again from the request options of the paginator, which can e.g: request a smaller page.
+
+        :param response: the response of the request, None if it timed out
+        """
+
     @abstractmethod
     def path(self) -> Optional[str]:
         """
@@ -2,11 +2,13 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
@@ -18,6 +20,7 @@ from airbyte_cdk.sources.declarative.stream_slicers.single_slice import SingleSl
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.exceptions import BaseBackoffException
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
@@ -59,6 +62,27 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         HttpStream.__init__(self, self.requester.get_authenticator())
         self._last_response = None
         self._last_records = None
+        # Arguments of the request of the page being read, to build it again when it is retried after a failure
+        self._page_request_arguments: Optional[Tuple[StreamState, Optional[StreamSlice], Optional[Mapping[str, Any]]]] = None
+        self._page_request_failed = False
+        # Set by DeclarativeStream to transform each page of selected records as a whole
+        self.page_transformer: Optional[Callable[[List[Record], Optional[StreamSlice]], List[Record]]] = None
+        # Set by DeclarativeStream to hold the cursor updates of a slice read ahead until the slice is committed
+        self.cursor_updates: Optional[List[Tuple[StreamSlice, Optional[Record]]]] = None
+
+    def copy(self) -> "SimpleRetriever":
+        """
+        Returns a retriever sharing the requester, session, record selector and stream slicer of this one, with its own paginator so that
+        both can read different slices at the same time.
+        """
+        retriever = copy.copy(self)
+        retriever.paginator = copy.deepcopy(self.paginator)
+        retriever._last_response = None
+        retriever._last_records = None
+        retriever._page_request_arguments = None
+        retriever._page_request_failed = False
+        retriever.cursor_updates = None
+        return retriever
 
     @property
     def name(self) -> str:
@@ -113,6 +137,30 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         assert should_retry.action == ResponseAction.RETRY
         return should_retry.retry_in
 
+    def _create_page_request(
+        self, stream_state: StreamState, stream_slice: Optional[StreamSlice], next_page_token: Optional[Mapping[str, Any]]
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
+        self._page_request_arguments = (stream_state, stream_slice, next_page_token)
+        self._page_request_failed = False
+        return HttpStream._create_page_request(self, stream_state, stream_slice, next_page_token)
+
+    def _send(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        # The paginator can request smaller pages once the request of a page timed out or failed with a server error: the retries of the
+        # page are built again, with the request options of the paginator at the time of the retry
+        if self._page_request_failed and self._page_request_arguments is not None:
+            request, _ = HttpStream._create_page_request(self, *self._page_request_arguments)
+        try:
+            return HttpStream._send(self, request, request_kwargs)
+        except requests.exceptions.ReadTimeout:
+            self._page_request_failed = True
+            self.paginator.request_failed(None)
+            raise
+        except BaseBackoffException as e:
+            if e.response.status_code >= 500:
+                self._page_request_failed = True
+                self.paginator.request_failed(e.response)
+            raise
+
     def _get_request_options(
         self,
         stream_slice: Optional[StreamSlice],
@@ -288,6 +336,14 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         """
         return self.requester.use_cache
 
+    @property
+    def stream_response(self) -> bool:
+        """
+        If True, the body of responses is read as their records are extracted, see StreamingJsonDecoder
+        """
+        decoder = getattr(getattr(self.record_selector, "extractor", None), "decoder", None)
+        return isinstance(decoder, StreamingJsonDecoder)
+
     def parse_response(
         self,
         response: requests.Response,
@@ -311,6 +367,8 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         records = self.record_selector.select_records(
             response=response, stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
         )
+        if self.page_transformer:
+            records = self.page_transformer(records, stream_slice)
         self._last_records = records
         return records
 
@@ -346,13 +404,27 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         self.paginator.reset()
         records_generator = HttpStream.read_records(self, sync_mode, cursor_field, stream_slice, self.state)
         for r in records_generator:
-            self.stream_slicer.update_cursor(stream_slice, last_record=r)
+            self._update_cursor(stream_slice, last_record=r)
             yield r
         else:
             last_record = self._last_records[-1] if self._last_records else None
-            self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+            self._update_cursor(stream_slice, last_record=last_record)
             yield from []
 
+    def _update_cursor(self, stream_slice: StreamSlice, last_record: Optional[Record] = None):
+        if self.cursor_updates is None:
+            self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+        else:
+            self.cursor_updates.append((stream_slice, last_record))
+
+    def apply_cursor_updates(self, cursor_updates: Iterable[Tuple[StreamSlice, Optional[Record]]]):
+        """
+        Updates the cursor of the stream slicer as the cursor updates held by a copy of this retriever would have
+        :param cursor_updates: the cursor_updates of the copy, in the order they were made
+        """
+        for stream_slice, last_record in cursor_updates:
+            self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Optional[StreamState] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -2,12 +2,14 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-import itertools
+import threading
 from collections import ChainMap
 from dataclasses import InitVar, dataclass
-from typing import Any, Iterable, List, Mapping, Optional
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.stream_slicers.list_stream_slicer import ListStreamSlicer
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import StreamSlice, StreamState
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -30,16 +32,33 @@ class CartesianProductStreamSlicer(StreamSlicer, JsonSchemaMixin):
         {"i": 2, "s": "world"},
     ]
 
+    The product is generated lazily: the slices of the first stream slicer are iterated once. The slices of the following ones are
+    needed again for each slice of the stream slicers before them. ListStreamSlicers, whose slices are constant, generate them again so
+    that they aren't held in memory. The slices of other stream slicers are generated once and kept in memory, so that e.g: a
+    SubstreamSlicer reads its parent stream from the API once, and a DatetimeStreamSlicer ending now evaluates now once.
+
+    The product easily reaches thousands of slices. Setting max_concurrent_slices reads that many of them at the same time, unless the
+    stream sets a max_concurrent_slices of its own. The cursor updates of a slice are applied to all the underlying stream slicers at
+    once, so the slices read ahead never see a stream state holding the update of a slice for some of them only.
+
     Attributes:
         stream_slicers (List[StreamSlicer]): Underlying stream slicers. The RequestOptions (e.g: Request headers, parameters, etc..) returned by this slicer are the combination of the RequestOptions of its input slicers. If there are conflicts e.g: two slicers define the same header or request param, the conflict is resolved by taking the value from the first slicer, where ordering is determined by the order in which slicers were input to this composite slicer.
+        max_concurrent_slices (Optional[int]): How many slices of the product are read at the same time. Requires a SimpleRetriever.
     """
 
     stream_slicers: List[StreamSlicer]
     options: InitVar[Mapping[str, Any]]
+    max_concurrent_slices: Optional[int] = None
+
+    def __post_init__(self, options: Mapping[str, Any]):
+        if self.max_concurrent_slices is not None and self.max_concurrent_slices < 1:
+            raise ValueError(f"max_concurrent_slices must be positive, got {self.max_concurrent_slices}")
+        self._lock = threading.Lock()
 
     def update_cursor(self, stream_slice: Mapping[str, Any], last_record: Optional[Mapping[str, Any]] = None):
-        for slicer in self.stream_slicers:
-            slicer.update_cursor(stream_slice, last_record)
+        with self._lock:
+            for slicer in self.stream_slicers:
+                slicer.update_cursor(stream_slice, last_record)
 
     def get_request_params(
         self,
@@ -106,8 +125,55 @@ class CartesianProductStreamSlicer(StreamSlicer, JsonSchemaMixin):
         )
 
     def get_stream_state(self) -> Mapping[str, Any]:
-        return dict(ChainMap(*[slicer.get_stream_state() for slicer in self.stream_slicers]))
+        with self._lock:
+            return dict(ChainMap(*[slicer.get_stream_state() for slicer in self.stream_slicers]))
 
     def stream_slices(self, sync_mode: SyncMode, stream_state: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
-        sub_slices = (s.stream_slices(sync_mode, stream_state) for s in self.stream_slicers)
-        return (ChainMap(*a) for a in itertools.product(*sub_slices))
+        slice_generators = []
+        for index, slicer in enumerate(self.stream_slicers):
+            generate_slices = partial(slicer.stream_slices, sync_mode, stream_state)
+            # The slices of the first stream slicer are only iterated once
+            if index == 0 or isinstance(slicer, ListStreamSlicer):
+                slice_generators.append(generate_slices)
+            else:
+                slice_generators.append(_buffered(generate_slices))
+        return (ChainMap(*a) for a in self._product(slice_generators))
+
+    def _product(self, slice_generators: Sequence[Callable[[], Iterable[StreamSlice]]]) -> Iterable[Tuple[StreamSlice, ...]]:
+        # Unlike itertools.product, which reads all its input iterables first
+        if not slice_generators:
+            yield ()
+            return
+        for stream_slice in slice_generators[0]():
+            for other_slices in self._product(slice_generators[1:]):
+                yield (stream_slice, *other_slices)
+
+
+def _buffered(generate_slices: Callable[[], Iterable[StreamSlice]]) -> Callable[[], Iterable[StreamSlice]]:
+    """
+    :param generate_slices: function generating the slices, called once
+    :return: a function iterating over the slices, which are generated as they are first iterated over and then kept for the next
+    iterations
+    """
+    iterator: Optional[Iterator[StreamSlice]] = None
+    buffer: List[StreamSlice] = []
+    exhausted = False
+
+    def iterate() -> Iterable[StreamSlice]:
+        nonlocal iterator, exhausted
+        index = 0
+        while True:
+            if index == len(buffer):
+                if exhausted:
+                    return
+                if iterator is None:
+                    iterator = iter(generate_slices())
+                try:
+                    buffer.append(next(iterator))
+                except StopIteration:
+                    exhausted = True
+                    return
+            yield buffer[index]
+            index += 1
+
+    return iterate
@@ -5,7 +5,7 @@
 import datetime
 import re
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
@@ -39,6 +39,12 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
     all the format codes required by the 1989 C standard.
     Full list of accepted format codes: https://man7.org/linux/man-pages/man3/strftime.3.html
 
+    When target_records_per_slice is set, the step adapts to the density of the records: once a slice is read, the step of the next
+    slice is scaled by the ratio of target_records_per_slice to the number of records of the slice, rounded to whole days and bounded by
+    min_step and max_step. The step grows at most 4 times from one slice to the next, so that a sparse period followed by a dense one
+    doesn't make a huge slice. Slices are generated as the previous ones are read, slices generated before the previous one is read keep
+    its step.
+
     Attributes:
         start_datetime (Union[MinMaxDatetime, str]): the datetime that determines the earliest record that should be synced
         end_datetime (Union[MinMaxDatetime, str]): the datetime that determines the last record that should be synced
@@ -51,6 +57,9 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
         stream_state_field_start (Optional[str]): stream slice start time field
         stream_state_field_end (Optional[str]): stream slice end time field
         lookback_window (Optional[InterpolatedString]): how many days before start_datetime to read data for
+        target_records_per_slice (Optional[int]): number of records per slice the step adapts to, the step is fixed if not set
+        min_step (Optional[str]): smallest size of the timewindow when the step adapts, 1 day by default
+        max_step (Optional[str]): largest size of the timewindow when the step adapts, unbounded by default
     """
 
     start_datetime: Union[MinMaxDatetime, str]
@@ -67,6 +76,9 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
     stream_state_field_start: Optional[str] = None
     stream_state_field_end: Optional[str] = None
     lookback_window: Optional[Union[InterpolatedString, str]] = None
+    target_records_per_slice: Optional[int] = None
+    min_step: Optional[str] = None
+    max_step: Optional[str] = None
 
     timedelta_regex = re.compile(r"((?P<weeks>[\.\d]+?)w)?" r"((?P<days>[\.\d]+?)d)?$")
 
@@ -80,6 +92,12 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
         self._interpolation = JinjaInterpolation()
 
         self._step = self._parse_timedelta(self.step)
+        self._min_step = self._parse_timedelta(self.min_step or "1d")
+        self._max_step = self._parse_timedelta(self.max_step) if self.max_step else datetime.timedelta.max
+        if self.target_records_per_slice is not None and self.target_records_per_slice <= 0:
+            raise ValueError(f"target_records_per_slice must be positive, got {self.target_records_per_slice}")
+        # Number of records, and last record counted, of the slices generated with an adaptive step, None until they are read
+        self._slice_records: Dict[Tuple[str, str], Optional[Tuple[int, Optional[Record]]]] = {}
         self.cursor_field = InterpolatedString.create(self.cursor_field, options=options)
         self.stream_slice_field_start = InterpolatedString.create(self.stream_state_field_start or "start_time", options=options)
         self.stream_slice_field_end = InterpolatedString.create(self.stream_state_field_end or "end_time", options=options)
@@ -124,6 +142,20 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
             self._cursor = cursor
         if self.stream_slice_field_end:
             self._cursor_end = stream_slice_value_end
+        if self.target_records_per_slice:
+            self._count_record(stream_slice, last_record)
+
+    def _count_record(self, stream_slice: StreamSlice, last_record: Optional[Record]):
+        start_field = self.stream_slice_field_start.eval(self.config)
+        end_field = self.stream_slice_field_end.eval(self.config)
+        slice_key = (stream_slice.get(start_field), stream_slice.get(end_field))
+        if slice_key not in self._slice_records:
+            return
+        record_count, last_counted_record = self._slice_records[slice_key] or (0, None)
+        # The retriever updates the cursor with each record, then once more with the last one at the end of the slice
+        if last_record is not None and last_record is not last_counted_record:
+            record_count, last_counted_record = record_count + 1, last_record
+        self._slice_records[slice_key] = (record_count, last_counted_record)
 
     def stream_slices(self, sync_mode: SyncMode, stream_state: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
         """
@@ -159,6 +191,8 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
             # If the input_state's date is greater than start_datetime, the start of the time window is the state's next day
             next_date = state_date + datetime.timedelta(days=1)
             start_datetime = max(start_datetime, next_date)
+        if self.target_records_per_slice:
+            return self._partition_daterange_adaptively(start_datetime, end_datetime)
         dates = self._partition_daterange(start_datetime, end_datetime, self._step)
         return dates
 
@@ -175,6 +209,26 @@ class DatetimeStreamSlicer(StreamSlicer, JsonSchemaMixin):
             start += step
         return dates
 
+    def _partition_daterange_adaptively(self, start: datetime.datetime, end: datetime.datetime) -> Iterable[StreamSlice]:
+        start_field = self.stream_slice_field_start.eval(self.config)
+        end_field = self.stream_slice_field_end.eval(self.config)
+        step = self._step
+        while start <= end:
+            end_date = self._get_date(start + step - datetime.timedelta(days=1), end, min)
+            stream_slice = {start_field: self._format_datetime(start), end_field: self._format_datetime(end_date)}
+            slice_key = (stream_slice[start_field], stream_slice[end_field])
+            self._slice_records[slice_key] = None
+            yield stream_slice
+            start += step
+            slice_records = self._slice_records.pop(slice_key, None)
+            if slice_records is not None:
+                step = self._next_step(step, slice_records[0])
+
+    def _next_step(self, step: datetime.timedelta, record_count: int) -> datetime.timedelta:
+        scale = min(self.target_records_per_slice / record_count, 4) if record_count else 4
+        days = max(round(step.total_seconds() * scale / datetime.timedelta(days=1).total_seconds()), 1)
+        return min(max(datetime.timedelta(days=days), self._min_step), self._max_step)
+
     def _get_date(self, cursor_value, default_date: datetime.datetime, comparator) -> datetime.datetime:
         cursor_date = cursor_value or default_date
         return comparator(cursor_date, default_date)
@@ -0,0 +1,191 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from airbyte_cdk.sources.declarative.types import Record, StreamSlice
+from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.utils.message_serializer import dumps, loads
+
+
+class _CachedSlice:
+    """Records of a parent slice, the first ones in memory and the others in the sqlite file of the cache"""
+
+    def __init__(self, slice_id: int):
+        self.slice_id = slice_id
+        self.records: List[Record] = []
+        self.spilled_records = 0
+        self.complete = False
+        self.reads = 0
+        self.replays = 0
+        self.discarded = False
+
+
+class ParentRecordCache:
+    """
+    Keeps the records read from the parent streams of SubstreamSlicers, so that child streams sharing a parent read it once per sync.
+
+    Slicers register their parent streams, equal parent streams (e.g: defined by the same reference in the YAML) are the same parent.
+    The records of a slice of a parent registered more than once are kept by the first slicer reading them and replayed to the others,
+    then dropped once every slicer read them. Up to max_records_in_memory records are kept in memory, the others are written to a
+    temporary sqlite file.
+    Slicers reading a slice while another one is still reading it read it from the parent stream.
+    """
+
+    # Number of records read from the sqlite file at a time when replaying a slice
+    REPLAY_BATCH_SIZE = 1000
+
+    def __init__(self, max_records_in_memory: int = 10000):
+        """
+        :param max_records_in_memory: maximum number of records kept in memory for all parents, the others are kept on disk
+        """
+        self.max_records_in_memory = max_records_in_memory
+        self._parents: List[Stream] = []
+        self._readers: List[int] = []
+        self._slices: Dict[Tuple[int, str], _CachedSlice] = {}
+        self._slice_ids = 0
+        self._records_in_memory = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def register(self, parent_stream: Stream) -> int:
+        """
+        Called by slicers for each of their parent streams, before reading any record.
+        :return the key identifying the parent in read_records
+        """
+        with self._lock:
+            for parent_key, parent in enumerate(self._parents):
+                if parent is parent_stream or parent == parent_stream:
+                    self._readers[parent_key] += 1
+                    return parent_key
+            self._parents.append(parent_stream)
+            self._readers.append(1)
+            return len(self._parents) - 1
+
+    def read_records(self, parent_key: int, parent_slice: StreamSlice, read_records: Callable[[], Iterable[Record]]) -> Iterable[Record]:
+        """
+        :param parent_key: the key returned by register for the parent stream
+        :param parent_slice: the slice of the parent stream to read
+        :param read_records: reads the records of the slice from the parent stream, called unless they are cached
+        :return: the records of the parent slice
+        """
+        if self._readers[parent_key] < 2:
+            yield from read_records()
+            return
+
+        slice_key = (parent_key, json.dumps(parent_slice, sort_keys=True, default=str))
+        with self._lock:
+            cached_slice = self._slices.get(slice_key)
+            if cached_slice is None:
+                self._slice_ids += 1
+                cached_slice = self._slices[slice_key] = _CachedSlice(self._slice_ids)
+                reader = self._fill(slice_key, cached_slice, read_records)
+            elif cached_slice.complete:
+                cached_slice.replays += 1
+                reader = self._replay(slice_key, cached_slice)
+            else:
+                reader = self._read_through(slice_key, cached_slice, read_records)
+        yield from reader
+
+    def _fill(self, slice_key: Tuple[int, str], cached_slice: _CachedSlice, read_records: Callable[[], Iterable[Record]]):
+        complete = False
+        try:
+            for record in read_records():
+                self._store(cached_slice, record)
+                yield record
+            complete = True
+        finally:
+            with self._lock:
+                if complete:
+                    cached_slice.complete = True
+                    self._read_done(slice_key, cached_slice)
+                else:
+                    # records of partially read slices are not replayed
+                    self._discard(slice_key, cached_slice)
+
+    def _replay(self, slice_key: Tuple[int, str], cached_slice: _CachedSlice):
+        try:
+            yield from cached_slice.records
+            position = 0
+            while position < cached_slice.spilled_records:
+                with self._lock:
+                    rows = self._connection.execute(
+                        "SELECT data FROM records WHERE slice_id = ? AND position >= ? ORDER BY position LIMIT ?",
+                        (cached_slice.slice_id, position, self.REPLAY_BATCH_SIZE),
+                    ).fetchall()
+                position += len(rows)
+                for (data,) in rows:
+                    yield loads(data)
+        finally:
+            with self._lock:
+                cached_slice.replays -= 1
+                self._read_done(slice_key, cached_slice)
+
+    def _read_through(self, slice_key: Tuple[int, str], cached_slice: _CachedSlice, read_records: Callable[[], Iterable[Record]]):
+        try:
+            yield from read_records()
+        finally:
+            with self._lock:
+                self._read_done(slice_key, cached_slice)
+
+    def _store(self, cached_slice: _CachedSlice, record: Record):
+        with self._lock:
+            if self._records_in_memory < self.max_records_in_memory and not cached_slice.spilled_records:
+                cached_slice.records.append(record)
+                self._records_in_memory += 1
+            else:
+                self._connect().execute(
+                    "INSERT INTO records VALUES (?, ?, ?)", (cached_slice.slice_id, cached_slice.spilled_records, dumps(record))
+                )
+                cached_slice.spilled_records += 1
+
+    def _read_done(self, slice_key: Tuple[int, str], cached_slice: _CachedSlice):
+        cached_slice.reads += 1
+        if cached_slice.reads >= self._readers[slice_key[0]]:
+            self._discard(slice_key, cached_slice)
+        elif cached_slice.discarded and not cached_slice.replays:
+            self._free(cached_slice)
+
+    def _discard(self, slice_key: Tuple[int, str], cached_slice: _CachedSlice):
+        if self._slices.get(slice_key) is cached_slice:
+            del self._slices[slice_key]
+        cached_slice.discarded = True
+        # slicers still replaying the slice free it once they are done
+        if not cached_slice.replays:
+            self._free(cached_slice)
+
+    def _free(self, cached_slice: _CachedSlice):
+        self._records_in_memory -= len(cached_slice.records)
+        cached_slice.records = []
+        if cached_slice.spilled_records:
+            self._connection.execute("DELETE FROM records WHERE slice_id = ?", (cached_slice.slice_id,))
+            cached_slice.spilled_records = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            file_descriptor, filename = tempfile.mkstemp(prefix="parent_records_", suffix=".sqlite")
+            os.close(file_descriptor)
+            connection = sqlite3.connect(filename, isolation_level=None, check_same_thread=False)
+            # the file is thrown away after the sync, durability doesn't matter
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute("CREATE TABLE records (slice_id INTEGER NOT NULL, position INTEGER NOT NULL, data TEXT NOT NULL)")
+            connection.execute("CREATE INDEX records_slice ON records (slice_id, position)")
+            weakref.finalize(self, _remove_file, connection, filename)
+            self._connection = connection
+        return self._connection
+
+
+def _remove_file(connection: sqlite3.Connection, filename: str):
+    connection.close()
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
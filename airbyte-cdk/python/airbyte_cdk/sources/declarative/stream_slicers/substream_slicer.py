@@ -7,6 +7,7 @@ from typing import Any, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+from airbyte_cdk.sources.declarative.stream_slicers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.core import Stream
@@ -49,6 +50,16 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
             raise ValueError("SubstreamSlicer needs at least 1 parent stream")
         self._cursor = None
         self._options = options
+        self._parent_record_cache: Optional[ParentRecordCache] = None
+        self._parent_keys: List[int] = []
+
+    def share_parent_records(self, parent_record_cache: ParentRecordCache):
+        """
+        Reads the parent streams through the cache, so that slicers of other streams sharing a parent stream reuse its records instead
+        of reading it again.
+        """
+        self._parent_record_cache = parent_record_cache
+        self._parent_keys = [parent_record_cache.register(parent_config.stream) for parent_config in self.parent_stream_configs]
 
     def update_cursor(self, stream_slice: StreamSlice, last_record: Optional[Record] = None):
         cursor = {}
@@ -64,7 +75,7 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_option(RequestOptionType.request_parameter)
+        return self._get_request_option(RequestOptionType.request_parameter, stream_slice)
 
     def get_request_headers(
         self,
@@ -72,7 +83,7 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_option(RequestOptionType.header)
+        return self._get_request_option(RequestOptionType.header, stream_slice)
 
     def get_request_body_data(
         self,
@@ -80,7 +91,7 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_option(RequestOptionType.body_data)
+        return self._get_request_option(RequestOptionType.body_data, stream_slice)
 
     def get_request_body_json(
         self,
@@ -88,14 +99,16 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Optional[Mapping]:
-        return self._get_request_option(RequestOptionType.body_json)
+        return self._get_request_option(RequestOptionType.body_json, stream_slice)
 
-    def _get_request_option(self, option_type: RequestOptionType):
+    def _get_request_option(self, option_type: RequestOptionType, stream_slice: Optional[StreamSlice] = None):
         params = {}
+        # the slice being read, rather than the cursor, which is updated by the slices read at the same time
+        values = stream_slice or self._cursor
         for parent_config in self.parent_stream_configs:
             if parent_config.request_option and parent_config.request_option.inject_into == option_type:
                 key = parent_config.stream_slice_field
-                value = self._cursor.get(key)
+                value = values.get(key)
                 if value:
                     params.update({key: value})
         return params
@@ -121,7 +134,7 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
         if not self.parent_stream_configs:
             yield from []
         else:
-            for parent_stream_config in self.parent_stream_configs:
+            for index, parent_stream_config in enumerate(self.parent_stream_configs):
                 parent_stream = parent_stream_config.stream
                 parent_field = parent_stream_config.parent_key
                 stream_state_field = parent_stream_config.stream_slice_field
@@ -129,9 +142,7 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
                     empty_parent_slice = True
                     parent_slice = parent_stream_slice
 
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
+                    for parent_record in self._read_parent_records(index, parent_stream_slice):
                         empty_parent_slice = False
                         stream_state_value = parent_record.get(parent_field)
                         yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
@@ -139,3 +150,15 @@ class SubstreamSlicer(StreamSlicer, JsonSchemaMixin):
                     if empty_parent_slice:
                         stream_state_value = parent_stream_slice.get(parent_field)
                         yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
+
+    def _read_parent_records(self, index: int, parent_stream_slice: StreamSlice) -> Iterable[Record]:
+        parent_stream = self.parent_stream_configs[index].stream
+
+        def read_records():
+            return parent_stream.read_records(
+                sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+            )
+
+        if self._parent_record_cache is None:
+            return read_records()
+        return self._parent_record_cache.read_records(self._parent_keys[index], parent_stream_slice, read_records)
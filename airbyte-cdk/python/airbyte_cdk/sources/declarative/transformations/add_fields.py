@@ -117,5 +117,54 @@ class AddFields(RecordTransformation, JsonSchemaMixin):
 
         return record
 
+    def transform_records(
+        self,
+        records: List[Record],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> List[Record]:
+        # the values are interpolated with the same context for all the records, only the record changes
+        fields = [
+            (
+                parsed_field.path,
+                parsed_field.value.record_evaluator(config, stream_state=stream_state, stream_slice=stream_slice),
+                _new_in_objects if _is_key_path(parsed_field.path) else dpath.util.new,
+            )
+            for parsed_field in self._parsed_fields
+        ]
+        for record in records:
+            for path, value, new in fields:
+                new(record, path, value(record))
+
+        return records
+
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
+
+
+def _is_key_path(path: FieldPointer) -> bool:
+    return isinstance(path, list) and all(isinstance(key, str) for key in path)
+
+
+def _new_in_objects(record: Record, path: FieldPointer, value: Any):
+    """
+    Same as dpath.util.new(record, path, value) for a path made of keys, walking it directly while it only goes through objects
+    """
+    if not isinstance(record, dict):
+        dpath.util.new(record, path, value)
+        return
+    current = record
+    for key in path[:-1]:
+        child = current.get(key)
+        if child is None:
+            if key in current:
+                # dpath fails on null values
+                dpath.util.new(record, path, value)
+                return
+            child = current[key] = {}
+        elif not isinstance(child, dict):
+            dpath.util.new(record, path, value)
+            return
+        current = child
+    current[path[-1]] = value
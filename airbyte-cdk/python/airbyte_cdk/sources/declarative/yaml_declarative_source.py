@@ -9,7 +9,7 @@ import pkgutil
 import typing
 from dataclasses import dataclass, fields
 from enum import Enum, EnumMeta
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterator, List, Mapping, Union
 
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
@@ -17,7 +17,10 @@ from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.exceptions import InvalidConnectorDefinitionException
 from airbyte_cdk.sources.declarative.parsers.factory import DeclarativeComponentFactory
+from airbyte_cdk.sources.declarative.parsers.manifest_cache import ManifestCache
 from airbyte_cdk.sources.declarative.parsers.yaml_parser import YamlParser
+from airbyte_cdk.sources.declarative.stream_slicers import CartesianProductStreamSlicer, StreamSlicer, SubstreamSlicer
+from airbyte_cdk.sources.declarative.stream_slicers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.streams.core import Stream
 from dataclasses_jsonschema import JsonSchemaMixin
 from jsonschema.validators import validate
@@ -31,7 +34,12 @@ class ConcreteDeclarativeSource(JsonSchemaMixin):
 
 
 class YamlDeclarativeSource(DeclarativeSource):
-    """Declarative source defined by a yaml file"""
+    """
+    Declarative source defined by a yaml file
+
+    When the AIRBYTE_MANIFEST_CACHE_DIR environment variable is set, the yaml file is parsed and validated once per version of the CDK and
+    of the connector, then read from a ManifestCache by the next instances.
+    """
 
     VALID_TOP_LEVEL_FIELDS = {"definitions", "streams", "check", "version"}
 
@@ -42,7 +50,14 @@ class YamlDeclarativeSource(DeclarativeSource):
         self.logger = logging.getLogger(f"airbyte.{self.name}")
         self._factory = DeclarativeComponentFactory()
         self._path_to_yaml = path_to_yaml
-        self._source_config = self._read_and_parse_yaml_file(path_to_yaml)
+        manifest_cache = ManifestCache.from_environment(connector_package=self.__class__.__module__.split(".")[0])
+        manifest = self._read_yaml_file(path_to_yaml)
+        cached_source_config = manifest_cache.get(manifest) if manifest_cache else None
+        if cached_source_config is not None:
+            # The manifest was validated before being cached
+            self._source_config = cached_source_config
+            return
+        self._source_config = YamlParser().parse(manifest)
 
         self._validate_source()
 
@@ -50,6 +65,8 @@ class YamlDeclarativeSource(DeclarativeSource):
         unknown_fields = [key for key in self._source_config.keys() if key not in self.VALID_TOP_LEVEL_FIELDS]
         if unknown_fields:
             raise InvalidConnectorDefinitionException(f"Found unknown top-level fields: {unknown_fields}")
+        if manifest_cache:
+            manifest_cache.set(manifest, self._source_config)
 
     @property
     def connection_checker(self) -> ConnectionChecker:
@@ -63,14 +80,19 @@ class YamlDeclarativeSource(DeclarativeSource):
             "parsed YAML into declarative source",
             extra={"path_to_yaml_file": self._path_to_yaml, "source_name": self.name, "parsed_config": json.dumps(self._source_config)},
         )
-        return [self._factory.create_component(stream_config, config, True)() for stream_config in self._stream_configs()]
-
-    def _read_and_parse_yaml_file(self, path_to_yaml_file):
+        streams = [self._factory.create_component(stream_config, config, True)() for stream_config in self._stream_configs()]
+        # Streams sharing a parent stream read it once
+        parent_record_cache = ParentRecordCache()
+        for stream in streams:
+            for substream_slicer in _substream_slicers(stream):
+                substream_slicer.share_parent_records(parent_record_cache)
+        return streams
+
+    def _read_yaml_file(self, path_to_yaml_file) -> str:
         package = self.__class__.__module__.split(".")[0]
 
         yaml_config = pkgutil.get_data(package, path_to_yaml_file)
-        decoded_yaml = yaml_config.decode()
-        return YamlParser().parse(decoded_yaml)
+        return yaml_config.decode()
 
     def _validate_source(self):
         full_config = {}
@@ -151,6 +173,19 @@ class YamlDeclarativeSource(DeclarativeSource):
         return []
 
 
+def _substream_slicers(stream: Stream) -> Iterator[SubstreamSlicer]:
+    """Finds the SubstreamSlicers of the stream, including those of its parent streams"""
+    stream_slicers: List[StreamSlicer] = [getattr(getattr(stream, "retriever", None), "stream_slicer", None)]
+    while stream_slicers:
+        stream_slicer = stream_slicers.pop()
+        if isinstance(stream_slicer, CartesianProductStreamSlicer):
+            stream_slicers.extend(stream_slicer.stream_slicers)
+        elif isinstance(stream_slicer, SubstreamSlicer):
+            yield stream_slicer
+            for parent_stream_config in stream_slicer.parent_stream_configs:
+                stream_slicers.append(getattr(getattr(parent_stream_config.stream, "retriever", None), "stream_slicer", None))
+
+
 class SchemaEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, property) or isinstance(obj, Enum):
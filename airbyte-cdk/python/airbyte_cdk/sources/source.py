@@ -7,10 +7,10 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any, Dict, Generic, Iterable, Mapping, MutableMapping, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Mapping, MutableMapping, TypeVar
 
 from airbyte_cdk.connector import BaseConnector, DefaultConnectorMixin, TConfig
-from airbyte_cdk.models import AirbyteCatalog, AirbyteMessage, ConfiguredAirbyteCatalog
+from airbyte_cdk.models import AirbyteCatalog, AirbyteMessage, AirbyteStateMessage, AirbyteStateType, ConfiguredAirbyteCatalog
 
 TState = TypeVar("TState")
 TCatalog = TypeVar("TCatalog")
@@ -46,9 +46,25 @@ class Source(DefaultConnectorMixin, BaseSource[Mapping[str, Any], MutableMapping
             state_obj = json.loads(open(state_path, "r").read())
         else:
             state_obj = {}
+        if isinstance(state_obj, list):
+            state_obj = self._read_state_messages(state_obj)
         state = defaultdict(dict, state_obj)
         return state
 
+    @staticmethod
+    def _read_state_messages(state_messages: List[Mapping[str, Any]]) -> Dict[str, Any]:
+        """
+        Merges the state messages of a per-stream state, see AbstractSource.per_stream_state_enabled, into a state by stream name
+        """
+        state = {}
+        for state_message in map(AirbyteStateMessage.parse_obj, state_messages):
+            if state_message.type == AirbyteStateType.STREAM and state_message.stream:
+                stream_state = state_message.stream.stream_state
+                state[state_message.stream.stream_descriptor.name] = stream_state.dict() if stream_state else {}
+            elif state_message.data:
+                state.update(state_message.data)
+        return state
+
     # can be overridden to change an input catalog
     def read_catalog(self, catalog_path: str) -> ConfiguredAirbyteCatalog:
         return ConfiguredAirbyteCatalog.parse_obj(self.read_config(catalog_path))
@@ -3,6 +3,7 @@
 #
 
 # Initialize Streams Package
+from .checkpoint_policy import CheckpointPolicy
 from .core import IncrementalMixin, Stream
 
-__all__ = ["IncrementalMixin", "Stream"]
+__all__ = ["CheckpointPolicy", "IncrementalMixin", "Stream"]
@@ -0,0 +1,18 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from .download import iter_csv_records, iter_jsonl_records
+from .job import AsyncJob, AsyncJobError, AsyncJobStatus
+from .job_manager import AsyncJobManager
+from .stream import AsyncJobStream
+
+__all__ = [
+    "AsyncJob",
+    "AsyncJobError",
+    "AsyncJobManager",
+    "AsyncJobStatus",
+    "AsyncJobStream",
+    "iter_csv_records",
+    "iter_jsonl_records",
+]
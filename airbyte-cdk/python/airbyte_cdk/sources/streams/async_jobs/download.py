@@ -0,0 +1,35 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import csv
+import io
+from typing import Any, Dict, Iterator
+
+import requests
+from airbyte_cdk.utils.message_serializer import loads
+
+
+def iter_csv_records(response: requests.Response, **reader_kwargs: Any) -> Iterator[Dict[str, str]]:
+    """
+    Reads the rows of a CSV response as they are downloaded, as dicts keyed by the header row. The request must be sent with stream=True
+    for the body not to be downloaded at once. Compressed bodies, e.g: gzip, are decompressed.
+
+    :param response: the response to read
+    :param reader_kwargs: arguments of csv.DictReader, e.g: delimiter
+    """
+    response.raw.decode_content = True
+    text = io.TextIOWrapper(response.raw, encoding=response.encoding or "utf-8", newline="")
+    yield from csv.DictReader(text, **reader_kwargs)
+
+
+def iter_jsonl_records(response: requests.Response) -> Iterator[Any]:
+    """
+    Reads the records of a JSON lines response, one JSON document per line, as they are downloaded. The request must be sent with
+    stream=True for the body not to be downloaded at once.
+
+    :param response: the response to read
+    """
+    for line in response.iter_lines():
+        if line.strip():
+            yield loads(line)
@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Iterable, List, Mapping, Optional
+
+
+class AsyncJobStatus(Enum):
+    NOT_STARTED = "not_started"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class AsyncJobError(Exception):
+    """Raised when a job failed more than the maximum number of attempts of its AsyncJobManager"""
+
+    def __init__(self, job: "AsyncJob", message: str):
+        super().__init__(message)
+        self.job = job
+
+
+class AsyncJob(ABC):
+    """
+    A job run remotely by an API, e.g: a report, whose records are downloaded once it completes.
+
+    Jobs are started, polled, restarted and split by an AsyncJobManager, which keeps their status and attempt number up to date.
+    """
+
+    def __init__(self):
+        self.status = AsyncJobStatus.NOT_STARTED
+        self.attempt_number = 0
+        # time.monotonic() of the last start of the job, set by the AsyncJobManager
+        self.started_at: Optional[float] = None
+
+    @abstractmethod
+    def start(self):
+        """
+        Starts the job remotely, e.g: requests the creation of a report. Called again to restart the job once it failed.
+        """
+
+    @abstractmethod
+    def poll_status(self) -> AsyncJobStatus:
+        """
+        :return: the current status of the remote job, RUNNING, COMPLETED or FAILED
+        """
+
+    @classmethod
+    def poll_statuses(cls, jobs: List["AsyncJob"]) -> List[AsyncJobStatus]:
+        """
+        Polls the status of several jobs of this class at once. Override it for APIs returning the status of many jobs in a single request,
+        polling each job on its own by default.
+
+        :param jobs: running jobs, at most poll_batch_size of the AsyncJobManager
+        :return: the status of each job, in the same order
+        """
+        return [job.poll_status() for job in jobs]
+
+    @abstractmethod
+    def get_records(self) -> Iterable[Mapping[str, Any]]:
+        """
+        Downloads the records of the completed job. They should be read as they are downloaded rather than once the whole result is,
+        see iter_csv_records and iter_jsonl_records.
+        """
+
+    def split(self) -> List["AsyncJob"]:
+        """
+        Splits a job which keeps failing, e.g: because its result is too large, into smaller jobs whose results add up to its own.
+        :return: the jobs replacing this one, an empty list if it can't be split, in which case it is restarted
+        """
+        return []
@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Type
+
+from airbyte_cdk.sources.streams.async_jobs.job import AsyncJob, AsyncJobError, AsyncJobStatus
+
+logger = logging.getLogger("airbyte")
+
+
+class AsyncJobManager:
+    """
+    Runs the jobs of a stream, up to max_running_jobs at the same time, and hands them over as they complete.
+
+    Jobs are started in order as running ones complete. Running jobs are polled together, in batches of poll_batch_size jobs of the same
+    class, see AsyncJob.poll_statuses. While no job completes, the interval between polls doubles from min_poll_interval up to
+    max_poll_interval, it is reset once one does.
+
+    A job which failed, or ran for longer than job_timeout seconds, is restarted. From its split_after_attempts attempt on, it is split
+    into smaller jobs instead, see AsyncJob.split, which are started before the jobs not started yet. A job which failed max_attempts
+    times raises an AsyncJobError.
+
+    Override can_start_job to throttle the start of jobs, e.g: on the rate limit headers of the API.
+
+    Jobs are handed over in the order they complete, or in the order of the jobs, see completed_jobs. In the order of the jobs, the
+    smaller jobs of a split take the place of the job they were split from.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[AsyncJob],
+        max_running_jobs: int = 10,
+        poll_batch_size: int = 50,
+        min_poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        max_attempts: int = 3,
+        split_after_attempts: Optional[int] = 2,
+        job_timeout: Optional[float] = None,
+    ):
+        """
+        :param jobs: the jobs to run, consumed lazily
+        :param max_running_jobs: maximum number of jobs running at the same time
+        :param poll_batch_size: maximum number of jobs polled at once
+        :param min_poll_interval: number of seconds between polls after a job completed
+        :param max_poll_interval: maximum number of seconds between polls
+        :param max_attempts: number of times a job is started before giving up on it
+        :param split_after_attempts: number of failed attempts after which a job is split, None to never split jobs
+        :param job_timeout: number of seconds after which a running job is considered failed, None to wait for jobs forever
+        """
+        if max_running_jobs < 1:
+            raise ValueError(f"max_running_jobs must be positive, got {max_running_jobs}")
+        if not 0 < min_poll_interval <= max_poll_interval:
+            raise ValueError(f"Invalid poll intervals: min_poll_interval={min_poll_interval}, max_poll_interval={max_poll_interval}")
+        self.max_running_jobs = max_running_jobs
+        self.poll_batch_size = poll_batch_size
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_attempts = max_attempts
+        self.split_after_attempts = split_after_attempts
+        self.job_timeout = job_timeout
+        self._jobs = iter(jobs)
+        # Jobs resulting from splits, or whose start was throttled, started before the ones left in self._jobs
+        self._pending_jobs: Deque[AsyncJob] = deque()
+        self._running_jobs: List[AsyncJob] = []
+        self._poll_interval = min_poll_interval
+        # Jobs not handed over yet, in the order of the jobs, when completed jobs are handed over in that order
+        self._jobs_in_order: Optional[Deque[AsyncJob]] = None
+
+    def can_start_job(self) -> bool:
+        """
+        Override to throttle the start of jobs, called before starting each one. Running jobs are polled, and then it is called again,
+        while it returns False.
+        """
+        return True
+
+    def completed_jobs(self, in_job_order: bool = False) -> Iterator[AsyncJob]:
+        """
+        Runs the jobs and yields them once completed, in the order they complete. More jobs are started each time the consumer gets back.
+
+        :param in_job_order: yield the jobs in their order instead, each one once every job before it completed. Jobs keep being started
+        while a job is still running, the jobs which completed after it are held until it completes.
+        """
+        self._jobs_in_order = deque() if in_job_order else None
+        self._start_jobs()
+        while self._running_jobs or self._pending_jobs:
+            completed_jobs = self._poll_jobs()
+            if completed_jobs:
+                self._poll_interval = self.min_poll_interval
+                yield from completed_jobs if self._jobs_in_order is None else self._completed_jobs_in_order()
+            else:
+                logger.info(f"No job completed out of {len(self._running_jobs)} running jobs, waiting {self._poll_interval} seconds")
+                time.sleep(self._poll_interval)
+                self._poll_interval = min(self._poll_interval * 2, self.max_poll_interval)
+            self._start_jobs()
+
+    def _completed_jobs_in_order(self) -> Iterator[AsyncJob]:
+        while self._jobs_in_order and self._jobs_in_order[0].status == AsyncJobStatus.COMPLETED:
+            yield self._jobs_in_order.popleft()
+
+    def _start_jobs(self):
+        while len(self._running_jobs) < self.max_running_jobs:
+            if self._pending_jobs:
+                job = self._pending_jobs.popleft()
+            else:
+                job = next(self._jobs, None)
+                if job is None:
+                    return
+                if self._jobs_in_order is not None:
+                    self._jobs_in_order.append(job)
+            if not self.can_start_job():
+                # started once throttling allows it, after the next poll
+                self._pending_jobs.appendleft(job)
+                return
+            self._start_job(job)
+            self._running_jobs.append(job)
+
+    @staticmethod
+    def _start_job(job: AsyncJob):
+        job.start()
+        job.attempt_number += 1
+        job.started_at = time.monotonic()
+        job.status = AsyncJobStatus.RUNNING
+
+    def _poll_jobs(self) -> List[AsyncJob]:
+        """
+        Updates the status of the running jobs, restarting or splitting the failed ones
+        :return: the jobs which completed
+        """
+        jobs_by_class: Dict[Type[AsyncJob], List[AsyncJob]] = {}
+        for job in self._running_jobs:
+            jobs_by_class.setdefault(type(job), []).append(job)
+        for job_class, jobs in jobs_by_class.items():
+            for start in range(0, len(jobs), self.poll_batch_size):
+                batch = jobs[start : start + self.poll_batch_size]
+                for job, status in zip(batch, job_class.poll_statuses(batch)):
+                    job.status = status
+
+        completed_jobs = []
+        running_jobs = []
+        for job in self._running_jobs:
+            if job.status == AsyncJobStatus.RUNNING and self._timed_out(job):
+                logger.info(f"{job} ran for more than {self.job_timeout} seconds")
+                job.status = AsyncJobStatus.FAILED
+            if job.status == AsyncJobStatus.COMPLETED:
+                completed_jobs.append(job)
+            elif job.status == AsyncJobStatus.FAILED:
+                if self._retry(job):
+                    running_jobs.append(job)
+            else:
+                running_jobs.append(job)
+        self._running_jobs = running_jobs
+        logger.info(f"Completed jobs: {len(completed_jobs)}, running jobs: {len(self._running_jobs)}")
+        return completed_jobs
+
+    def _timed_out(self, job: AsyncJob) -> bool:
+        if self.job_timeout is None or job.started_at is None:
+            return False
+        return time.monotonic() - job.started_at > self.job_timeout
+
+    def _retry(self, job: AsyncJob) -> bool:
+        """
+        Splits or restarts a failed job
+        :return: True if the job was restarted, False if it was split
+        """
+        if self.split_after_attempts is not None and job.attempt_number >= self.split_after_attempts:
+            smaller_jobs = job.split()
+            if smaller_jobs:
+                logger.info(f"{job} failed {job.attempt_number} times, split into {len(smaller_jobs)} jobs")
+                self._pending_jobs.extendleft(reversed(smaller_jobs))
+                if self._jobs_in_order is not None:
+                    index = self._jobs_in_order.index(job)
+                    del self._jobs_in_order[index]
+                    for smaller_job in reversed(smaller_jobs):
+                        self._jobs_in_order.insert(index, smaller_job)
+                return False
+        if job.attempt_number >= self.max_attempts:
+            raise AsyncJobError(job, f"{job} failed {job.attempt_number} times")
+        logger.info(f"{job} failed, restarting it")
+        self._start_job(job)
+        return True
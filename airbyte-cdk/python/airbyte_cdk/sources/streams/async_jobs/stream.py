@@ -0,0 +1,56 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, Mapping, Optional
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.async_jobs.job import AsyncJob
+from airbyte_cdk.sources.streams.async_jobs.job_manager import AsyncJobManager
+from airbyte_cdk.sources.streams.core import Stream
+
+
+class AsyncJobStream(Stream, ABC):
+    """
+    Base stream of report-style APIs, whose records are the results of jobs run remotely, e.g: a report per day.
+
+    Jobs are run by an AsyncJobManager, many of them at the same time, and each completed job is a slice of the stream, so that state
+    is checkpointed after each one. Setting max_concurrent_slices downloads the results of that many completed jobs at the same time.
+
+    In incremental syncs, slices are in the order of the jobs: a completed job is only a slice once the jobs before it completed, so
+    that the state checkpointed after a slice never moves past a job still running. In full refresh syncs, slices are in the order the
+    jobs complete.
+    """
+
+    SLICE_JOB_KEY = "async_job"
+
+    @abstractmethod
+    def create_jobs(
+        self, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
+    ) -> Iterable[AsyncJob]:
+        """
+        :return: the jobs whose results are the records to read, they can be generated lazily
+        """
+
+    def create_job_manager(self, jobs: Iterable[AsyncJob]) -> AsyncJobManager:
+        """
+        Override to configure how the jobs are run, e.g: their maximum number of running jobs or poll intervals
+        """
+        return AsyncJobManager(jobs)
+
+    def stream_slices(
+        self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        job_manager = self.create_job_manager(self.create_jobs(sync_mode, cursor_field, stream_state))
+        for job in job_manager.completed_jobs(in_job_order=sync_mode == SyncMode.incremental):
+            yield {self.SLICE_JOB_KEY: job}
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        yield from stream_slice[self.SLICE_JOB_KEY].get_records()
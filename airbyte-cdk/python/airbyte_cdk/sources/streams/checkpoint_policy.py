@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import time
+from typing import Any, Mapping, Optional
+
+from airbyte_cdk.utils.message_serializer import dumps
+
+
+class CheckpointPolicy:
+    """
+    Decides when an incremental stream checkpoints its state while reading a slice: once record_interval records, byte_interval bytes
+    of record data or time_interval seconds were emitted since the last checkpoint, whichever comes first. State is checkpointed at the
+    end of every slice regardless.
+
+    Record counts suit streams of records of similar sizes. Streams of few huge records, or of many tiny ones, are better served by
+    byte_interval or time_interval, which give destinations a predictable commit cadence and bound the records read again when a sync
+    fails. Time is only checked when a record is emitted: a stream emitting no record has no new state to checkpoint.
+
+    Measuring bytes serializes the data of each record once more, the other intervals cost nothing.
+    """
+
+    def __init__(self, record_interval: Optional[int] = None, byte_interval: Optional[int] = None, time_interval: Optional[float] = None):
+        """
+        :param record_interval: number of records emitted after which state is checkpointed
+        :param byte_interval: number of bytes of record data emitted after which state is checkpointed
+        :param time_interval: number of seconds after which state is checkpointed
+        """
+        for name, interval in [("record_interval", record_interval), ("byte_interval", byte_interval), ("time_interval", time_interval)]:
+            if interval is not None and interval <= 0:
+                raise ValueError(f"{name} must be positive, got {interval}")
+        self.record_interval = record_interval
+        self.byte_interval = byte_interval
+        self.time_interval = time_interval
+        self.reset()
+
+    def reset(self):
+        """Called whenever state is checkpointed"""
+        self._records = 0
+        self._bytes = 0
+        self._last_checkpoint_time = time.monotonic()
+
+    def record_emitted(self, record_data: Mapping[str, Any]) -> bool:
+        """
+        Called after each record emitted
+        :param record_data: the data of the record
+        :return: True if state should be checkpointed
+        """
+        self._records += 1
+        if self.record_interval and self._records >= self.record_interval:
+            return True
+        if self.byte_interval:
+            self._bytes += len(dumps(record_data))
+            if self._bytes >= self.byte_interval:
+                return True
+        return bool(self.time_interval) and time.monotonic() - self._last_checkpoint_time >= self.time_interval
@@ -10,7 +10,9 @@ from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.models import AirbyteStream, SyncMode
+from airbyte_cdk.sources.streams.checkpoint_policy import CheckpointPolicy
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
+from airbyte_cdk.sources.utils.stream_metrics import StreamMetrics
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from deprecated.classic import deprecated
 
@@ -194,6 +196,62 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def checkpoint_policy(self) -> Optional[CheckpointPolicy]:
+        """
+        Decides when to checkpoint state within a slice, on a number of records, bytes of records or seconds since the last checkpoint,
+        whichever comes first. E.g: CheckpointPolicy(record_interval=1000, time_interval=60) checkpoints state every 1000 records, or
+        every minute when reading fewer than 1000 records a minute. A new policy is requested at the start of each read of the stream.
+
+        The default policy checkpoints state every state_checkpoint_interval records. return None if state should only be checkpointed
+        at the end of each slice, see state_checkpoint_interval.
+        """
+        checkpoint_interval = self.state_checkpoint_interval
+        return CheckpointPolicy(record_interval=checkpoint_interval) if checkpoint_interval else None
+
+    @property
+    def max_concurrent_slices(self) -> Optional[int]:
+        """
+        Decides how many slices are read at the same time. E.g: if this returns a value of 8, records of the next 8 slices are fetched in
+        parallel on a thread pool while records are still emitted in slice order. A STATE message is emitted after a slice only once every
+        earlier slice has been fully emitted.
+
+        Only override this if read_records is safe to call from several threads at once. Slices read ahead receive the stream state as it
+        was when they were scheduled. A stream which advances its state while reading records, i.e: which has a state attribute such as
+        IncrementalMixin streams, would checkpoint the progress of slices which are still buffered, so its slices are read one after
+        another in incremental syncs whatever this returns, unless it commits its state by slice. Only the state returned by
+        get_updated_state, or committed by commit_slice, is safe to read ahead.
+
+        return None to read slices one after another, which is the default.
+        """
+        return None
+
+    @property
+    def commits_state_by_slice(self) -> bool:
+        """
+        Whether the state updates made while reading a slice are held until commit_slice is called with the slice. A stream with a state
+        attribute can only read slices ahead in incremental syncs if it does, see max_concurrent_slices.
+        """
+        return False
+
+    def commit_slice(self, stream_slice: Optional[Mapping[str, Any]]):
+        """
+        Called in incremental syncs once every record of a slice has been emitted, in slice order and before the STATE message following
+        the slice. Streams committing their state by slice apply the state updates held for the slice.
+
+        :param stream_slice: the slice whose records were emitted, the same object the records were read with
+        """
+
+    @property
+    def metrics(self) -> StreamMetrics:
+        """
+        Performance counters of the stream, e.g: its number of requests or the time spent parsing them. They are reset when the stream
+        starts being read and emitted as METRICS trace messages, see AbstractSource.stream_metrics_interval.
+        """
+        if not hasattr(self, "_metrics"):
+            self._metrics = StreamMetrics()
+        return self._metrics
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """Override to extract state from the latest record. Needed to implement incremental sync.
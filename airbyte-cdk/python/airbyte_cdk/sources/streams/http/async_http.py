@@ -0,0 +1,167 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import time
+from abc import ABC
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.utils.concurrency import read_slices_async
+
+from .http import HttpStream, response_size
+from .rate_limiting import send_with_backoff_async
+from .transport import as_requests_exception, build_requests_response, httpx, httpx_timeout
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    HttpStream sending its requests with asyncio, for APIs needing many small requests, e.g: a lookup per parent record.
+
+    Streams are defined with the same methods as HttpStream (path, request_params, parse_response, next_page_token, backoff_time...),
+    the responses they get are requests responses built from the httpx ones.
+    AbstractSource reads up to max_concurrent_slices slices of the stream at the same time on a single event loop, backing off requests
+    without blocking the others. read_records drives read_records_async to completion so the stream can still be read synchronously,
+    e.g: as the parent of an HttpSubStream.
+
+    Requires httpx, install it with `pip install airbyte-cdk[http2]`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if httpx is None:
+            raise ImportError("AsyncHttpStream requires httpx, install it with `pip install airbyte-cdk[http2]`")
+        super().__init__(*args, **kwargs)
+        # httpx async clients are bound to the event loop they are used on, keep one per loop
+        self._async_clients: Dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+
+    @property
+    def max_concurrent_slices(self) -> Optional[int]:
+        """
+        Override if needed. How many slices are read at the same time, each one as a task of the event loop rather than a thread.
+        Slices of incremental streams are read one after another by default, see Stream.max_concurrent_slices before overriding it.
+        """
+        return None if self.supports_incremental else 10
+
+    def create_async_client(self) -> "httpx.AsyncClient":
+        """
+        Override to configure the httpx client sending the requests of the stream, e.g: its connection limits or HTTP/2 support.
+        Called once per event loop reading the stream.
+        """
+        return httpx.AsyncClient(timeout=None)
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = self.create_async_client()
+        return client
+
+    async def close_async_client(self):
+        """Closes the client used on the running event loop, if any"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _send_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Same as HttpStream._send, awaiting the response instead of blocking on it.
+        Of the requests keyword arguments only timeout is supported, the TLS and proxy settings are those of the httpx client.
+        """
+        self.logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+        if self._rate_limiter:
+            start = time.perf_counter()
+            await self._rate_limiter.acquire_async(request)
+            self.metrics.backed_off(time.perf_counter() - start)
+        start = time.perf_counter()
+        try:
+            response = await self._get_async_client().request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=httpx_timeout(request_kwargs.get("timeout")),
+            )
+        except httpx.TransportError as e:
+            raise as_requests_exception(e, request)
+        self.metrics.request_sent(time.perf_counter() - start)
+        return self._handle_response(request, build_requests_response(request, response))
+
+    async def _send_request_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        max_tries = self.max_retries
+        # max_retries counts retries, not attempts, see HttpStream._send_request
+        if max_tries is not None:
+            max_tries = max(0, max_tries) + 1
+        response_cache = self._response_cache
+        if response_cache:
+            cached_response = response_cache.get(request)
+            if cached_response is not None:
+                return cached_response
+
+        # The time spent out of self._send_async between attempts is spent backing off, see HttpStream._send_request
+        attempts = 0
+        send_time = 0.0
+
+        async def send() -> requests.Response:
+            nonlocal attempts, send_time
+            attempts += 1
+            start = time.perf_counter()
+            try:
+                return await self._send_async(request, request_kwargs)
+            finally:
+                send_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            response = await send_with_backoff_async(send, max_tries=max_tries, factor=self.retry_factor)
+        finally:
+            if attempts > 1:
+                self.metrics.backed_off(time.perf_counter() - start - send_time)
+        if response_cache:
+            response_cache.set(request, response)
+        return response
+
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """Same as HttpStream.read_records, awaiting the pages of the slice so other slices are read in the meantime"""
+        stream_state = stream_state or {}
+        pagination_complete = False
+
+        next_page_token = None
+        while not pagination_complete:
+            request, request_kwargs = self._create_page_request(stream_state, stream_slice, next_page_token)
+            response = await self._send_request_async(request, request_kwargs)
+            for record in self.metrics.timed_parsing(
+                lambda: self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            ):
+                yield record
+            self.metrics.response_read(response_size(response))
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        sliced_records = read_slices_async(
+            [stream_slice],
+            lambda _slice: self.read_records_async(
+                sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=_slice, stream_state=stream_state
+            ),
+            cleanup=self.close_async_client,
+        )
+        for _, records in sliced_records:
+            yield from records
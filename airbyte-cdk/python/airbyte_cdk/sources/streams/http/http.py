@@ -3,27 +3,38 @@
 #
 
 
-import logging
-import os
+import time
+import warnings
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
-import vcr
-import vcr.cassette as Cassette
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.json_stream import iter_response_records
 from requests.auth import AuthBase
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import RateLimiter, default_backoff_handler, user_defined_backoff_handler
+from .response_cache import ResponseCache
+from .transport import HttpTransport
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
 
-logging.getLogger("vcr").setLevel(logging.ERROR)
+
+def response_size(response: requests.Response) -> int:
+    """Number of bytes of the body of a response received so far, the body of streamed responses is only received as it is read"""
+    if not isinstance(response, requests.Response):
+        return 0
+    if response._content is not False:
+        return len(response._content or b"")
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError):
+        return 0
 
 
 class HttpStream(Stream, ABC):
@@ -35,18 +46,37 @@ class HttpStream(Stream, ABC):
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
-        self._session = requests.Session()
+    def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None, transport: Optional[HttpTransport] = None):
+        """
+        :param authenticator: authenticator applied to every request of the stream
+        :param transport: transport shared by the streams of the source, so they reuse each other's connections. Each stream gets its own
+        session when not set.
+        """
+        # Auth passed to each request, a shared session can't hold the auth of a single stream
+        self._request_auth: Optional[AuthBase] = None
+        self._rate_limiter: Optional[RateLimiter] = transport.rate_limiter if transport else None
+        if transport:
+            self._session = transport.get_session(self.url_base)
+        else:
+            self._session = requests.Session()
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
-            self._session.auth = authenticator
+            if transport:
+                self._request_auth = authenticator
+            else:
+                self._session.auth = authenticator
         elif authenticator:
             self._authenticator = authenticator
 
         if self.use_cache:
             self.cache_file = self.request_cache()
-            # we need this attr to get metadata about cassettes, such as record play count, all records played, etc.
+            if not isinstance(self.cache_file, ResponseCache):
+                warnings.warn(
+                    f"{type(self).__name__}.request_cache returns a vcr cassette, which is deprecated: return a ResponseCache instead",
+                    DeprecationWarning,
+                )
+            # Only set while requests are sent through a vcr cassette, to get metadata about it, such as its play count
             self.cassete = None
 
     @property
@@ -54,7 +84,7 @@ class HttpStream(Stream, ABC):
         """
         Override if needed. Return the name of cache file
         """
-        return f"{self.name}.yml"
+        return f"{self.name}.sqlite"
 
     @property
     def use_cache(self):
@@ -63,19 +93,29 @@ class HttpStream(Stream, ABC):
         """
         return False
 
-    def request_cache(self) -> Cassette:
+    def request_cache(self) -> ResponseCache:
         """
-        Builds VCR instance.
-        It deletes file everytime we create it, normally should be called only once.
-        We can't use NamedTemporaryFile here because yaml serializer doesn't work well with empty files.
+        Builds the cache of the responses of the stream, stored in cache_filename.
+        Override to limit for how long, or how much, responses are cached, e.g: ResponseCache(self.cache_filename, max_size=2**30).
+        Returning a vcr cassette, the cache of previous versions, is deprecated but still supported: requests are then sent within the
+        cassette by read_records.
         """
+        return ResponseCache(self.cache_filename)
 
-        try:
-            os.remove(self.cache_filename)
-        except FileNotFoundError:
-            pass
+    @property
+    def _response_cache(self) -> Optional[ResponseCache]:
+        """The cache looked up by _send_request, None when the cache is off or is a vcr cassette"""
+        if self.use_cache and isinstance(self.cache_file, ResponseCache):
+            return self.cache_file
+        return None
 
-        return vcr.use_cassette(self.cache_filename, record_mode="new_episodes", serializer="yaml")
+    @property
+    def stream_response(self) -> bool:
+        """
+        Override if needed. If True, requests are sent with stream=True: the body of a response is only read by parse_response, e.g: with
+        parse_json_records, so that large responses are never fully loaded in memory.
+        """
+        return False
 
     @property
     @abstractmethod
@@ -221,6 +261,19 @@ class HttpStream(Stream, ABC):
         :return: An iterable containing the parsed response
         """
 
+    def parse_json_records(self, response: requests.Response, path: Sequence[str] = ()) -> Iterable[Mapping]:
+        """
+        Parses the records at path out of a JSON response, e.g: ["data", "items"] for {"data": {"items": [...]}}, yielding them as they
+        are parsed. Use it in parse_response along with stream_response to read pages too large to be decoded at once: the body is then
+        read as the records are consumed. Once they are, response.json() gives the rest of the body, without the records, e.g: to get the
+        next page token.
+        Requires ijson, install it with `pip install airbyte-cdk[json-stream]`.
+
+        :param response: the response to parse
+        :param path: keys of the nested objects leading to the records, the whole body if empty
+        """
+        return iter_response_records(response, path)
+
     # TODO move all the retry logic to a functor/decorator which is input as an init parameter
     def should_retry(self, response: requests.Response) -> bool:
         """
@@ -254,7 +307,13 @@ class HttpStream(Stream, ABC):
         json: Any = None,
         data: Any = None,
     ) -> requests.PreparedRequest:
-        args = {"method": self.http_method, "url": urljoin(self.url_base, path), "headers": headers, "params": params}
+        args = {
+            "method": self.http_method,
+            "url": urljoin(self.url_base, path),
+            "headers": headers,
+            "params": params,
+            "auth": self._request_auth,
+        }
         if self.http_method.upper() in BODY_REQUEST_METHODS:
             if json and data:
                 raise RequestBodyException(
@@ -267,6 +326,23 @@ class HttpStream(Stream, ABC):
 
         return self._session.prepare_request(requests.Request(**args))
 
+    def _create_page_request(
+        self, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]], next_page_token: Optional[Mapping[str, Any]]
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
+        """Builds the request fetching a page of the stream, and the keyword arguments to send it with"""
+        request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        request = self._create_prepared_request(
+            path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            headers=dict(request_headers, **self.authenticator.get_auth_header()),
+            params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+        )
+        request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if self.stream_response:
+            request_kwargs = {"stream": True, **request_kwargs}
+        return request, request_kwargs
+
     def _send(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
         """
         Wraps sending the request in rate limit and error handlers.
@@ -289,8 +365,20 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        if self._rate_limiter:
+            start = time.perf_counter()
+            self._rate_limiter.acquire(request)
+            self.metrics.backed_off(time.perf_counter() - start)
+        start = time.perf_counter()
         response: requests.Response = self._session.send(request, **request_kwargs)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        self.metrics.request_sent(time.perf_counter() - start)
+        return self._handle_response(request, response)
+
+    def _handle_response(self, request: requests.PreparedRequest, response: requests.Response) -> requests.Response:
+        """Raises the exception matching the response of a request: a backoff exception when it should be retried, or its HTTP error"""
+        # the body of streamed responses is left for parse_response to read
+        body = response.text if response._content is not False else None
+        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": body})
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
             if custom_backoff_time:
@@ -334,9 +422,36 @@ class HttpStream(Stream, ABC):
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
+        response_cache = self._response_cache
+        if response_cache:
+            cached_response = response_cache.get(request)
+            if cached_response is not None:
+                return cached_response
+
+        # The time spent out of self._send between attempts is spent backing off
+        attempts = 0
+        send_time = 0.0
+
+        def send(request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+            nonlocal attempts, send_time
+            attempts += 1
+            start = time.perf_counter()
+            try:
+                return self._send(request, request_kwargs)
+            finally:
+                send_time += time.perf_counter() - start
+
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(send)
         backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
-        return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        start = time.perf_counter()
+        try:
+            response = backoff_handler(user_backoff_handler)(request, request_kwargs)
+        finally:
+            if attempts > 1:
+                self.metrics.backed_off(time.perf_counter() - start - send_time)
+        if response_cache:
+            response_cache.set(request, response)
+        return response
 
     @classmethod
     def parse_response_error_message(cls, response: requests.Response) -> Optional[str]:
@@ -399,27 +514,19 @@ class HttpStream(Stream, ABC):
 
         next_page_token = None
         while not pagination_complete:
-            request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-            request = self._create_prepared_request(
-                path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                headers=dict(request_headers, **self.authenticator.get_auth_header()),
-                params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            )
-            request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            request, request_kwargs = self._create_page_request(stream_state, stream_slice, next_page_token)
 
-            if self.use_cache:
-                # use context manager to handle and store cassette metadata
+            if self.use_cache and not isinstance(self.cache_file, ResponseCache):
+                # vcr replays the request from the cassette if it was recorded, else sends it and records its response
                 with self.cache_file as cass:
                     self.cassete = cass
-                    # vcr tries to find records based on the request, if such records exist, return from cache file
-                    # else make a request and save record in cache file
                     response = self._send_request(request, request_kwargs)
-
             else:
                 response = self._send_request(request, request_kwargs)
-            yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            yield from self.metrics.timed_parsing(
+                lambda: self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
+            )
+            self.metrics.response_read(response_size(response))
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
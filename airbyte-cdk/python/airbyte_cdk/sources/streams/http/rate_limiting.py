@@ -2,13 +2,16 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import logging
 import sys
+import threading
 import time
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
 
 import backoff
-from requests import codes, exceptions
+from requests import PreparedRequest, Response, codes, exceptions
 
 from .exceptions import DefaultBackoffException, UserDefinedBackoffException
 
@@ -23,6 +26,14 @@ TRANSIENT_EXCEPTIONS = (
 logger = logging.getLogger("airbyte")
 
 
+def _should_give_up(exc) -> bool:
+    # If a non-rate-limiting related 4XX error makes it this far, it means it was unexpected and probably consistent, so we shouldn't back off
+    give_up = exc.response is not None and exc.response.status_code != codes.too_many_requests and 400 <= exc.response.status_code < 500
+    if give_up:
+        logger.info(f"Giving up for returned HTTP status: {exc.response.status_code}")
+    return give_up
+
+
 def default_backoff_handler(max_tries: Optional[int], factor: float, **kwargs):
     def log_retry_attempt(details):
         _, exc, _ = sys.exc_info()
@@ -32,19 +43,12 @@ def default_backoff_handler(max_tries: Optional[int], factor: float, **kwargs):
             f"Caught retryable error '{str(exc)}' after {details['tries']} tries. Waiting {details['wait']} seconds then retrying..."
         )
 
-    def should_give_up(exc):
-        # If a non-rate-limiting related 4XX error makes it this far, it means it was unexpected and probably consistent, so we shouldn't back off
-        give_up = exc.response is not None and exc.response.status_code != codes.too_many_requests and 400 <= exc.response.status_code < 500
-        if give_up:
-            logger.info(f"Giving up for returned HTTP status: {exc.response.status_code}")
-        return give_up
-
     return backoff.on_exception(
         backoff.expo,
         TRANSIENT_EXCEPTIONS,
         jitter=None,
         on_backoff=log_retry_attempt,
-        giveup=should_give_up,
+        giveup=_should_give_up,
         max_tries=max_tries,
         factor=factor,
         **kwargs,
@@ -75,3 +79,126 @@ def user_defined_backoff_handler(max_tries: Optional[int], **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+async def send_with_backoff_async(send: Callable[[], Awaitable[Response]], max_tries: Optional[int], factor: float) -> Response:
+    """
+    asyncio counterpart of user_defined_backoff_handler wrapped by default_backoff_handler.
+    Waits with asyncio.sleep, so the other requests of the event loop keep going while this one backs off.
+
+    :param send: coroutine function sending the request, raising the same exceptions as HttpStream._send
+    :param max_tries: maximum number of attempts for each kind of backoff, None for no limit
+    :param factor: factor of the exponential default backoff
+    """
+    user_defined_tries = 0
+    default_tries = 0
+    while True:
+        try:
+            return await send()
+        except UserDefinedBackoffException as exc:
+            user_defined_tries += 1
+            if max_tries is not None and user_defined_tries >= max_tries:
+                logger.error(f"Max retry limit reached. Request: {exc.request}, Response: {exc.response}")
+                raise
+            if exc.response:
+                logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
+            logger.info(f"Retrying. Sleeping for {exc.backoff} seconds")
+            await asyncio.sleep(exc.backoff + 1)  # extra second to cover any fractions of second
+        except TRANSIENT_EXCEPTIONS as exc:
+            default_tries += 1
+            if _should_give_up(exc) or (max_tries is not None and default_tries >= max_tries):
+                raise
+            wait = factor * 2 ** (default_tries - 1)
+            if exc.response:
+                logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
+            logger.info(f"Caught retryable error '{str(exc)}' after {default_tries} tries. Waiting {wait} seconds then retrying...")
+            await asyncio.sleep(wait)
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to capacity tokens, refilled at rate tokens per second.
+    Requests over the limit reserve a token ahead of time, so waiting requests are served in the order they arrived.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, :return how many seconds to wait before the token can be used"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Limits the rate of the requests sent to an API before they are sent, instead of backing off once the API throttles them.
+
+    Pass it to the HttpTransport shared by the streams of a source, so every stream counts against the same limit:
+
+        transport = HttpTransport(rate_limiter=RateLimiter(requests_per_minute=600, burst=20))
+
+    Requests are limited per host, or per endpoint (host and path) with per_endpoint=True. Retries count against the limit too.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        per_endpoint: bool = False,
+    ):
+        """
+        :param requests_per_second: sustained rate of requests allowed, exclusive with requests_per_minute
+        :param requests_per_minute: sustained rate of requests allowed, exclusive with requests_per_second
+        :param burst: how many requests can be sent at once after a quiet period, defaults to a second worth of requests and at least 1
+        :param per_endpoint: limit the rate of each endpoint separately rather than the rate of each host
+        """
+        if requests_per_second is not None and requests_per_minute is None:
+            self.rate = requests_per_second
+        elif requests_per_minute is not None and requests_per_second is None:
+            self.rate = requests_per_minute / 60
+        else:
+            raise ValueError(
+                "Exactly one of requests_per_second and requests_per_minute must be set, "
+                f"got requests_per_second={requests_per_second} and requests_per_minute={requests_per_minute}"
+            )
+        if self.rate <= 0:
+            raise ValueError(f"The rate of requests must be positive, got {self.rate} requests per second")
+        self.burst = burst if burst is not None else max(1, int(self.rate))
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+        self.per_endpoint = per_endpoint
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, request: PreparedRequest) -> TokenBucket:
+        url = urlsplit(request.url)
+        key = f"{url.netloc}{url.path}" if self.per_endpoint else url.netloc
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def acquire(self, request: PreparedRequest):
+        """Blocks until the request can be sent"""
+        delay = self._bucket(request).reserve()
+        if delay:
+            logger.debug(f"Rate limit reached, waiting {delay:.3f} seconds before requesting {request.url}")
+            time.sleep(delay)
+
+    async def acquire_async(self, request: PreparedRequest):
+        """Waits until the request can be sent, without blocking the event loop"""
+        delay = self._bucket(request).reserve()
+        if delay:
+            logger.debug(f"Rate limit reached, waiting {delay:.3f} seconds before requesting {request.url}")
+            await asyncio.sleep(delay)
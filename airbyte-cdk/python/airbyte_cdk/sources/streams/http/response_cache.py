@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Set
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Cache files already emptied by this process, so that streams sharing a cache file don't delete the responses cached by each other
+_cleared_files: Set[str] = set()
+_cleared_files_lock = threading.Lock()
+
+
+class ResponseCache:
+    """
+    Stores the responses of HTTP requests in a sqlite file, so that a stream reading the same requests again, e.g: a parent stream read
+    once by the source and once by its HttpSubStream, replays them from disk instead of calling the API.
+
+    Responses are keyed by a fingerprint of the method, URL and body of their request. Each lookup reads a single response, so replaying
+    does not slow down as the cache grows.
+    The file is emptied the first time it is opened by the process, so every sync starts with an empty cache.
+    """
+
+    def __init__(self, filename: str, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        """
+        :param filename: path of the sqlite file, created if it doesn't exist
+        :param ttl: number of seconds responses can be replayed for, None to keep them for the whole sync
+        :param max_size: maximum number of bytes of response content to keep, the oldest responses are evicted first
+        """
+        self.filename = filename
+        self.ttl = ttl
+        self.max_size = max_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        path = os.path.abspath(filename)
+        with _cleared_files_lock:
+            if path not in _cleared_files:
+                _cleared_files.add(path)
+                for suffix in ("", "-wal", "-shm"):
+                    try:
+                        os.remove(path + suffix)
+                    except FileNotFoundError:
+                        pass
+
+    @staticmethod
+    def fingerprint(request: requests.PreparedRequest) -> str:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256(f"{request.method}\n{request.url}\n".encode("utf-8"))
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        # the connection is opened on first use, after every stream sharing the file had a chance to empty it
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename, isolation_level=None, check_same_thread=False)
+            # the cache is thrown away after the sync, durability doesn't matter
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    reason TEXT,
+                    url TEXT,
+                    headers TEXT NOT NULL,
+                    content BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+                CREATE TABLE IF NOT EXISTS cache_size (total INTEGER NOT NULL);
+                INSERT INTO cache_size SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM cache_size);
+                CREATE TRIGGER IF NOT EXISTS responses_inserted AFTER INSERT ON responses
+                    BEGIN UPDATE cache_size SET total = total + new.size; END;
+                CREATE TRIGGER IF NOT EXISTS responses_deleted AFTER DELETE ON responses
+                    BEGIN UPDATE cache_size SET total = total - old.size; END;
+                """
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """:return the cached response of the request, None if it isn't cached or expired"""
+        key = self.fingerprint(request)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT created_at, status_code, reason, url, headers, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            created_at, status_code, reason, url, headers, content = row
+            if self.ttl is not None and created_at < time.time() - self.ttl:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+        response = requests.Response()
+        response._content = content
+        response._content_consumed = True
+        response.status_code = status_code
+        response.reason = reason
+        response.url = url
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.request = request
+        return response
+
+    def set(self, request: requests.PreparedRequest, response: requests.Response):
+        content = response.content or b""
+        row = (
+            self.fingerprint(request),
+            time.time(),
+            len(content),
+            response.status_code,
+            response.reason,
+            response.url,
+            json.dumps(dict(response.headers)),
+            content,
+        )
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+                connection.execute("INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+                self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _evict(self, connection: sqlite3.Connection):
+        if self.ttl is not None:
+            connection.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+        if self.max_size is None:
+            return
+        while connection.execute("SELECT total FROM cache_size").fetchone()[0] > self.max_size:
+            connection.execute("DELETE FROM responses WHERE key = (SELECT key FROM responses ORDER BY created_at LIMIT 1)")
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # Streams used to wrap their requests in `with self.cache_file:` when the cache was a vcr cassette, which still works
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *args):
+        pass
@@ -0,0 +1,167 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .rate_limiting import RateLimiter
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency, see the `http2` extra
+    httpx = None
+
+
+class HttpTransport:
+    """
+    Shares HTTP sessions, and so their connection pools, between the streams of a source.
+
+    Create one instance per source, e.g: in AbstractSource.streams(), and pass it to every HttpStream. Streams whose url_base point to the
+    same scheme and host share a session, so they reuse the connections (and the TLS handshakes) opened by each other.
+
+        transport = HttpTransport(pool_maxsize=20)
+        return [Users(authenticator=auth, transport=transport), Groups(authenticator=auth, transport=transport)]
+
+    Authentication of shared sessions is applied to each request instead of the session, so streams can use different authenticators.
+    Streams should not change the state of a shared session (headers, cookies, auth) as it would leak into other streams.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        :param pool_connections: number of hosts to keep a connection pool for in each session
+        :param pool_maxsize: maximum number of connections kept open to a host, should be at least the number of concurrent requests
+        :param pool_block: whether to wait for a free connection when the pool is full instead of opening a throwaway connection
+        :param keep_alive: set to False to close connections after each request, for APIs which mishandle persistent connections
+        :param http2: send requests over HTTP/2 with httpx, which must be installed (`pip install airbyte-cdk[http2]`)
+        :param rate_limiter: limits the rate of the requests of all the streams using the transport
+        """
+        if http2 and httpx is None:
+            raise ImportError("HTTP/2 support requires httpx, install it with `pip install airbyte-cdk[http2]`")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.rate_limiter = rate_limiter
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def session_key(url_base: str) -> str:
+        """Sessions are shared by origin, so streams using different paths of the same API share their connections"""
+        url = urlsplit(url_base)
+        return f"{url.scheme}://{url.netloc}".lower()
+
+    def get_session(self, url_base: str) -> requests.Session:
+        key = self.session_key(url_base)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = self._create_session()
+        return session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        if self.http2:
+            adapter: BaseAdapter = Http2Adapter(pool_maxsize=self.pool_maxsize, keep_alive=self.keep_alive)
+        else:
+            adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    requests adapter sending requests with an httpx client, which negotiates HTTP/2 with servers supporting it.
+    TLS verification, client certificates and proxies are those of the httpx client, the per request values of requests are not used.
+    Responses are always fully read, even when stream=True.
+    """
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOLSIZE, keep_alive: bool = True, client: Optional["httpx.Client"] = None):
+        super().__init__()
+        if client is None:
+            if httpx is None:
+                raise ImportError("HTTP/2 support requires httpx, install it with `pip install airbyte-cdk[http2]`")
+            limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize if keep_alive else 0)
+            client = httpx.Client(http2=True, limits=limits)
+        self._client = client
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        try:
+            response = self._client.request(
+                request.method, request.url, headers=dict(request.headers), content=request.body, timeout=httpx_timeout(timeout)
+            )
+        except httpx.TransportError as e:
+            raise as_requests_exception(e, request)
+        return build_requests_response(request, response, connection=self)
+
+    def close(self):
+        self._client.close()
+
+
+def httpx_timeout(timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]) -> "httpx.Timeout":
+    """Converts a requests timeout, a number of seconds or a (connect, read) tuple, to an httpx timeout"""
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+    return httpx.Timeout(timeout)
+
+
+def as_requests_exception(error: "httpx.TransportError", request: requests.PreparedRequest) -> requests.RequestException:
+    """Maps httpx errors to the requests exceptions the HttpStream backoff handlers retry on"""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.ReadTimeout):
+        return requests.exceptions.ReadTimeout(error, request=request)
+    if isinstance(error, httpx.RemoteProtocolError):
+        return requests.exceptions.ChunkedEncodingError(error, request=request)
+    return requests.exceptions.ConnectionError(error, request=request)
+
+
+def build_requests_response(request: requests.PreparedRequest, response: "httpx.Response", connection: Any = None) -> requests.Response:
+    """Builds a requests response from a read httpx response, so HttpStream hooks get the same response type whatever sent the request"""
+    built = requests.Response()
+    built._content = response.read()
+    built._content_consumed = True
+    built.status_code = response.status_code
+    built.headers = CaseInsensitiveDict(response.headers)
+    built.encoding = get_encoding_from_headers(built.headers)
+    built.reason = response.reason_phrase
+    built.url = str(response.url)
+    built.request = request
+    built.connection = connection
+    if hasattr(response, "_elapsed"):
+        built.elapsed = response.elapsed
+    return built
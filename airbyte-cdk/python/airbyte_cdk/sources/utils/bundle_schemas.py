@@ -0,0 +1,26 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Writes the bundled_schemas.json file of a connector package, from which ResourceSchemaLoader reads the stream schemas instead of resolving
+the files of its schemas/ folder. Run it once the connector is installed, e.g: in its Dockerfile.
+
+Usage: python -m airbyte_cdk.sources.utils.bundle_schemas <package_name>
+"""
+
+import argparse
+from typing import List, Optional
+
+from airbyte_cdk.sources.utils.schema_helpers import bundle_schemas
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Bundle the resolved stream schemas of a connector package")
+    parser.add_argument("package_name", help="the package of the connector, e.g: source_hubspot")
+    parsed_args = parser.parse_args(args)
+    print(f"Wrote {bundle_schemas(parsed_args.package_name)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from queue import Full, Queue
+from typing import Any, AsyncIterable, Awaitable, Callable, Deque, Iterable, Iterator, Mapping, Optional, Tuple
+
+StreamSlice = Optional[Mapping[str, Any]]
+
+_NO_MORE_SLICES = object()
+
+
+def put_unless_cancelled(queue: Queue, item: Any, cancelled: threading.Event, timeout: float = 0.1) -> bool:
+    """
+    Put an item on a bounded queue, waiting for room unless the consumer cancelled the read.
+    :return True if the item was put on the queue, False if the read got cancelled
+    """
+    while not cancelled.is_set():
+        try:
+            queue.put(item, timeout=timeout)
+            return True
+        except Full:
+            continue
+    return False
+
+
+class _SliceEnd:
+    """Marks the end of a slice's records, carries the exception raised while reading the slice if any"""
+
+    def __init__(self, exception: Optional[Exception] = None):
+        self.exception = exception
+
+
+class _SliceBuffer:
+    """Bounded buffer a slice's records are read into, drained by the consumer in slice order"""
+
+    def __init__(self, stream_slice: StreamSlice, buffer_size: int):
+        self.stream_slice = stream_slice
+        self._buffer: Queue = Queue(maxsize=buffer_size)
+        self.cancelled = threading.Event()
+
+    def records(self) -> Iterator[Any]:
+        while True:
+            item = self._buffer.get()
+            if isinstance(item, _SliceEnd):
+                if item.exception:
+                    raise item.exception
+                return
+            yield item
+
+
+class _SliceReader(_SliceBuffer):
+    """Reads the records of a single slice on a worker thread into a bounded buffer"""
+
+    def __init__(self, stream_slice: StreamSlice, read_slice: Callable[[StreamSlice], Iterable[Any]], buffer_size: int):
+        super().__init__(stream_slice, buffer_size)
+        self._read_slice = read_slice
+
+    def run(self):
+        exception = None
+        try:
+            for record in self._read_slice(self.stream_slice):
+                if not put_unless_cancelled(self._buffer, record, self.cancelled):
+                    return
+        except Exception as e:
+            exception = e
+        put_unless_cancelled(self._buffer, _SliceEnd(exception), self.cancelled)
+
+
+class _AsyncSliceReader(_SliceBuffer):
+    """Reads the records of a single slice as a task of an event loop, without blocking the loop when its buffer is full"""
+
+    def __init__(
+        self,
+        stream_slice: StreamSlice,
+        read_slice: Callable[[StreamSlice], AsyncIterable[Any]],
+        buffer_size: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        super().__init__(stream_slice, buffer_size)
+        self._read_slice = read_slice
+        self.future: Future = asyncio.run_coroutine_threadsafe(self.run_async(), loop)
+
+    async def run_async(self):
+        exception = None
+        try:
+            async for record in self._read_slice(self.stream_slice):
+                if not await self._put(record):
+                    return
+        except Exception as e:
+            exception = e
+        await self._put(_SliceEnd(exception))
+
+    async def _put(self, item: Any, poll_interval: float = 0.01) -> bool:
+        while not self.cancelled.is_set():
+            try:
+                self._buffer.put_nowait(item)
+                return True
+            except Full:
+                await asyncio.sleep(poll_interval)
+        return False
+
+
+def _read_in_order(
+    slices: Iterable[StreamSlice], start_reader: Callable[[StreamSlice], _SliceBuffer], max_concurrent_slices: int
+) -> Iterator[Tuple[StreamSlice, Iterable[Any]]]:
+    """Keeps up to max_concurrent_slices readers started ahead of the consumer and hands their records over in slice order"""
+    slices_iterator = iter(slices)
+    in_flight: Deque[_SliceBuffer] = deque()
+
+    def schedule_slices():
+        while len(in_flight) < max_concurrent_slices:
+            stream_slice = next(slices_iterator, _NO_MORE_SLICES)
+            if stream_slice is _NO_MORE_SLICES:
+                return
+            in_flight.append(start_reader(stream_slice))
+
+    try:
+        schedule_slices()
+        while in_flight:
+            reader = in_flight[0]
+            yield reader.stream_slice, reader.records()
+            # the consumer is done with this slice, unblock its worker if records were left unconsumed
+            reader.cancelled.set()
+            in_flight.popleft()
+            schedule_slices()
+    finally:
+        for reader in in_flight:
+            reader.cancelled.set()
+
+
+def read_slices(
+    slices: Iterable[StreamSlice],
+    read_slice: Callable[[StreamSlice], Iterable[Any]],
+    max_concurrent_slices: Optional[int] = None,
+    buffer_size: int = 1000,
+) -> Iterator[Tuple[StreamSlice, Iterable[Any]]]:
+    """
+    Pair every slice with the records read from it, in slice order.
+
+    With max_concurrent_slices greater than 1, up to that many slices are read ahead on a thread pool. Each slice buffers at most
+    buffer_size records, so memory stays bounded while the consumer works through earlier slices.
+    The records of a slice must be consumed before moving on to the next slice, records of a slice left unconsumed are dropped.
+
+    :param slices: slices to read, consumed lazily
+    :param read_slice: callable returning the records of a slice, called from worker threads when reading concurrently
+    :param max_concurrent_slices: how many slices can be read at the same time, None or 1 reads slices one after another
+    :param buffer_size: maximum number of records buffered per slice read ahead
+    :return: iterator of (slice, records) tuples
+    """
+    if not max_concurrent_slices or max_concurrent_slices <= 1:
+        for stream_slice in slices:
+            yield stream_slice, read_slice(stream_slice)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrent_slices, thread_name_prefix="slice-reader")
+
+    def start_reader(stream_slice: StreamSlice) -> _SliceReader:
+        reader = _SliceReader(stream_slice, read_slice, buffer_size)
+        executor.submit(reader.run)
+        return reader
+
+    try:
+        yield from _read_in_order(slices, start_reader, max_concurrent_slices)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def read_slices_async(
+    slices: Iterable[StreamSlice],
+    read_slice: Callable[[StreamSlice], AsyncIterable[Any]],
+    max_concurrent_slices: Optional[int] = None,
+    buffer_size: int = 1000,
+    cleanup: Optional[Callable[[], Awaitable[None]]] = None,
+) -> Iterator[Tuple[StreamSlice, Iterable[Any]]]:
+    """
+    Same as read_slices, for slices whose records are read by coroutines.
+
+    The coroutines run on an event loop owned by a background thread, so up to max_concurrent_slices slices are read at the same
+    time without a thread per slice. Slices are still computed, and records consumed, by the calling thread.
+
+    :param slices: slices to read, consumed lazily
+    :param read_slice: callable returning an async iterable of the records of a slice, called from the event loop
+    :param max_concurrent_slices: how many slices can be read at the same time, None reads slices one after another
+    :param buffer_size: maximum number of records buffered per slice read ahead
+    :param cleanup: coroutine function awaited on the event loop once reading stops, e.g: to close the clients bound to the loop
+    :return: iterator of (slice, records) tuples
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="slice-reader-loop", daemon=True)
+    thread.start()
+    readers: Deque[_AsyncSliceReader] = deque()
+
+    def start_reader(stream_slice: StreamSlice) -> _AsyncSliceReader:
+        reader = _AsyncSliceReader(stream_slice, read_slice, buffer_size, loop)
+        readers.append(reader)
+        while readers and readers[0].future.done():
+            readers.popleft()
+        return reader
+
+    try:
+        yield from _read_in_order(slices, start_reader, max(max_concurrent_slices or 1, 1))
+    finally:
+        for reader in readers:
+            reader.future.cancel()
+        wait([reader.future for reader in readers])
+        try:
+            if cleanup:
+                asyncio.run_coroutine_threadsafe(cleanup(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -0,0 +1,208 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+from typing import IO, Any, Iterable, Iterator, List, Protocol, Sequence, Tuple
+
+import requests
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency, see the `json-stream` extra
+    ijson = None
+
+_CONTAINER_STARTS = frozenset(["start_map", "start_array"])
+_CONTAINER_ENDS = frozenset(["end_map", "end_array"])
+
+
+class _Reader(Protocol):
+    """What the parsers need of a file: reading its bytes"""
+
+    def read(self, size: int = -1) -> bytes:
+        ...
+
+
+def iter_records(file: IO[bytes], path: Sequence[str]) -> Iterator[Any]:
+    """
+    Parses a JSON document incrementally and yields the records found at path: the elements of an array, or a single value unless it
+    is empty (e.g: null or {}). Nothing is yielded if the document has no value at path.
+
+    Only the value being yielded is built, the rest of the document is skipped as it is parsed. Numbers are parsed as int and float, as
+    json.loads does.
+    Requires ijson, install it with `pip install airbyte-cdk[json-stream]`.
+
+    :param file: file-like object the document is read from
+    :param path: keys of the nested objects leading to the value, the whole document if empty
+    """
+    if ijson is None:
+        raise ImportError("Streaming JSON parsing requires ijson, install it with `pip install airbyte-cdk[json-stream]`")
+    # ijson identifies values by their keys joined with dots
+    target = ".".join(path)
+    item_prefix = f"{target}.item" if target else "item"
+    reader: _Reader = file
+    recording = None
+    if file.seekable():
+        start = file.tell()
+    else:
+        # the file can't be read again, its bytes are recorded as they are parsed
+        reader = recording = _RecordingReader(file)
+    events = ijson.parse(reader, use_float=True)
+    for prefix, event, value in events:
+        # map_key events have the prefix of the object holding the key
+        if prefix != target or event == "map_key":
+            continue
+        if event != "start_array":
+            record = _build_value(event, value, events)
+            if record:
+                yield record
+            return
+        # Knowing the path leads to an array, its items are built by ijson.items, which is much faster than handling the events one by
+        # one in python. It parses the document again from its start.
+        if recording is None:
+            file.seek(start)
+        else:
+            reader = recording.replay()
+        yield from ijson.items(reader, item_prefix, use_float=True)
+        return
+
+
+class RecordStream:
+    """
+    Parses a JSON document incrementally and yields the records found at path, as iter_records does, while building the rest of the
+    document. Once the records are iterated, rest is the document with an empty array, or null, in place of the records.
+
+    The file is read once, from its current position: the rest of the document can't be recovered by parsing it again as iter_records
+    does, so records are slower to parse than with iter_records.
+    Requires ijson, install it with `pip install airbyte-cdk[json-stream]`.
+    """
+
+    def __init__(self, file: _Reader, path: Sequence[str]):
+        """
+        :param file: file-like object the document is read from, only its read method is used
+        :param path: keys of the nested objects leading to the value, the whole document if empty
+        """
+        if ijson is None:
+            raise ImportError("Streaming JSON parsing requires ijson, install it with `pip install airbyte-cdk[json-stream]`")
+        self._file = file
+        self._target = ".".join(path)
+        self.rest: Any = None
+
+    def __iter__(self) -> Iterator[Any]:
+        target = self._target
+        item_prefix = f"{target}.item" if target else "item"
+        builder = ijson.ObjectBuilder()
+        events = ijson.parse(self._file, use_float=True)
+        for prefix, event, value in events:
+            # map_key events have the prefix of the object holding the key
+            if prefix != target or event == "map_key":
+                builder.event(event, value)
+            elif event == "start_array":
+                builder.event("start_array", None)
+                builder.event("end_array", None)
+                # the items are built by ijson from the events of the array, which is faster than building them one event at a time
+                yield from ijson.items(_array_events(events, target), item_prefix)
+            else:
+                record = _build_value(event, value, events)
+                builder.event("null", None)
+                if record:
+                    yield record
+        self.rest = builder.value
+
+
+def iter_response_records(response: requests.Response, path: Sequence[str], chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Parses the records found at path out of the JSON body of a response, as iter_records does.
+
+    When the request was sent with stream=True, the body is read as the records are consumed, so that neither the body nor the decoded
+    document are ever fully in memory. Once the records are consumed, the content of such a response is the rest of the document, with an
+    empty array, or null, in place of the records: response.json() still gives e.g: the next page token.
+    Responses whose body is already read, e.g: cached responses, are parsed from their content, which is left unchanged.
+    Requires ijson, install it with `pip install airbyte-cdk[json-stream]`.
+
+    :param response: the response to parse
+    :param path: keys of the nested objects leading to the records, the whole body if empty
+    :param chunk_size: number of bytes read from the response at a time
+    """
+    if response._content is not False:
+        yield from iter_records(io.BytesIO(response.content), path)
+        return
+    records = RecordStream(_ChunkReader(response.iter_content(chunk_size)), path)
+    yield from records
+    response._content = json.dumps(records.rest).encode()
+
+
+def _array_events(events: Iterator[Tuple[str, str, Any]], prefix: str) -> Iterator[Tuple[str, str, Any]]:
+    """Yields the events of the content of the array at prefix, stopping at its end"""
+    for prefixed_event in events:
+        if prefixed_event[1] == "end_array" and prefixed_event[0] == prefix:
+            return
+        yield prefixed_event
+
+
+def _build_value(event: str, value: Any, events: Iterator[Tuple[str, str, Any]]) -> Any:
+    """Builds the value starting with the event, consuming the events of its content"""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in _CONTAINER_STARTS else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in _CONTAINER_STARTS:
+            depth += 1
+        elif event in _CONTAINER_ENDS:
+            depth -= 1
+    return builder.value
+
+
+class _RecordingReader:
+    """Keeps the bytes read from a file, so that they can be read again by a second parser"""
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+        self._chunks: List[bytes] = []
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._chunks.append(chunk)
+        return chunk
+
+    def replay(self) -> "_ReplayReader":
+        return _ReplayReader(b"".join(self._chunks), self._file)
+
+
+class _ReplayReader:
+    """Reads the recorded bytes, then the rest of the file"""
+
+    def __init__(self, recorded: bytes, file: IO[bytes]):
+        self._recorded = recorded
+        self._file = file
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._recorded:
+            return self._file.read(size)
+        if size < 0:
+            chunk, self._recorded = self._recorded + self._file.read(), b""
+        else:
+            chunk, self._recorded = self._recorded[:size], self._recorded[size:]
+        return chunk
+
+
+class _ChunkReader:
+    """Reads the chunks of bytes of an iterator, e.g: the content of a streamed response"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        # the chunks are returned as they are, readers only stop once they get no bytes
+        if size == 0:
+            return b""
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+    def seekable(self) -> bool:
+        return False
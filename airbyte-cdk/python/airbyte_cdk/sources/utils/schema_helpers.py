@@ -7,10 +7,12 @@ import importlib
 import json
 import os
 import pkgutil
+from functools import lru_cache
 from typing import Any, ClassVar, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import jsonref
 from airbyte_cdk.models import ConnectorSpecification
+from airbyte_cdk.utils.message_serializer import dumps, loads
 from jsonschema import RefResolver, validate
 from jsonschema.exceptions import ValidationError
 from pydantic import BaseModel, Field
@@ -29,7 +31,15 @@ class JsonFileLoader:
 
     def __call__(self, uri: str) -> Dict[str, Any]:
         uri = uri.replace(self.uri_base, f"{self.uri_base}/{self.shared}/")
-        return json.load(open(uri))
+        return _load_json_file(uri)
+
+
+@lru_cache(maxsize=None)
+def _load_json_file(path: str) -> Any:
+    # Shared schemas are referenced by many stream schemas, they are read once per process. jsonref copies the documents it resolves
+    # references in, so the cached ones are never modified.
+    with open(path) as file:
+        return json.load(file)
 
 
 def resolve_ref_links(obj: Any) -> Union[Dict[str, Any], List[Any]]:
@@ -100,6 +110,9 @@ def rename_key(schema: Any, old_key: str, new_key: str) -> None:
             schema[new_key] = schema.pop(old_key)
 
 
+BUNDLED_SCHEMAS_FILE = "bundled_schemas.json"
+
+
 class ResourceSchemaLoader:
     """JSONSchema loader from package resources"""
 
@@ -117,8 +130,16 @@ class ResourceSchemaLoader:
         schemas/shared/<shared_definition>.json
         schemas/<name>.json # contains a $ref to shared_definition
         schemas/<name2>.json # contains a $ref to shared_definition
+
+        Resolved schemas are cached for the lifetime of the process, keyed by package and name, and each call returns a new copy. When the
+        package contains a bundled_schemas.json file, generated by bundle_schemas, schemas are read from it instead of being resolved.
         """
+        return loads(_get_schema_json(self.package_name, name))
 
+    def load_schema(self, name: str) -> dict:
+        """
+        Reads the schemas/<name>.json file and resolves its references, without going through the cache or the bundled schemas.
+        """
         schema_filename = f"schemas/{name}.json"
         raw_file = pkgutil.get_data(self.package_name, schema_filename)
         if not raw_file:
@@ -138,13 +159,72 @@ class ResourceSchemaLoader:
         :return JSON serializable object with references without external dependencies.
         """
 
-        package = importlib.import_module(self.package_name)
-        base = os.path.dirname(package.__file__) + "/"
+        base = _package_dir(self.package_name) + "/"
         resolved = jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(base, "schemas/shared"), base_uri=base)
         resolved = resolve_ref_links(resolved)
         return resolved
 
 
+def _package_dir(package_name: str) -> str:
+    package_file = importlib.import_module(package_name).__file__
+    if package_file is None:
+        raise ValueError(f"Can't find where {package_name} is installed, add an __init__.py file to it if it is a namespace package")
+    return os.path.dirname(package_file)
+
+
+@lru_cache(maxsize=None)
+def _get_schema_json(package_name: str, name: str) -> str:
+    # Schemas are cached serialized, deserializing a copy for every caller is cheaper than resolving them again or deep copying them
+    bundled_schemas = _get_bundled_schemas(package_name)
+    if name in bundled_schemas:
+        return bundled_schemas[name]
+    return dumps(ResourceSchemaLoader(package_name).load_schema(name))
+
+
+@lru_cache(maxsize=None)
+def _get_bundled_schemas(package_name: str) -> Mapping[str, str]:
+    try:
+        raw_file = pkgutil.get_data(package_name, BUNDLED_SCHEMAS_FILE)
+    except OSError:
+        return {}
+    if not raw_file:
+        return {}
+    try:
+        bundled_schemas = loads(raw_file)
+    except ValueError as err:
+        raise RuntimeError(f"Invalid JSON file format for file {BUNDLED_SCHEMAS_FILE}") from err
+    return {name: dumps(schema) for name, schema in bundled_schemas.items()}
+
+
+def clear_schema_cache() -> None:
+    """
+    Empties the cache of ResourceSchemaLoader, e.g: once schema files changed.
+    """
+    _get_schema_json.cache_clear()
+    _get_bundled_schemas.cache_clear()
+    _load_json_file.cache_clear()
+
+
+def bundle_schemas(package_name: str) -> str:
+    """
+    Resolves the schemas of all the files in the schemas/ folder of a package and writes them to its bundled_schemas.json file, which
+    ResourceSchemaLoader then reads schemas from. Meant to be run when the connector is built, see the bundle_schemas module.
+
+    :param package_name: the package of the connector, e.g: source_hubspot
+    :return: the path of the file written
+    """
+    package_dir = _package_dir(package_name)
+    schemas_dir = os.path.join(package_dir, "schemas")
+    loader = ResourceSchemaLoader(package_name)
+    names = sorted(filename[: -len(".json")] for filename in os.listdir(schemas_dir) if filename.endswith(".json"))
+    bundled_schemas = {name: loader.load_schema(name) for name in names}
+    path = os.path.join(package_dir, BUNDLED_SCHEMAS_FILE)
+    with open(path, "w") as file:
+        json.dump(bundled_schemas, file)
+    clear_schema_cache()
+    return path
+
+
 def check_config_against_spec_or_exit(config: Mapping[str, Any], spec: ConnectorSpecification):
     """
     Check config object against spec. In case of spec is invalid, throws
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import bisect
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteMetricsHistogramBucket,
+    AirbyteMetricsTraceMessage,
+    AirbyteTraceMessage,
+    StreamDescriptor,
+    TraceType,
+)
+from airbyte_cdk.models import Type as MessageType
+
+T = TypeVar("T")
+
+# Upper bounds of the buckets of the request latency histogram, requests slower than the last one fall in an extra unbounded bucket
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class StreamMetrics:
+    """
+    Performance counters of a stream, accumulated from the moment it starts being read, to tell what a slow sync is waiting on: the API,
+    parsing its responses or the output.
+
+    Request, parsing and backoff counters are updated by the threads or tasks reading the slices of the stream, under a lock. Records
+    emitted, transformation and output times are only updated by the thread emitting the messages of the stream.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Starts counting from zero, called when the stream starts being read
+        """
+        self.started_at = time.perf_counter()
+        self.request_count = 0
+        self.request_time = 0.0
+        self.request_latency_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.bytes_received = 0
+        self.parse_time = 0.0
+        self.backoff_time = 0.0
+        self.records_emitted = 0
+        self.transform_time = 0.0
+        self.output_time = 0.0
+
+    def request_sent(self, latency: float):
+        """
+        :param latency: number of seconds until the response of the request was received
+        """
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, latency * 1000)
+        with self._lock:
+            self.request_count += 1
+            self.request_time += latency
+            self.request_latency_counts[bucket] += 1
+
+    def response_read(self, size: int):
+        """
+        :param size: number of bytes of the body of the response
+        """
+        with self._lock:
+            self.bytes_received += size
+
+    def backed_off(self, duration: float):
+        """
+        :param duration: number of seconds waited before sending or retrying a request
+        """
+        if duration > 0:
+            with self._lock:
+                self.backoff_time += duration
+
+    def timed_parsing(self, parse: Callable[[], Iterable[T]]) -> Iterator[T]:
+        """
+        Yields the records of parse(), counting the time spent producing them as parsing time. The time spent by the consumer on each
+        record is not counted.
+        """
+        parse_time = 0.0
+        try:
+            start = time.perf_counter()
+            records = iter(parse())
+            parse_time += time.perf_counter() - start
+            while True:
+                start = time.perf_counter()
+                try:
+                    record = next(records)
+                except StopIteration:
+                    return
+                finally:
+                    parse_time += time.perf_counter() - start
+                yield record
+        finally:
+            with self._lock:
+                self.parse_time += parse_time
+
+    def as_airbyte_message(self, stream_name: str) -> AirbyteMessage:
+        """
+        :return: a METRICS trace message of the counters of the stream so far
+        """
+        with self._lock:
+            latency_histogram: List[AirbyteMetricsHistogramBucket] = [
+                AirbyteMetricsHistogramBucket(upper_bound_ms=upper_bound, count=count)
+                for upper_bound, count in zip(LATENCY_BUCKETS_MS, self.request_latency_counts)
+            ]
+            latency_histogram.append(AirbyteMetricsHistogramBucket(count=self.request_latency_counts[-1]))
+            metrics = AirbyteMetricsTraceMessage(
+                stream_descriptor=StreamDescriptor(name=stream_name),
+                elapsed_ms=(time.perf_counter() - self.started_at) * 1000,
+                request_count=self.request_count,
+                request_time_ms=self.request_time * 1000,
+                request_latency_histogram=latency_histogram,
+                bytes_received=self.bytes_received,
+                records_emitted=self.records_emitted,
+                parse_time_ms=self.parse_time * 1000,
+                transform_time_ms=self.transform_time * 1000,
+                backoff_time_ms=self.backoff_time * 1000,
+                output_time_ms=self.output_time * 1000,
+            )
+        trace_message = AirbyteTraceMessage(type=TraceType.METRICS, emitted_at=datetime.now().timestamp() * 1000, metrics=metrics)
+        return AirbyteMessage(type=MessageType.TRACE, trace=trace_message)
@@ -3,14 +3,28 @@
 #
 
 import logging
+import numbers
+import threading
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin
 
-from jsonschema import Draft7Validator, validators
+from jsonschema import Draft7Validator, RefResolver
 
 logger = logging.getLogger("airbyte")
 
+# Type checks matching the ones jsonschema validators use by default, booleans are only of type "boolean"
+_PYTHON_TYPES = {
+    "array": list,
+    "boolean": bool,
+    "integer": int,
+    "null": type(None),
+    "number": numbers.Number,
+    "object": dict,
+    "string": str,
+}
+
 
 class TransformConfig(Flag):
     """
@@ -37,6 +51,8 @@ class TypeTransformer:
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
+    # Number of compiled schemas kept per transformer
+    MAX_COMPILED_SCHEMAS = 100
 
     def __init__(self, config: TransformConfig):
         """
@@ -46,13 +62,8 @@ class TypeTransformer:
         if TransformConfig.NoTransform in config and config != TransformConfig.NoTransform:
             raise Exception("NoTransform option cannot be combined with other flags.")
         self._config = config
-        all_validators = {
-            key: self.__get_normalizer(key, orig_validator)
-            for key, orig_validator in Draft7Validator.VALIDATORS.items()
-            # Do not validate field we do not transform for maximum performance.
-            if key in ["type", "array", "$ref", "properties", "items"]
-        }
-        self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Schemas compiled into normalizers, keyed by id with a reference to the schema so the id can't be reused
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], _CompiledSchema]] = {}
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -66,22 +77,10 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        # Normalizers compiled so far don't apply the new callback
+        self._compiled_schemas = {}
         return normalization_callback
 
-    def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
-        """
-        Applies different transform function to object's field according to config.
-        :param original_item original value of field.
-        :param subschema part of the jsonschema containing field type/format data.
-        :return Final field value.
-        """
-        if TransformConfig.DefaultSchemaNormalization in self._config:
-            original_item = self.default_convert(original_item, subschema)
-
-        if self._custom_normalizer:
-            original_item = self._custom_normalizer(original_item, subschema)
-        return original_item
-
     @staticmethod
     def default_convert(original_item: Any, subschema: Dict[str, Any]) -> Any:
         """
@@ -118,47 +117,74 @@ class TypeTransformer:
             return original_item
         return original_item
 
-    def __get_normalizer(self, schema_key: str, original_validator: Callable):
-        """
-        Traverse through object fields using native jsonschema validator and apply normalization function.
-        :param schema_key related json schema key that currently being validated/normalized.
-        :original_validator: native jsonschema validator callback.
-        """
-
-        def normalizator(validator_instance: Callable, property_value: Any, instance: Any, schema: Dict[str, Any]):
-            """
-            Jsonschema validator callable it uses for validating instance. We
-            override default Draft7Validator to perform value transformation
-            before validation take place. We do not take any action except
-            logging warn if object does not conform to json schema, just using
-            jsonschema algorithm to traverse through object fields.
-            Look
-            https://python-jsonschema.readthedocs.io/en/stable/creating/?highlight=validators.create#jsonschema.validators.create
-            validators parameter for detailed description.
-            :
-            """
-
-            def resolve(subschema):
-                if "$ref" in subschema:
-                    _, resolved = validator_instance.resolver.resolve(subschema["$ref"])
-                    return resolved
-                return subschema
-
-            # Transform object and array values before running json schema type checking for each element.
-            if schema_key == "properties":
-                for k, subschema in property_value.items():
-                    if k in (instance or {}):
-                        subschema = resolve(subschema)
-                        instance[k] = self.__normalize(instance[k], subschema)
-            elif schema_key == "items":
-                subschema = resolve(property_value)
-                for index, item in enumerate((instance or [])):
-                    instance[index] = self.__normalize(item, subschema)
-
-            # Running native jsonschema traverse algorithm after field normalization is done.
-            yield from original_validator(validator_instance, property_value, instance, schema)
-
-        return normalizator
+    def __get_value_normalizer(self, subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+        """
+        Build the function applied to a field value according to config: default_convert, then the custom normalizer, with its subschema.
+        Default conversion is specialized to the subschema type once, unless default_convert is overridden.
+        """
+        convert: Optional[Callable[[Any], Any]] = None
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                convert = self._get_default_converter(subschema)
+            else:
+                convert = lambda value: self.default_convert(value, subschema)  # noqa: E731
+        if self._custom_normalizer is None:
+            return convert or (lambda value: value)
+
+        custom_normalizer: Callable[[Any, Dict[str, Any]], Any] = self._custom_normalizer
+        if convert is None:
+            return lambda value: custom_normalizer(value, subschema)
+        convert_value: Callable[[Any], Any] = convert
+        return lambda value: custom_normalizer(convert_value(value), subschema)
+
+    @staticmethod
+    def _get_default_converter(subschema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Specialize default_convert to a subschema, so the target type is only looked up once.
+        :return converter function or None if values are never converted.
+        """
+        target_type = subschema.get("type", [])
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            target_type = target_type[0] if len(target_type) == 1 else None
+
+        cast: Callable[[Any], Any]
+        if target_type == "string":
+            cast = str
+        elif target_type == "number":
+            cast = float
+        elif target_type == "integer":
+            cast = int
+        elif target_type == "boolean":
+            cast = _to_bool
+        else:
+            return None
+
+        def convert(value):
+            if value is None and nullable:
+                return None
+            try:
+                return cast(value)
+            except (ValueError, TypeError):
+                return value
+
+        return convert
+
+    def _compile(self, schema: Mapping[str, Any]) -> "_CompiledSchema":
+        """
+        Compile a jsonschema into a tree of normalizers, each $ref being resolved once, on first use.
+        Compiled schemas are cached, so a schema must not be modified once it has been used to transform records.
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached and cached[0] is schema:
+            return cached[1]
+        compiled = _SchemaCompiler(RefResolver.from_schema(schema), self.__get_value_normalizer).compile(schema)
+        if len(self._compiled_schemas) >= self.MAX_COMPILED_SCHEMAS:
+            # schemas are usually built once per stream, only callers building a new schema per record get there
+            self._compiled_schemas.pop(next(iter(self._compiled_schemas)))
+        self._compiled_schemas[id(schema)] = (schema, compiled)
+        return compiled
 
     def transform(self, record: Dict[str, Any], schema: Mapping[str, Any]):
         """
@@ -168,10 +194,177 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
-        normalizer = self._normalizer(schema)
-        for e in normalizer.iter_errors(record):
-            """
-            just calling normalizer.validate() would throw an exception on
-            first validation occurences and stop processing rest of schema.
-            """
-            logger.warning(e.message)
+        warnings: List[str] = []
+        self._compile(schema).visit(record, warnings)
+        # normalization goes through the whole record and reports every field which does not conform to the schema
+        for warning in warnings:
+            logger.warning(warning)
+
+
+class _CompiledSchema:
+    """
+    Normalizes and validates an instance against one (sub)schema. Follows the traversal of a jsonschema validator restricted to the
+    "type", "$ref", "properties" and "items" keywords: values of properties and array items are normalized before being visited, and
+    values which don't match the "type" of their schema produce a warning.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self):
+        self.steps: List[Callable[[Any, List[str]], None]] = []
+
+    def visit(self, instance: Any, warnings: List[str]):
+        for step in self.steps:
+            step(instance, warnings)
+
+
+class _SchemaCompiler:
+    def __init__(self, resolver: RefResolver, get_value_normalizer: Callable[[Dict[str, Any]], Callable[[Any], Any]]):
+        self._resolver = resolver
+        self._get_value_normalizer = get_value_normalizer
+        # Compiled subschemas by resolution scope and id, which also stops recursive schemas from being compiled forever
+        self._compiled: Dict[Tuple[str, int], _CompiledSchema] = {}
+        self._schemas: List[Any] = []
+        # $ref are compiled on first use, possibly from several threads reading streams at once
+        self._lock = threading.RLock()
+
+    def compile(self, schema: Any) -> _CompiledSchema:
+        key = (self._resolver.resolution_scope, id(schema))
+        if key in self._compiled:
+            return self._compiled[key]
+        compiled = _CompiledSchema()
+        self._compiled[key] = compiled
+        # keep the subschema alive so its id stays unique
+        self._schemas.append(schema)
+
+        if schema is False:
+            compiled.steps.append(self._false_schema)
+            return compiled
+        if not isinstance(schema, Mapping):
+            return compiled
+
+        scope = schema.get("$id", "")
+        if scope:
+            self._resolver.push_scope(scope)
+        try:
+            if "$ref" in schema:
+                compiled.steps.append(self._compile_ref(schema["$ref"]))
+            else:
+                for keyword, value in schema.items():
+                    if keyword == "type":
+                        compiled.steps.append(self._compile_type(value))
+                    elif keyword == "properties":
+                        compiled.steps.append(self._compile_properties(value))
+                    elif keyword == "items":
+                        compiled.steps.append(self._compile_items(value))
+        finally:
+            if scope:
+                self._resolver.pop_scope()
+        return compiled
+
+    @staticmethod
+    def _false_schema(instance: Any, warnings: List[str]):
+        warnings.append(f"False schema does not allow {instance!r}")
+
+    def _lazy(self, build: Callable[[], Callable]) -> Callable:
+        """
+        Defer building a function until its first call. $ref are resolved lazily like jsonschema does, so a ref which can't be
+        resolved only fails for records which have the field.
+        """
+        built: List[Callable] = []
+
+        def call(*args):
+            if not built:
+                with self._lock:
+                    if not built:
+                        built.append(build())
+            return built[0](*args)
+
+        return call
+
+    def _compile_url(self, url: str) -> _CompiledSchema:
+        with self._lock:
+            resolved = self._resolver.resolve_from_url(url)
+            self._resolver.push_scope(url)
+            try:
+                return self.compile(resolved)
+            finally:
+                self._resolver.pop_scope()
+
+    def _compile_ref(self, ref: str) -> Callable[[Any, List[str]], None]:
+        url = urljoin(self._resolver.resolution_scope, ref)
+        return self._lazy(lambda: self._compile_url(url).visit)
+
+    def _compile_value_normalizer(self, subschema: Any) -> Callable[[Any], Any]:
+        """Normalizer of the values of a subschema, resolving a top level $ref like the normalization always did"""
+        if isinstance(subschema, Mapping) and "$ref" in subschema:
+            url = urljoin(self._resolver.resolution_scope, subschema["$ref"])
+            return self._lazy(lambda: self._get_value_normalizer(self._resolver.resolve_from_url(url)))
+        return self._get_value_normalizer(subschema)
+
+    @staticmethod
+    def _compile_type(types: Any) -> Callable[[Any, List[str]], None]:
+        types = [types] if isinstance(types, str) else list(types)
+        checks = [_type_check(t) for t in types]
+        message_types = ", ".join(repr(t) for t in types)
+
+        def check_type(instance: Any, warnings: List[str]):
+            if not any(check(instance) for check in checks):
+                warnings.append(f"{instance!r} is not of type {message_types}")
+
+        return check_type
+
+    def _compile_properties(self, properties: Mapping[str, Any]) -> Callable[[Any, List[str]], None]:
+        fields = [
+            (name, self._compile_value_normalizer(subschema), self.compile(subschema).visit) for name, subschema in properties.items()
+        ]
+
+        def normalize_properties(instance: Any, warnings: List[str]):
+            if not isinstance(instance, dict):
+                return
+            for name, normalize, visit in fields:
+                if name in instance:
+                    value = instance[name] = normalize(instance[name])
+                    visit(value, warnings)
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any) -> Callable[[Any, List[str]], None]:
+        if isinstance(items, list):
+            # tuple validation, items are visited but not normalized
+            visits = [self.compile(subschema).visit for subschema in items]
+
+            def visit_tuple_items(instance: Any, warnings: List[str]):
+                if isinstance(instance, list):
+                    for item, visit in zip(instance, visits):
+                        visit(item, warnings)
+
+            return visit_tuple_items
+
+        normalize = self._compile_value_normalizer(items)
+        visit = self.compile(items).visit
+
+        def normalize_items(instance: Any, warnings: List[str]):
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                value = instance[index] = normalize(item)
+                visit(value, warnings)
+
+        return normalize_items
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return strtobool(value) == 1
+    return bool(value)
+
+
+def _type_check(type_name: str) -> Callable[[Any], bool]:
+    if type_name not in _PYTHON_TYPES:
+        # let jsonschema raise its UnknownType error
+        return lambda instance: bool(Draft7Validator.TYPE_CHECKER.is_type(instance, type_name))
+    python_type = _PYTHON_TYPES[type_name]
+    if python_type is bool:
+        return lambda instance: isinstance(instance, bool)
+    return lambda instance: isinstance(instance, python_type) and not isinstance(instance, bool)
@@ -2,7 +2,8 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+from typing import Any, List, Mapping, Optional, Pattern
 
 import dpath.util
 
@@ -54,19 +55,43 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# Matches any secret, longest first so that a secret is never only partially matched because a shorter one starts at the same position
+__SECRETS_PATTERN: Optional[Pattern[str]] = None
 
 
 def update_secrets(secrets: List[str]):
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRETS_PATTERN
     __SECRETS_FROM_CONFIG = secrets
+    secret_values = sorted({str(secret) for secret in secrets if secret}, key=len, reverse=True)
+    __SECRETS_PATTERN = re.compile("|".join(re.escape(secret) for secret in secret_values)) if secret_values else None
 
 
 def filter_secrets(string: str) -> str:
-    """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    """Filter secrets from a string by replacing them with ****
+
+    The string is scanned once for all the secrets. Every occurrence is replaced with its own ****, occurrences which overlap each other
+    are replaced with a single one, so with secrets "abc" and "cde" the input "abcde" becomes "****" rather than "****de".
+    """
+    if __SECRETS_PATTERN is None:
+        return string
+    match = __SECRETS_PATTERN.search(string)
+    if not match:
+        return string
+
+    parts = []
+    position = 0
+    span_start, span_end = match.span()
+    while True:
+        # the next occurrence may start within this one
+        match = __SECRETS_PATTERN.search(string, match.start() + 1)
+        if match and match.start() < span_end:
+            span_end = max(span_end, match.end())
+            continue
+        parts += [string[position:span_start], "****"]
+        position = span_end
+        if not match:
+            break
+        span_start, span_end = match.span()
+    parts.append(string[position:])
+    return "".join(parts)
@@ -32,12 +32,20 @@ class EventTimer:
         self.count += 1
         self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name: Optional[str] = None):
         """
         Finish the current event and pop it from the stack.
+        If a name is given, finish that event instead, so events that overlap without nesting (e.g. streams read concurrently) can be timed.
         """
 
-        if self.stack:
+        if name is not None:
+            event = self.events.get(name)
+            if event in self.stack:
+                self.stack.remove(event)
+                event.finish()
+            else:
+                logger.warning(f"{self.name} finish_event called for {name} without start_event")
+        elif self.stack:
             event = self.stack.pop(0)
             event.finish()
         else:
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import Any, Callable, Union
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, see the `fast-json` extra
+    orjson = None
+
+_RECORD_FIELDS = {"namespace", "stream", "data", "emitted_at"}
+
+
+def _dumps_json(obj: Any) -> str:
+    return json.dumps(obj, default=pydantic_encoder)
+
+
+def _dumps_orjson(obj: Any) -> str:
+    try:
+        return str(orjson.dumps(obj, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS), "utf-8")
+    except TypeError:
+        # orjson.JSONEncodeError is a TypeError, raised for the values orjson doesn't support such as integers over 64 bits
+        return _dumps_json(obj)
+
+
+def _loads_orjson(data: Union[str, bytes]) -> Any:
+    try:
+        return orjson.loads(data)
+    except ValueError:
+        # orjson rejects the NaN and Infinity tokens the json module writes, json.loads still raises on malformed input
+        return json.loads(data)
+
+
+# orjson writes NaN and Infinity as null, while json writes them as the NaN and Infinity tokens.
+# Both loads accept str or bytes, read the NaN and Infinity tokens and raise a ValueError on malformed input.
+dumps: Callable[[Any], str] = _dumps_json
+loads: Callable[[Union[str, bytes]], Any] = json.loads
+if orjson:
+    dumps, loads = _dumps_orjson, _loads_orjson
+
+
+def airbyte_message_to_json(message: AirbyteMessage) -> str:
+    """
+    Serialize an AirbyteMessage to a single line of JSON, as the Airbyte protocol expects on STDOUT.
+
+    RECORD messages are the bulk of the output of a sync, their envelope is written directly from the stream name, data and emitted_at
+    instead of going through pydantic serialization. Other messages are serialized with pydantic.
+    orjson is used when installed, otherwise the output is the same as message.json(exclude_unset=True).
+    """
+    record = message.record
+    if message.type == Type.RECORD and record is not None and record.__fields_set__ <= _RECORD_FIELDS:
+        if record.namespace is None:
+            envelope = {"stream": record.stream, "data": record.data, "emitted_at": record.emitted_at}
+        else:
+            envelope = {"namespace": record.namespace, "stream": record.stream, "data": record.data, "emitted_at": record.emitted_at}
+        return dumps({"type": "RECORD", "record": envelope})
+    return message.json(exclude_unset=True)
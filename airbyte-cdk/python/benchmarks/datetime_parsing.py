@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures DatetimeParser.parse on cursor values of common formats against the former implementation, which called strptime for every
+value. Distinct values measure the parsers built per format, repeated values the cache of parsed values.
+
+Usage: python benchmarks/datetime_parsing.py [number_of_values]
+"""
+
+import datetime
+import sys
+import time
+
+from airbyte_cdk.sources.declarative.datetime import datetime_parser
+from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
+
+FORMATS = ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%s", "%ms", "%d %b %Y"]
+
+
+def parse_with_strptime(date, format: str, timezone):
+    if format == "%s":
+        return datetime.datetime.fromtimestamp(int(date), tz=timezone)
+    elif format == "%ms":
+        seconds, milliseconds = divmod(int(date), 1000)
+        return datetime.datetime.fromtimestamp(seconds, tz=timezone).replace(microsecond=milliseconds * 1000)
+    return datetime.datetime.strptime(str(date), format).replace(tzinfo=timezone)
+
+
+def generate_values(format: str, number_of_values: int):
+    start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    datetimes = [start + datetime.timedelta(days=i, seconds=37 * i, microseconds=i) for i in range(number_of_values)]
+    return [DatetimeParser().format(dt, format) for dt in datetimes]
+
+
+def measure(parse, values, format: str) -> float:
+    start = time.perf_counter()
+    for value in values:
+        parse(value, format, datetime.timezone.utc)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run(number_of_values: int):
+    parser = DatetimeParser()
+    print(f"{number_of_values} values per format, microseconds per value")
+    print(f"{'format':<26}{'strptime':>10}{'distinct':>10}{'repeated':>10}")
+    for format in FORMATS:
+        values = generate_values(format, number_of_values)
+        assert all(
+            parser.parse(value, format, datetime.timezone.utc) == parse_with_strptime(value, format, datetime.timezone.utc)
+            for value in values
+        )
+        # the check above filled the cache, distinct values must not hit it
+        datetime_parser._parse.cache_clear()
+        strptime_duration = measure(parse_with_strptime, values, format)
+        distinct_duration = measure(parser.parse, values, format)
+        repeated_values = values[:100] * (number_of_values // 100)
+        repeated_duration = measure(parser.parse, repeated_values, format)
+        datetime_parser._parse.cache_clear()
+        print(f"{format:<26}{strptime_duration:>10.2f}{distinct_duration:>10.2f}{repeated_duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the startup of a YamlDeclarativeSource defined by a large synthetic manifest: the first instance parses and validates the
+manifest, the next ones read it from the manifest cache, as the check, discover and read commands of a connector do. streams() creates
+the components of the streams, as every command does.
+
+Usage: python benchmarks/declarative_startup.py [number_of_streams]
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import time
+
+DEFINITIONS = """
+version: "0.1.0"
+definitions:
+  schema_loader:
+    name: "{{ options.name }}"
+    file_path: "./source/schemas/{{ options.name }}.json"
+  selector:
+    extractor:
+      field_pointer: ["data"]
+    record_filter:
+      condition: "{{ record['id'] > 0 }}"
+  requester:
+    url_base: "https://api.example.com/v1"
+    http_method: "GET"
+    authenticator:
+      type: BearerAuthenticator
+      api_token: "{{ config['api_key'] }}"
+    request_options_provider:
+      request_parameters:
+        per_page: "100"
+    error_handler:
+      response_filters:
+        - http_codes: [404]
+          action: IGNORE
+  paginator:
+    type: LimitPaginator
+    page_size: 100
+    limit_option:
+      inject_into: request_parameter
+      field_name: limit
+    page_token_option:
+      inject_into: request_parameter
+      field_name: cursor
+    pagination_strategy:
+      type: CursorPagination
+      cursor_value: "{{ response.next }}"
+  stream_slicer:
+    type: DatetimeStreamSlicer
+    start_datetime: "{{ config['start_date'] }}"
+    end_datetime: "{{ now_utc() }}"
+    step: "1d"
+    datetime_format: "%Y-%m-%dT%H:%M:%S%z"
+    cursor_field: "updated_at"
+  retriever:
+    requester:
+      $ref: "*ref(definitions.requester)"
+      path: "/{{ options.name }}"
+    record_selector: "*ref(definitions.selector)"
+    paginator: "*ref(definitions.paginator)"
+    stream_slicer: "*ref(definitions.stream_slicer)"
+  base_stream:
+    schema_loader: "*ref(definitions.schema_loader)"
+    retriever: "*ref(definitions.retriever)"
+    transformations:
+      - type: AddFields
+        fields:
+          - path: ["source"]
+            value: "{{ options.name }}"
+streams:
+"""
+
+STREAM = """
+- $ref: "*ref(definitions.base_stream)"
+  $options:
+    name: "stream_{index}"
+    url_base: "https://api.example.com/v1"
+    primary_key: "id"
+    stream_cursor_field: "updated_at"
+"""
+
+CHECK = """
+check:
+  stream_names: ["stream_0"]
+"""
+
+CONFIG = {"api_key": "key", "start_date": "2021-01-01T00:00:00+0000"}
+
+
+def generate_manifest(number_of_streams: int) -> str:
+    streams = "".join(textwrap.indent(STREAM.format(index=index), "  ") for index in range(number_of_streams))
+    return DEFINITIONS + streams + CHECK
+
+
+def create_source_package(directory: str, number_of_streams: int):
+    """Creates the package of a source, whose manifest is read with pkgutil as connectors' manifests are"""
+    package = os.path.join(directory, "benchmark_source")
+    os.makedirs(package)
+    with open(os.path.join(package, "__init__.py"), "w") as file:
+        file.write(
+            "from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource\n\n\n"
+            "class BenchmarkSource(YamlDeclarativeSource):\n"
+            "    def __init__(self):\n"
+            '        super().__init__(path_to_yaml="manifest.yaml")\n'
+        )
+    with open(os.path.join(package, "manifest.yaml"), "w") as file:
+        file.write(generate_manifest(number_of_streams))
+    # The manifest cache is keyed by the version of the connector, which is read from the metadata of its distribution
+    dist_info = os.path.join(directory, "benchmark_source-0.1.0.dist-info")
+    os.makedirs(dist_info)
+    with open(os.path.join(dist_info, "METADATA"), "w") as file:
+        file.write("Metadata-Version: 2.1\nName: benchmark-source\nVersion: 0.1.0\n")
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(number_of_streams: int):
+    with tempfile.TemporaryDirectory() as directory:
+        create_source_package(directory, number_of_streams)
+        os.environ["AIRBYTE_MANIFEST_CACHE_DIR"] = os.path.join(directory, "manifest_cache")
+        sys.path.insert(0, directory)
+        source_class = importlib.import_module("benchmark_source").BenchmarkSource
+
+        print(f"{number_of_streams} streams, milliseconds")
+        print(f"{'':<34}{'duration':>10}")
+        source, duration = measure(source_class)
+        print(f"{'first instance (parse, validate)':<34}{duration:>10.1f}")
+        source, duration = measure(source_class)
+        print(f"{'next instance (manifest cache)':<34}{duration:>10.1f}")
+        streams, duration = measure(lambda: source.streams(CONFIG))
+        assert len(streams) == number_of_streams
+        print(f"{'streams()':<34}{duration:>10.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares the default and the lightweight parsing of the messages a destination reads from stdin.
+
+Usage: python benchmarks/destination_input_parsing.py [number_of_records]
+"""
+
+import io
+import sys
+import time
+from unittest.mock import patch
+
+from airbyte_cdk.destinations import Destination
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Type
+
+
+def generate_input(number_of_records: int) -> bytes:
+    lines = []
+    for i in range(number_of_records):
+        data = {"id": i, "name": f"name {i}", "updated_at": "2022-01-01T00:00:00Z", "tags": ["a", "b"], "nested": {"amount": i * 1.5}}
+        lines.append(AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data=data, emitted_at=1)))
+        if i % 1000 == 0:
+            lines.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"users": {"id": i}})))
+    return "\n".join(line.json(exclude_unset=True) for line in lines).encode("utf-8")
+
+
+def run(number_of_records: int):
+    raw_input = generate_input(number_of_records)
+    with patch.object(Destination, "__abstractmethods__", set()):
+        destination = Destination()
+
+    start = time.perf_counter()
+    default_count = sum(1 for _ in destination._parse_input_stream(io.TextIOWrapper(io.BytesIO(raw_input), encoding="utf-8")))
+    default_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    input_stream = io.BufferedReader(io.BytesIO(raw_input), buffer_size=destination.input_buffer_size)
+    lightweight_count = sum(1 for _ in destination._parse_input_stream_lightweight(input_stream))
+    lightweight_duration = time.perf_counter() - start
+
+    assert default_count == lightweight_count
+    print(f"parsed {default_count} messages")
+    print(f"default:     {default_duration:.3f}s ({default_count / default_duration:,.0f} messages/s)")
+    print(f"lightweight: {lightweight_duration:.3f}s ({lightweight_count / lightweight_duration:,.0f} messages/s)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
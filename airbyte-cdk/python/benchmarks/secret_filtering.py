@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures secret filtering on a DEBUG-heavy run, where every request and response gets logged, against the former
+implementation which called str.replace once per secret.
+
+Usage: python benchmarks/secret_filtering.py [number_of_log_lines]
+"""
+
+import json
+import logging
+import sys
+import time
+
+from airbyte_cdk.logger import AirbyteLogFormatter
+from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets, update_secrets
+
+SECRETS = ["client-secret-8f14e45fceea167a5a36dedd4bea2543", "refresh-token-c9f0f895fb98ab9159f51fd0297e236d", "hunter2", 12345678]
+
+
+def filter_secrets_with_replace(string: str) -> str:
+    for secret in SECRETS:
+        if secret:
+            string = string.replace(str(secret), "****")
+    return string
+
+
+def generate_log_records(number_of_lines: int):
+    records = []
+    for i in range(number_of_lines):
+        body = json.dumps({"data": [{"id": i, "name": f"user {j}", "email": f"user{j}@example.com"} for j in range(20)]})
+        message = f"Receiving response: status=200 url=https://api.example.com/v1/users?page={i} body={body}"
+        records.append(logging.LogRecord("airbyte", logging.DEBUG, __file__, 0, message, None, None))
+        message = (
+            f"Making outbound API request: https://api.example.com/v1/users?page={i + 1} headers={{'Authorization': 'Bearer hunter2'}}"
+        )
+        records.append(logging.LogRecord("airbyte", logging.DEBUG, __file__, 0, message, None, None))
+    return records
+
+
+def run(number_of_lines: int):
+    records = generate_log_records(number_of_lines)
+    update_secrets(SECRETS)
+    formatter = AirbyteLogFormatter()
+
+    start = time.perf_counter()
+    formatted = [formatter.format(record) for record in records]
+    format_duration = time.perf_counter() - start
+    payloads = [json.dumps({"type": "DEBUG", "message": r.getMessage(), "data": {}}) for r in records]
+
+    start = time.perf_counter()
+    for payload in payloads:
+        filter_secrets(payload)
+    filter_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in payloads:
+        filter_secrets_with_replace(payload)
+    replace_duration = time.perf_counter() - start
+
+    assert all("hunter2" not in line for line in formatted)
+    print(f"{len(records)} DEBUG log lines, {len(SECRETS)} secrets")
+    print(f"formatting with AirbyteLogFormatter: {format_duration:.3f}s")
+    print(f"filter_secrets:                      {filter_duration:.3f}s")
+    print(f"str.replace per secret:              {replace_duration:.3f}s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -15,7 +15,7 @@ README = (HERE / "README.md").read_text()
 
 setup(
     name="airbyte-cdk",
-    version="0.1.80",
+    version="0.1.106",
     description="A framework for writing Airbyte Connectors.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -66,6 +66,15 @@ setup(
             "requests-mock",
             "pytest-httpserver",
         ],
+        "fast-json": [
+            "orjson~=3.8",
+        ],
+        "http2": [
+            "httpx[http2]~=0.23",
+        ],
+        "json-stream": [
+            "ijson~=3.1",
+        ],
         "sphinx-docs": [
             "Sphinx~=4.2",
             "sphinx-rtd-theme~=1.0",
@@ -237,7 +237,65 @@ class TestRun:
         # verify output was correct
         assert expected_write_result == returned_write_result
 
+    @pytest.mark.parametrize("lightweight_record_parsing", [False, True])
+    def test_run_write_reads_stdin(self, mocker, destination: Destination, tmp_path, monkeypatch, lightweight_record_parsing):
+        mocker.patch.object(destination, "lightweight_record_parsing", lightweight_record_parsing)
+        catalog_path = tmp_path / "catalog.json"
+        write_file(catalog_path, ConfiguredAirbyteCatalog(streams=[]).json())
+        config_path = tmp_path / "config.json"
+        write_file(config_path, {})
+        mocker.patch.object(destination, "spec", return_value=ConnectorSpecification(connectionSpecification={}))
+        mocker.patch("airbyte_cdk.destinations.destination.check_config_against_spec_or_exit")
+        mocker.patch.object(destination, "write", side_effect=lambda config, configured_catalog, input_messages: list(input_messages))
+        input_messages = [_wrapped(_record("s1", {"k1": "v1"})), _wrapped(_state({"k1": "v1"}))]
+        stdin_path = tmp_path / "stdin"
+        stdin_path.write_text("\n".join(message.json(exclude_unset=True) for message in input_messages))
+
+        with open(stdin_path) as stdin:
+            monkeypatch.setattr("sys.stdin", stdin)
+            parsed_args = argparse.Namespace(command="write", config=config_path, catalog=catalog_path)
+            assert list(destination.run_cmd(parsed_args)) == input_messages
+
+    def test_run_write_parses_any_text_stream(self, mocker, destination: Destination, tmp_path):
+        catalog_path = tmp_path / "catalog.json"
+        write_file(catalog_path, ConfiguredAirbyteCatalog(streams=[]).json())
+        input_message = _wrapped(_state({"k1": "v1"}))
+        mocker.patch.object(destination, "write", side_effect=lambda config, configured_catalog, input_messages: list(input_messages))
+
+        output = destination._run_write({}, str(catalog_path), io.StringIO(input_message.json(exclude_unset=True)))
+
+        assert list(output) == [input_message]
+
     @pytest.mark.parametrize("args", [{}, {"command": "fake"}])
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+    def test_lightweight_record_parsing(self, mocker, destination: Destination):
+        mocker.patch.object(destination, "lightweight_record_parsing", True)
+        input_messages: List[AirbyteMessage] = [
+            _wrapped(_record("s1", {"k1": "v1", "nested": {"k": [1, 2]}})),
+            _wrapped(_state({"k1": "v1"})),
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace="ns", stream="s2", data={}, emitted_at=1)),
+        ]
+        lines = [message.json(exclude_unset=True) for message in input_messages]
+        lines += [
+            "this is not json",
+            '["not", "an", "object"]',
+            # RECORD envelopes which are not valid are left to the full validation
+            '{"type": "RECORD", "record": {"stream": "s1", "data": "not an object", "emitted_at": 1}}',
+            '{"type": "UNKNOWN"}',
+        ]
+        input_stream = io.BufferedReader(io.BytesIO("\n".join(lines).encode("utf-8")))
+
+        parsed_messages = list(destination._parse_input_stream_lightweight(input_stream))
+
+        assert parsed_messages == input_messages
+        assert parsed_messages[0].record.data == {"k1": "v1", "nested": {"k": [1, 2]}}
+        assert parsed_messages[2].record.namespace == "ns"
+
+    def test_lightweight_record_parsing_logs_malformed_lines_as_text(self, caplog, destination: Destination):
+        input_stream = io.BufferedReader(io.BytesIO("this is not json\n".encode("utf-8")))
+
+        assert list(destination._parse_input_stream_lightweight(input_stream)) == []
+        assert "Airbyte Message: this is not json" in caplog.text
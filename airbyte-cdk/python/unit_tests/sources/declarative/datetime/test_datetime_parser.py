@@ -24,6 +24,22 @@ from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimePar
             datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc),
         ),
         ("test_parse_date_number", "20210101", "%Y%m%d", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)),
+        (
+            "test_parse_timestamp_in_milliseconds",
+            "1609459200123",
+            "%ms",
+            datetime.datetime(2021, 1, 1, 0, 0, 0, 123000, tzinfo=datetime.timezone.utc),
+        ),
+        ("test_parse_integer_timestamp", 1609459200, "%s", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)),
+        (
+            "test_parse_offset_is_replaced_by_timezone",
+            "2021-01-01T10:30:00.5+05:30",
+            "%Y-%m-%dT%H:%M:%S.%f%z",
+            datetime.datetime(2021, 1, 1, 10, 30, 0, 500000, tzinfo=datetime.timezone.utc),
+        ),
+        ("test_parse_unpadded_date", "2021-1-5", "%Y-%m-%d", datetime.datetime(2021, 1, 5, tzinfo=datetime.timezone.utc)),
+        ("test_parse_month_name", "05 Jan 2021", "%d %b %Y", datetime.datetime(2021, 1, 5, tzinfo=datetime.timezone.utc)),
+        ("test_parse_missing_fields", "10:30", "%H:%M", datetime.datetime(1900, 1, 1, 10, 30, tzinfo=datetime.timezone.utc)),
     ],
 )
 def test_parse_date(test_name, input_date, date_format, expected_output_date):
@@ -38,9 +54,58 @@ def test_parse_date(test_name, input_date, date_format, expected_output_date):
         ("test_format_timestamp", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), "%s", "1609459200"),
         ("test_format_string", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), "%Y-%m-%d", "2021-01-01"),
         ("test_format_to_number", datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), "%Y%m%d", "20210101"),
+        (
+            "test_format_timestamp_in_milliseconds",
+            datetime.datetime(2021, 1, 1, 0, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+            "%ms",
+            "1609459200123",
+        ),
     ],
 )
 def test_format_datetime(test_name, input_dt, datetimeformat, expected_output):
     parser = DatetimeParser()
     output_date = parser.format(input_dt, datetimeformat)
     assert expected_output == output_date
+
+
+@pytest.mark.parametrize(
+    "date_format",
+    ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%Y%m%d", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y", "%m-%d", "%Y %%"],
+)
+@pytest.mark.parametrize(
+    "input_date",
+    [
+        "2021-01-01T10:11:12.123456+0000",
+        "2021-01-01T10:11:12.1Z",
+        "2021-01-01t10:11:12z",
+        "2021-01-01T24:00:00Z",
+        "2021-01-01T10:11:12+2400",
+        "2021-01-01",
+        "2021-1-1",
+        "2021-02-30",
+        "20211231",
+        "2021111",
+        "2021-01-01  10:11:12",
+        "31/12/2021",
+        "02-29",
+        "2021 %",
+        " 2021-01-01",
+    ],
+)
+def test_parse_is_the_same_as_strptime(date_format, input_date):
+    try:
+        expected = datetime.datetime.strptime(input_date, date_format).replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        with pytest.raises(ValueError):
+            DatetimeParser().parse(input_date, date_format, datetime.timezone.utc)
+    else:
+        assert DatetimeParser().parse(input_date, date_format, datetime.timezone.utc) == expected
+
+
+def test_parsed_values_are_cached(mocker):
+    strptime = mocker.patch("airbyte_cdk.sources.declarative.datetime.datetime_parser._parse_with_strptime")
+    parser = DatetimeParser()
+
+    for _ in range(3):
+        parser.parse("Jan 01 2030", "%b %d %Y", datetime.timezone.utc)
+    assert strptime.call_count == 1
@@ -2,12 +2,16 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 
+import dpath.util
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 
 config = {"field": "record_array"}
 options = {"options_field": "record_array"}
@@ -26,6 +30,12 @@ decoder = JsonDecoder(options={})
         ("test_field_in_config", ["{{ config['field'] }}"], {"record_array": [{"id": 1}, {"id": 2}]}, [{"id": 1}, {"id": 2}]),
         ("test_field_in_options", ["{{ options['options_field'] }}"], {"record_array": [{"id": 1}, {"id": 2}]}, [{"id": 1}, {"id": 2}]),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
+        ("test_index_in_array", ["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        ("test_index_out_of_array", ["data", "2"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        ("test_field_of_a_string", ["data", "id"], {"data": "string"}, []),
+        ("test_empty_object", ["data"], {"data": {}}, []),
+        ("test_null", ["data"], {"data": None}, []),
+        ("test_glob", ["data", "*", "records"], {"data": {"first": {"records": [{"id": 1}]}}}, [{"id": 1}]),
     ],
 )
 def test_dpath_extractor(test_name, field_pointer, body, expected_records):
@@ -41,3 +51,90 @@ def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
     return response
+
+
+def create_streamed_response(body):
+    response = requests.Response()
+    response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+    return response
+
+
+@pytest.mark.parametrize(
+    "field_pointer, body",
+    [
+        (["data"], {"data": [{"id": 1}, {"id": 2}]}),
+        (["data", "1"], {"data": [{"id": 1}, {"id": 2}]}),
+        (["data", "-1"], {"data": [{"id": 1}, {"id": 2}]}),
+        (["data", "01"], {"data": [{"id": 1}, {"id": 2}]}),
+        (["data", "1"], {"data": {"1": {"id": 1}}}),
+        (["data", "id"], {"data": [{"id": 1}]}),
+        (["data", "id"], {"data": 1}),
+        (["data", "id"], {"data": None}),
+        (["data", "id"], {"data": True}),
+        (["data", "*"], {"data": {"a": 1}}),
+        (["a", "b", "c"], {"a": {"b": {"c": [1, {}, None]}}}),
+        ([], [1, 2]),
+    ],
+)
+def test_extraction_is_the_same_as_dpath(field_pointer, body):
+    extractor = DpathExtractor(field_pointer=list(field_pointer), config=config, decoder=decoder, options=options)
+
+    expected = dpath.util.get(body, field_pointer, default=[]) if field_pointer else body
+    if isinstance(expected, list):
+        expected_records = expected
+    else:
+        expected_records = [expected] if expected else []
+    assert extractor.extract_records(create_response(body)) == expected_records
+
+
+def test_field_pointer_is_interpolated_once(mocker):
+    eval_pointer = mocker.spy(InterpolatedString, "eval")
+    extractor = DpathExtractor(field_pointer=["{{ config['field'] }}"], config=config, decoder=decoder, options=options)
+
+    for _ in range(3):
+        assert extractor.extract_records(create_response({"record_array": [{"id": 1}]})) == [{"id": 1}]
+    assert eval_pointer.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "field_pointer, body, expected_records",
+    [
+        (["data"], {"data": [{"id": 1}, {"id": 2.5}, {}], "next": "token"}, [{"id": 1}, {"id": 2.5}, {}]),
+        (
+            ["data", "records"],
+            {"meta": {"records": [1]}, "data": {"records": [{"nested": [1, {"a": None}]}]}},
+            [{"nested": [1, {"a": None}]}],
+        ),
+        (["data"], {"data": {"id": 1}}, [{"id": 1}]),
+        (["data"], {"data": {}}, []),
+        (["data"], {"data": None}, []),
+        (["data"], {"other": [1]}, []),
+        (["data", "records"], {"data": [{"records": [1]}]}, []),
+        ([], [{"id": 1}, {"id": 2}], [{"id": 1}, {"id": 2}]),
+        ([], {"id": 1}, [{"id": 1}]),
+        (["{{ config['field'] }}"], {"record_array": [{"id": 1}]}, [{"id": 1}]),
+    ],
+)
+def test_streaming_extraction(field_pointer, body, expected_records):
+    pytest.importorskip("ijson")
+    extractor = DpathExtractor(field_pointer=field_pointer, config=config, decoder=StreamingJsonDecoder(options={}), options=options)
+
+    assert extractor.extract_records(create_streamed_response(body)) == expected_records
+
+
+def test_streaming_extraction_of_globs_fails():
+    pytest.importorskip("ijson")
+    extractor = DpathExtractor(field_pointer=["data", "*"], config=config, decoder=StreamingJsonDecoder(options={}), options=options)
+
+    with pytest.raises(ValueError):
+        extractor.extract_records(create_streamed_response({"data": {"a": [1]}}))
+
+
+def test_extraction_with_streaming_decoder():
+    pytest.importorskip("ijson")
+    streaming_decoder = StreamingJsonDecoder(options={})
+    extractor = DpathExtractor(field_pointer=["data", "records"], config=config, decoder=streaming_decoder, options=options)
+    response = create_streamed_response({"data": {"records": [{"id": 1}, {"id": 2}]}, "next": "token"})
+
+    assert extractor.extract_records(response) == [{"id": 1}, {"id": 2}]
+    assert streaming_decoder.decode(response) == {"data": {"records": []}, "next": "token"}
@@ -39,3 +39,16 @@ config = {
 def test_interpolated_boolean(test_name, template, expected_result):
     interpolated_bool = InterpolatedBoolean(condition=template, options={"from_options": "come_find_me"})
     assert interpolated_bool.eval(config) == expected_result
+
+
+@pytest.mark.parametrize(
+    "condition",
+    ["{{ record['id'] > 1 }}", "{{ record.missing }}", "{{ record['name'] == config['string_key'] }}", "{{ record['tags'] }}", True, False],
+)
+def test_record_evaluator(condition):
+    records = [{"id": 1, "name": "compare_me", "tags": []}, {"id": 2, "name": "other", "tags": ["a"]}]
+    interpolated_bool = InterpolatedBoolean(condition=condition, options={})
+
+    evaluate = interpolated_bool.record_evaluator(config)
+
+    assert [evaluate(record) for record in records] == [interpolated_bool.eval(config, record=record) for record in records]
@@ -78,3 +78,57 @@ def test_macros(test_name, s, expected_value):
     config = {}
     val = interpolation.eval(s, config)
     assert val == expected_value
+
+
+def test_templates_are_compiled_once(mocker):
+    from_string = mocker.spy(JinjaInterpolation._environment, "from_string")
+    s = "{{ config['name'] }} compiled once"
+
+    values = [JinjaInterpolation().eval(s, {"name": name}) for name in ["first", "second"]]
+
+    assert values == ["first compiled once", "second compiled once"]
+    assert [c.args[0] for c in from_string.call_args_list].count(s) <= 1
+
+
+@pytest.mark.parametrize(
+    "s, expected_value",
+    [
+        ("static string", "static string"),
+        ("42", 42),
+        ("trailing newline\n", "trailing newline"),
+        ("Bearer {{ config['token'] }}", "Bearer [1, 2]"),
+        ("{{ config['token'] }}", [1, 2]),
+        ("T{{ 'rue' }}", True),
+    ],
+)
+def test_literal_evaluation(s, expected_value):
+    assert interpolation.eval(s, {"token": "[1, 2]"}) == expected_value
+
+
+def test_static_mutable_values_are_not_shared():
+    first = interpolation.eval("[1, 2]", {})
+    first.append(3)
+
+    assert interpolation.eval("[1, 2]", {}) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "s, default, records",
+    [
+        ("{{ record['id'] }}", None, [{"id": 1}, {"id": "a"}, {"id": [1, 2]}]),
+        ("id-{{ record.id }}", None, [{"id": 1}, {"id": None}]),
+        ("{{ record.missing }}", "{{ config['token'] }}", [{"id": 1}, {}]),
+        ("{{ record.missing.nested }}", "default", [{"id": 1}, {"missing": {"nested": "found"}}]),
+        ("{% set x = record.id %}{{ x }}", None, [{"id": 1}, {"id": 2}]),
+        ("{% if record.id %}{% set x = record.id %}{% endif %}{{ x }}", "none", [{"id": 1}, {}, {"id": 3}]),
+        ("{{ record.id + 1 }}", None, [{"id": 1}, {"id": "a"}]),
+        ("static", None, [{"id": 1}]),
+    ],
+)
+def test_record_evaluator_evaluates_like_eval(s, default, records):
+    config = {"token": "[1, 2]"}
+    evaluate = interpolation.record_evaluator(s, config, default, stream_state={"cursor": 1})
+
+    assert [evaluate(record) for record in records] == [
+        interpolation.eval(s, config, default, record=record, stream_state={"cursor": 1}) for record in records
+    ]
@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import os
+
+from airbyte_cdk.sources.declarative.parsers import manifest_cache
+from airbyte_cdk.sources.declarative.parsers.manifest_cache import ManifestCache
+
+MANIFEST = """
+version: "0.1.0"
+streams: []
+"""
+
+
+def test_get_returns_the_cached_manifest(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    assert cache.get(MANIFEST) is None
+
+    cache.set(MANIFEST, {"version": "0.1.0", "streams": []})
+
+    assert ManifestCache(str(tmp_path)).get(MANIFEST) == {"version": "0.1.0", "streams": []}
+    assert cache.get(MANIFEST + "\n") is None
+    assert [name for name in os.listdir(tmp_path) if not name.endswith(".json")] == []
+
+
+def test_manifests_are_cached_per_cdk_version(tmp_path, monkeypatch):
+    ManifestCache(str(tmp_path)).set(MANIFEST, {"version": "0.1.0"})
+
+    monkeypatch.setattr(manifest_cache, "_package_version", lambda package: "0.0.1")
+    assert ManifestCache(str(tmp_path)).get(MANIFEST) is None
+
+    monkeypatch.setattr(manifest_cache, "_package_version", lambda package: None)
+    cache = ManifestCache(str(tmp_path))
+    cache.set(MANIFEST, {"version": "0.1.0"})
+    assert cache.get(MANIFEST) is None
+
+
+def test_manifests_are_cached_per_connector_version(tmp_path, monkeypatch):
+    versions = {"airbyte-cdk": "0.1.0", "source_foo": "1.0.0"}
+    monkeypatch.setattr(manifest_cache, "_package_version", lambda package: versions.get(package))
+    ManifestCache(str(tmp_path), connector_package="source_foo").set(MANIFEST, {"version": "0.1.0"})
+    assert ManifestCache(str(tmp_path), connector_package="source_foo").get(MANIFEST) == {"version": "0.1.0"}
+
+    versions["source_foo"] = "1.0.1"
+    assert ManifestCache(str(tmp_path), connector_package="source_foo").get(MANIFEST) is None
+
+    cache = ManifestCache(str(tmp_path), connector_package="source_not_installed")
+    cache.set(MANIFEST, {"version": "0.1.0"})
+    assert cache.get(MANIFEST) is None
+
+
+def test_manifests_changed_by_json_are_not_cached(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+
+    cache.set(MANIFEST, {"start_date": datetime.date(2021, 1, 1)})
+    assert cache.get(MANIFEST) is None
+    cache.set(MANIFEST, {"response_codes": {404: "ignore"}})
+    assert cache.get(MANIFEST) is None
+
+
+def test_unreadable_cache_files_are_ignored(tmp_path):
+    cache = ManifestCache(str(tmp_path))
+    cache.set(MANIFEST, {"version": "0.1.0"})
+    for name in os.listdir(tmp_path):
+        (tmp_path / name).write_text("{")
+
+    assert cache.get(MANIFEST) is None
+
+
+def test_cache_is_read_from_the_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("AIRBYTE_MANIFEST_CACHE_DIR", raising=False)
+    assert ManifestCache.from_environment() is None
+
+    monkeypatch.setenv("AIRBYTE_MANIFEST_CACHE_DIR", str(tmp_path))
+    assert ManifestCache.from_environment().directory == str(tmp_path)
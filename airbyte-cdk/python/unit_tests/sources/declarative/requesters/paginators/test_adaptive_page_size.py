@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import copy
+import datetime
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
+
+
+def create_response(seconds: float, size: int = 100) -> requests.Response:
+    response = requests.Response()
+    response.elapsed = datetime.timedelta(seconds=seconds)
+    response.headers["Content-Length"] = str(size)
+    response._content = b""
+    return response
+
+
+def read_pages(adaptive_page_size: AdaptivePageSize, seconds_per_page, number_of_pages: int):
+    """Reads full pages whose response time depends on their size, and returns the requested page sizes"""
+    page_sizes = []
+    for _ in range(number_of_pages):
+        page_size = adaptive_page_size.get_page_size(100)
+        page_sizes.append(page_size)
+        adaptive_page_size.page_read(page_size, create_response(seconds_per_page(page_size)), page_size)
+    return page_sizes
+
+
+def test_page_size_is_bounded():
+    assert AdaptivePageSize(min_page_size=10, max_page_size=50, options={}).get_page_size(100) == 50
+    assert AdaptivePageSize(min_page_size=200, max_page_size=500, options={}).get_page_size(100) == 200
+    with pytest.raises(ValueError):
+        AdaptivePageSize(min_page_size=100, max_page_size=10, options={})
+
+
+def test_page_size_increases_while_throughput_increases():
+    adaptive_page_size = AdaptivePageSize(min_page_size=10, max_page_size=1000, options={})
+
+    page_sizes = read_pages(adaptive_page_size, lambda page_size: 1, 6)
+
+    assert page_sizes == [100, 200, 400, 800, 1000, 1000]
+
+
+def test_page_size_settles_at_the_highest_throughput():
+    adaptive_page_size = AdaptivePageSize(min_page_size=10, max_page_size=10000, options={})
+
+    # pages larger than 400 records are answered much slower
+    page_sizes = read_pages(adaptive_page_size, lambda page_size: 1 if page_size <= 400 else page_size / 100, 8)
+
+    assert page_sizes == [100, 200, 400, 800, 400, 400, 400, 400]
+
+
+def test_short_pages_do_not_change_the_page_size():
+    adaptive_page_size = AdaptivePageSize(min_page_size=10, max_page_size=1000, options={})
+
+    adaptive_page_size.page_read(adaptive_page_size.get_page_size(100), create_response(1), 42)
+
+    assert adaptive_page_size.get_page_size(100) == 100
+
+
+@pytest.mark.parametrize(
+    "test_name, response",
+    [
+        ("test_slow_response", create_response(31)),
+        ("test_large_response", create_response(1, size=2_000_000)),
+    ],
+)
+def test_page_size_decreases_after_slow_or_large_responses(test_name, response):
+    adaptive_page_size = AdaptivePageSize(
+        min_page_size=10, max_page_size=1000, max_response_time=30, max_response_size=1_000_000, options={}
+    )
+    read_pages(adaptive_page_size, lambda page_size: 1, 2)
+    assert adaptive_page_size.get_page_size(100) == 400
+
+    adaptive_page_size.page_read(400, response, 400)
+
+    assert adaptive_page_size.get_page_size(100) == 200
+    # the page size is never increased again above the decreased one
+    assert read_pages(adaptive_page_size, lambda page_size: 1, 2) == [200, 200]
+
+
+def test_page_size_decreases_after_failures_down_to_the_min_page_size():
+    adaptive_page_size = AdaptivePageSize(min_page_size=30, max_page_size=1000, options={})
+
+    for expected_page_size in [50, 30, 30]:
+        adaptive_page_size.page_failed(adaptive_page_size.get_page_size(100))
+        assert adaptive_page_size.get_page_size(100) == expected_page_size
+
+
+def test_copies_share_the_page_size():
+    adaptive_page_size = AdaptivePageSize(min_page_size=10, max_page_size=1000, options={})
+
+    assert copy.deepcopy(adaptive_page_size) is adaptive_page_size
@@ -2,6 +2,8 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+import datetime
 import json
 from unittest.mock import MagicMock
 
@@ -9,8 +11,11 @@ import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
 from airbyte_cdk.sources.declarative.requesters.paginators.limit_paginator import LimitPaginator, RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 
 
 @pytest.mark.parametrize(
@@ -170,3 +175,70 @@ def test_reset():
     strategy = MagicMock()
     LimitPaginator(2, limit_request_option, page_token_request_option, strategy, config, url_base, options={}).reset()
     assert strategy.reset.called
+
+
+def create_adaptive_paginator(strategy):
+    return LimitPaginator(
+        page_size=100,
+        limit_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="limit", options={}),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", options={}),
+        pagination_strategy=strategy,
+        config={},
+        url_base="https://airbyte.io",
+        options={},
+        adaptive_page_size=AdaptivePageSize(min_page_size=10, max_page_size=1000, options={}),
+    )
+
+
+def create_page_response() -> requests.Response:
+    response = requests.Response()
+    response.elapsed = datetime.timedelta(seconds=1)
+    response._content = b"[]"
+    return response
+
+
+def test_adaptive_page_size_changes_within_slices():
+    paginator = create_adaptive_paginator(OffsetIncrement(page_size=100, options={}))
+    paginator.reset()
+    assert paginator.get_request_params() == {"limit": 100}
+
+    assert paginator.next_page_token(create_page_response(), [{"id": i} for i in range(100)]) == {"next_page_token": 100}
+    assert paginator.get_request_params() == {"limit": 200, "offset": 100}
+    # the pagination strategy gets the size of the requested pages, the slice ends with the first page smaller than them
+    assert paginator.next_page_token(create_page_response(), [{"id": i} for i in range(150)]) is None
+
+
+def test_adaptive_page_size_of_numbered_pages_changes_between_slices():
+    paginator = create_adaptive_paginator(PageIncrement(page_size=100, options={}))
+    paginator.reset()
+
+    assert paginator.next_page_token(create_page_response(), [{"id": i} for i in range(100)]) == {"next_page_token": 1}
+    assert paginator.get_request_params() == {"limit": 100, "offset": 1}
+    assert paginator.next_page_token(create_page_response(), [{"id": i} for i in range(10)]) is None
+
+    paginator.reset()
+    assert paginator.get_request_params() == {"limit": 200}
+
+
+def test_adaptive_page_size_decreases_after_failed_requests():
+    paginator = create_adaptive_paginator(OffsetIncrement(page_size=100, options={}))
+    copied_paginator = copy.deepcopy(paginator)
+    paginator.reset()
+
+    paginator.request_failed(None)
+
+    # the failed page is retried with the smaller page size
+    assert paginator.get_request_params() == {"limit": 50}
+    copied_paginator.reset()
+    assert copied_paginator.get_request_params() == {"limit": 50}
+
+
+def test_adaptive_page_size_of_numbered_pages_is_kept_after_failed_requests():
+    paginator = create_adaptive_paginator(PageIncrement(page_size=100, options={}))
+    paginator.reset()
+
+    paginator.request_failed(None)
+
+    assert paginator.get_request_params() == {"limit": 100}
+    paginator.reset()
+    assert paginator.get_request_params() == {"limit": 50}
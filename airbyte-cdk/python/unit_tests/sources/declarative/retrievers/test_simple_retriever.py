@@ -8,13 +8,22 @@ import airbyte_cdk.sources.declarative.requesters.error_handlers.response_status
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
+from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
+from airbyte_cdk.sources.declarative.requesters.paginators.limit_paginator import LimitPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.no_pagination import NoPagination
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from airbyte_cdk.sources.streams.http.auth import NoAuth
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException
 from airbyte_cdk.sources.streams.http.http import HttpStream
 
 primary_key = "pk"
@@ -341,3 +350,119 @@ def test_path(test_name, requester_path, paginator_path, expected_path):
 
     actual_path = retriever.path(stream_state=None, stream_slice=None, next_page_token=None)
     assert expected_path == actual_path
+
+
+def test_copy_has_its_own_paginator():
+    requester = MagicMock()
+    stream_slicer = MagicMock()
+    paginator = NoPagination(options={})
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=MagicMock(),
+        paginator=paginator,
+        stream_slicer=stream_slicer,
+        options={},
+    )
+    retriever._last_records = [{"id": 1}]
+
+    retriever_copy = retriever.copy()
+
+    assert retriever_copy.paginator is not paginator
+    assert retriever_copy.requester is requester
+    assert retriever_copy.stream_slicer is stream_slicer
+    assert retriever_copy._last_records is None
+    assert retriever._last_records == [{"id": 1}]
+
+
+@pytest.mark.parametrize(
+    "test_name, decoder_class, expected_stream_response",
+    [
+        ("test_json_decoder", JsonDecoder, False),
+        ("test_streaming_json_decoder", StreamingJsonDecoder, True),
+    ],
+)
+def test_stream_response(test_name, decoder_class, expected_stream_response):
+    pytest.importorskip("ijson")
+    extractor = DpathExtractor(field_pointer=["data"], config={}, decoder=decoder_class(options={}), options={})
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=MagicMock(),
+        record_selector=RecordSelector(extractor=extractor, options={}),
+        options={},
+    )
+
+    assert retriever.stream_response == expected_stream_response
+
+
+def create_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.parametrize(
+    "test_name, exception, expected_failed_response",
+    [
+        ("test_timeout", requests.exceptions.ReadTimeout(), None),
+        ("test_server_error", DefaultBackoffException(request=MagicMock(), response=create_response(503)), 503),
+        ("test_rate_limited", DefaultBackoffException(request=MagicMock(), response=create_response(429)), False),
+    ],
+)
+def test_paginator_is_notified_of_failed_requests(test_name, exception, expected_failed_response):
+    paginator = MagicMock()
+    retriever = SimpleRetriever(
+        name="stream_name", primary_key=primary_key, requester=MagicMock(), record_selector=MagicMock(), paginator=paginator, options={}
+    )
+
+    with patch.object(HttpStream, "_send", side_effect=exception):
+        with pytest.raises(type(exception)):
+            retriever._send(MagicMock(), {})
+
+    if expected_failed_response is False:
+        paginator.request_failed.assert_not_called()
+    elif expected_failed_response is None:
+        paginator.request_failed.assert_called_once_with(None)
+    else:
+        assert paginator.request_failed.call_args[0][0].status_code == expected_failed_response
+
+
+def test_failed_page_is_retried_with_a_smaller_page_size(mocker):
+    mocker.patch("time.sleep", lambda seconds: None)
+    requester = MagicMock()
+    requester.get_authenticator.return_value = NoAuth()
+    requester.get_url_base.return_value = "https://airbyte.io/"
+    requester.get_path.return_value = "v1"
+    requester.get_method.return_value = HttpMethod.GET
+    for get_request_options in ("get_request_params", "get_request_headers", "get_request_body_data", "get_request_body_json"):
+        getattr(requester, get_request_options).return_value = {}
+    requester.request_kwargs.return_value = {}
+    requester.use_cache = False
+    paginator = LimitPaginator(
+        page_size=100,
+        limit_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="limit", options={}),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", options={}),
+        pagination_strategy=OffsetIncrement(page_size=100, options={}),
+        config={},
+        url_base="https://airbyte.io/",
+        options={},
+        adaptive_page_size=AdaptivePageSize(min_page_size=10, max_page_size=1000, options={}),
+    )
+    paginator.reset()
+    retriever = SimpleRetriever(
+        name="stream_name", primary_key=primary_key, requester=requester, record_selector=MagicMock(), paginator=paginator, options={}
+    )
+    sent_urls = []
+
+    def send(stream, request, request_kwargs):
+        sent_urls.append(request.url)
+        if len(sent_urls) == 1:
+            raise requests.exceptions.ReadTimeout()
+        return requests.Response()
+
+    with patch.object(HttpStream, "_send", side_effect=send):
+        retriever._send_request(*retriever._create_page_request({}, None, None))
+
+    assert sent_urls == ["https://airbyte.io/v1?limit=100", "https://airbyte.io/v1?limit=50"]
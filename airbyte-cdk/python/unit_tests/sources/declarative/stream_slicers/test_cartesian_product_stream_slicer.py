@@ -2,6 +2,8 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import MagicMock
+
 import pytest as pytest
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
@@ -10,6 +12,9 @@ from airbyte_cdk.sources.declarative.requesters.request_option import RequestOpt
 from airbyte_cdk.sources.declarative.stream_slicers.cartesian_product_stream_slicer import CartesianProductStreamSlicer
 from airbyte_cdk.sources.declarative.stream_slicers.datetime_stream_slicer import DatetimeStreamSlicer
 from airbyte_cdk.sources.declarative.stream_slicers.list_stream_slicer import ListStreamSlicer
+from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
+from airbyte_cdk.sources.declarative.stream_slicers.substream_slicer import ParentStreamConfig, SubstreamSlicer
+from airbyte_cdk.sources.utils.concurrency import read_slices
 
 
 @pytest.mark.parametrize(
@@ -175,3 +180,118 @@ def test_request_option(
     assert expected_headers == slicer.get_request_headers()
     assert expected_body_json == slicer.get_request_body_json()
     assert expected_body_data == slicer.get_request_body_data()
+
+
+def test_stream_slices_are_generated_lazily():
+    generated_slices = []
+
+    def generate_slices(field, values):
+        for value in values:
+            generated_slices.append({field: value})
+            yield {field: value}
+
+    first_slicer = MagicMock(spec=StreamSlicer)
+    first_slicer.stream_slices.side_effect = lambda sync_mode, stream_state: generate_slices("i", range(1000))
+    second_slicer = MagicMock(spec=StreamSlicer)
+    second_slicer.stream_slices.side_effect = lambda sync_mode, stream_state: generate_slices("s", ["hello", "world"])
+    slicer = CartesianProductStreamSlicer(stream_slicers=[first_slicer, second_slicer], options={})
+
+    slices = iter(slicer.stream_slices(SyncMode.incremental, stream_state=None))
+
+    assert [next(slices), next(slices), next(slices)] == [{"i": 0, "s": "hello"}, {"i": 0, "s": "world"}, {"i": 1, "s": "hello"}]
+    # the slices of the second stream slicer are generated once, then reused for the next slices of the first one
+    assert generated_slices == [{"i": 0}, {"s": "hello"}, {"s": "world"}, {"i": 1}]
+    assert second_slicer.stream_slices.call_count == 1
+
+
+def test_substream_slicer_reads_its_parent_once():
+    parent_stream = MagicMock()
+    parent_stream.name = "parent"
+    parent_stream.stream_slices.return_value = [None]
+    parent_stream.read_records.side_effect = lambda **kwargs: iter([{"id": 1}, {"id": 2}])
+    substream_slicer = SubstreamSlicer(
+        parent_stream_configs=[ParentStreamConfig(stream=parent_stream, parent_key="id", stream_slice_field="parent_id", options={})],
+        options={},
+    )
+    list_slicer = ListStreamSlicer(slice_values=["customer", "store", "subscription"], cursor_field="owner_resource", config={}, options={})
+    slicer = CartesianProductStreamSlicer(stream_slicers=[list_slicer, substream_slicer], options={})
+
+    stream_slices = list(slicer.stream_slices(SyncMode.incremental, stream_state=None))
+
+    assert [dict(stream_slice) for stream_slice in stream_slices] == [
+        {"owner_resource": owner_resource, "parent_id": parent_id, "parent_slice": None}
+        for owner_resource in ["customer", "store", "subscription"]
+        for parent_id in [1, 2]
+    ]
+    assert parent_stream.read_records.call_count == 1
+
+
+def test_datetime_stream_slicer_generates_its_slices_once(mocker):
+    datetime_slicer = DatetimeStreamSlicer(
+        start_datetime=MinMaxDatetime(datetime="2021-01-01", datetime_format="%Y-%m-%d", options={}),
+        end_datetime=MinMaxDatetime(datetime="2021-01-03", datetime_format="%Y-%m-%d", options={}),
+        step="1d",
+        cursor_field=InterpolatedString.create("", options={}),
+        datetime_format="%Y-%m-%d",
+        config={},
+        options={},
+    )
+    generate_slices = mocker.spy(datetime_slicer, "stream_slices")
+    list_slicer = ListStreamSlicer(slice_values=["customer", "store", "subscription"], cursor_field="owner_resource", config={}, options={})
+    slicer = CartesianProductStreamSlicer(stream_slicers=[list_slicer, datetime_slicer], options={})
+
+    stream_slices = list(slicer.stream_slices(SyncMode.incremental, stream_state=None))
+
+    assert len(stream_slices) == 9
+    # the end datetime, e.g: now, is evaluated once for all the slices of the list stream slicer
+    assert generate_slices.call_count == 1
+
+
+def test_invalid_max_concurrent_slices():
+    with pytest.raises(ValueError):
+        CartesianProductStreamSlicer(stream_slicers=[], max_concurrent_slices=0, options={})
+
+
+def test_read_slices_concurrently():
+    request_option = RequestOption(inject_into=RequestOptionType.request_parameter, options={}, field_name="owner")
+    slicer = CartesianProductStreamSlicer(
+        stream_slicers=[
+            ListStreamSlicer(
+                slice_values=["customer", "store", "subscription"],
+                cursor_field="owner_resource",
+                config={},
+                request_option=request_option,
+                options={},
+            ),
+            DatetimeStreamSlicer(
+                start_datetime=MinMaxDatetime(datetime="2021-01-01", datetime_format="%Y-%m-%d", options={}),
+                end_datetime=MinMaxDatetime(datetime="2021-01-31", datetime_format="%Y-%m-%d", options={}),
+                step="1d",
+                cursor_field=InterpolatedString(string="date", options={}),
+                datetime_format="%Y-%m-%d",
+                config={},
+                options={},
+            ),
+        ],
+        max_concurrent_slices=8,
+        options={},
+    )
+
+    def read_slice(stream_slice):
+        # as the SimpleRetriever reading the slice does
+        request_params = slicer.get_request_params(stream_slice=stream_slice)
+        record = {"owner": request_params["owner"], "date": stream_slice["start_time"]}
+        slicer.update_cursor(stream_slice, last_record=record)
+        yield record
+
+    stream_slices = slicer.stream_slices(SyncMode.incremental, stream_state=None)
+    records = [
+        record
+        for _, slice_records in read_slices(stream_slices, read_slice, max_concurrent_slices=slicer.max_concurrent_slices)
+        for record in slice_records
+    ]
+
+    assert records == [
+        {"owner": owner, "date": f"2021-01-{day:02d}"} for owner in ["customer", "store", "subscription"] for day in range(1, 32)
+    ]
+    assert slicer.get_stream_state()["date"] == "2021-01-31"
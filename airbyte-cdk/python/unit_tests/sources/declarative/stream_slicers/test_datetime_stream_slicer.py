@@ -291,6 +291,85 @@ def test_stream_slices(
     assert expected_slices == stream_slices
 
 
+def create_adaptive_slicer(**kwargs):
+    return DatetimeStreamSlicer(
+        start_datetime=MinMaxDatetime(datetime="2021-01-01", options={}),
+        end_datetime=MinMaxDatetime(datetime="2021-12-31", options={}),
+        step="1d",
+        cursor_field=cursor_field,
+        datetime_format="%Y-%m-%d",
+        config=config,
+        options={},
+        **kwargs,
+    )
+
+
+def read_slices(slicer, records_per_day):
+    """Reads the slices of the slicer as the retriever does, and returns them"""
+    stream_slices = []
+    for stream_slice in slicer.stream_slices(SyncMode.incremental, None):
+        stream_slices.append(stream_slice)
+        start = datetime.date.fromisoformat(stream_slice["start_time"])
+        end = datetime.date.fromisoformat(stream_slice["end_time"])
+        records = [
+            {cursor_field: (start + datetime.timedelta(days=day)).isoformat()}
+            for day in range((end - start).days + 1)
+            for _ in range(records_per_day(start + datetime.timedelta(days=day)))
+        ]
+        for record in records:
+            slicer.update_cursor(stream_slice, last_record=record)
+        slicer.update_cursor(stream_slice, last_record=records[-1] if records else None)
+    return stream_slices
+
+
+def test_adaptive_step(mock_datetime_now):
+    slicer = create_adaptive_slicer(target_records_per_slice=100, max_step="8w")
+
+    # 10 records per day in the first half of the year, then 100
+    stream_slices = read_slices(slicer, lambda day: 10 if day.month <= 6 else 100)
+
+    assert stream_slices[:5] == [
+        {"start_time": "2021-01-01", "end_time": "2021-01-01"},
+        {"start_time": "2021-01-02", "end_time": "2021-01-05"},
+        {"start_time": "2021-01-06", "end_time": "2021-01-15"},
+        {"start_time": "2021-01-16", "end_time": "2021-01-25"},
+        {"start_time": "2021-01-26", "end_time": "2021-02-04"},
+    ]
+    assert [stream_slice for stream_slice in stream_slices if stream_slice["start_time"] >= "2021-08-01"][:3] == [
+        {"start_time": "2021-08-01", "end_time": "2021-08-01"},
+        {"start_time": "2021-08-02", "end_time": "2021-08-02"},
+        {"start_time": "2021-08-03", "end_time": "2021-08-03"},
+    ]
+    # the slices cover the whole range without overlapping
+    assert stream_slices[0]["start_time"] == "2021-01-01"
+    assert stream_slices[-1]["end_time"] == "2021-12-31"
+    for stream_slice, next_stream_slice in zip(stream_slices, stream_slices[1:]):
+        end = datetime.date.fromisoformat(stream_slice["end_time"])
+        assert next_stream_slice["start_time"] == (end + datetime.timedelta(days=1)).isoformat()
+    assert slicer.get_stream_state() == {cursor_field: "2021-12-31"}
+
+
+def test_adaptive_step_is_bounded(mock_datetime_now):
+    slicer = create_adaptive_slicer(target_records_per_slice=100, min_step="2d", max_step="1w")
+
+    stream_slices = read_slices(slicer, lambda day: 0 if day.month == 1 else 1000)
+
+    steps = [
+        (datetime.date.fromisoformat(stream_slice["end_time"]) - datetime.date.fromisoformat(stream_slice["start_time"])).days + 1
+        for stream_slice in stream_slices
+    ]
+    assert steps[:4] == [1, 4, 7, 7]
+    assert set(steps[10:-1]) == {2}
+
+
+def test_adaptive_step_is_kept_for_slices_generated_before_being_read(mock_datetime_now):
+    slicer = create_adaptive_slicer(target_records_per_slice=100)
+
+    stream_slices = list(slicer.stream_slices(SyncMode.incremental, None))
+
+    assert len(stream_slices) == 365
+
+
 @pytest.mark.parametrize(
     "test_name, previous_cursor, stream_slice, last_record, expected_state",
     [
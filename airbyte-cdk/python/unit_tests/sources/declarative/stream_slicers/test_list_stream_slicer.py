@@ -116,3 +116,12 @@ def test_request_option(test_name, request_option, expected_req_params, expected
     assert expected_headers == slicer.get_request_headers()
     assert expected_body_json == slicer.get_request_body_json()
     assert expected_body_data == slicer.get_request_body_data()
+
+
+def test_request_option_is_the_value_of_the_stream_slice():
+    request_option = RequestOption(inject_into=RequestOptionType.request_parameter, options={}, field_name="owner_resource")
+    slicer = ListStreamSlicer(slice_values=slice_values, cursor_field=cursor_field, config={}, request_option=request_option, options={})
+
+    slicer.update_cursor({cursor_field: "customer"})
+
+    assert slicer.get_request_params(stream_slice={cursor_field: "store"}) == {"owner_resource": "store"}
@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.sources.declarative.stream_slicers.parent_record_cache import ParentRecordCache
+
+records = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+class Parent:
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Parent) and self.name == other.name
+
+
+def test_equal_parents_are_registered_once():
+    cache = ParentRecordCache()
+
+    assert cache.register(Parent("a")) == cache.register(Parent("a"))
+    assert cache.register(Parent("b")) != cache.register(Parent("a"))
+
+
+def test_parent_read_by_a_single_slicer_is_not_cached():
+    cache = ParentRecordCache()
+    parent_key = cache.register(Parent("a"))
+    read_records = MagicMock(side_effect=lambda: iter(records))
+
+    assert list(cache.read_records(parent_key, {}, read_records)) == records
+    assert list(cache.read_records(parent_key, {}, read_records)) == records
+    assert read_records.call_count == 2
+
+
+@pytest.mark.parametrize("max_records_in_memory", [10, 1, 0])
+def test_shared_parent_slices_are_read_once(max_records_in_memory):
+    cache = ParentRecordCache(max_records_in_memory=max_records_in_memory)
+    parent_key = cache.register(Parent("a"))
+    cache.register(Parent("a"))
+    read_records = MagicMock(side_effect=lambda: iter(records))
+
+    assert list(cache.read_records(parent_key, {"slice": 1}, read_records)) == records
+    assert list(cache.read_records(parent_key, {"slice": 1}, read_records)) == records
+    assert read_records.call_count == 1
+    # every slicer read the slice, it isn't kept anymore
+    assert list(cache.read_records(parent_key, {"slice": 1}, read_records)) == records
+    assert read_records.call_count == 2
+
+
+def test_slices_are_cached_separately():
+    cache = ParentRecordCache()
+    parent_key = cache.register(Parent("a"))
+    cache.register(Parent("a"))
+    read_records = MagicMock(side_effect=lambda: iter(records))
+
+    list(cache.read_records(parent_key, {"slice": 1}, read_records))
+    list(cache.read_records(parent_key, {"slice": 2}, read_records))
+
+    assert read_records.call_count == 2
+
+
+def test_partially_read_slices_are_not_replayed():
+    cache = ParentRecordCache()
+    parent_key = cache.register(Parent("a"))
+    cache.register(Parent("a"))
+    read_records = MagicMock(side_effect=lambda: iter(records))
+
+    partial_read = cache.read_records(parent_key, {}, read_records)
+    next(partial_read)
+    partial_read.close()
+
+    assert list(cache.read_records(parent_key, {}, read_records)) == records
+    assert read_records.call_count == 2
+
+
+def test_slice_read_while_it_is_being_cached_is_read_from_the_parent():
+    cache = ParentRecordCache()
+    parent_key = cache.register(Parent("a"))
+    cache.register(Parent("a"))
+    read_records = MagicMock(side_effect=lambda: iter(records))
+
+    first_read = cache.read_records(parent_key, {}, read_records)
+    next(first_read)
+
+    assert list(cache.read_records(parent_key, {}, read_records)) == records
+    assert list(first_read) == records[1:]
+    assert read_records.call_count == 2
@@ -3,10 +3,12 @@
 #
 
 from typing import Any, Iterable, List, Mapping, Optional, Union
+from unittest.mock import MagicMock
 
 import pytest as pytest
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
+from airbyte_cdk.sources.declarative.stream_slicers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.stream_slicers.substream_slicer import ParentStreamConfig, SubstreamSlicer
 from airbyte_cdk.sources.streams.core import Stream
 
@@ -264,3 +266,44 @@ def test_request_option(
     assert expected_headers == slicer.get_request_headers()
     assert expected_body_json == slicer.get_request_body_json()
     assert expected_body_data == slicer.get_request_body_data()
+
+
+def test_request_option_of_the_stream_slice():
+    slicer = SubstreamSlicer(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream(parent_slices, all_parent_data, "first_stream"),
+                parent_key="id",
+                stream_slice_field="first_stream_id",
+                options={},
+                request_option=RequestOption(inject_into=RequestOptionType.request_parameter, options={}, field_name="first_stream"),
+            )
+        ],
+        options={},
+    )
+    slicer.update_cursor({"first_stream_id": "1234"}, None)
+
+    assert slicer.get_request_params(stream_slice={"first_stream_id": "4567", "parent_slice": {}}) == {"first_stream_id": "4567"}
+
+
+def test_slicers_sharing_a_parent_read_it_once():
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    read_records = parent_stream.read_records
+    parent_stream.read_records = MagicMock(side_effect=read_records)
+    slicers = [
+        SubstreamSlicer(
+            parent_stream_configs=[ParentStreamConfig(stream=parent_stream, parent_key="id", stream_slice_field=field, options={})],
+            options={},
+        )
+        for field in ["first_stream_id", "other_id"]
+    ]
+    parent_record_cache = ParentRecordCache()
+    for slicer in slicers:
+        slicer.share_parent_records(parent_record_cache)
+
+    first_slices = list(slicers[0].stream_slices(SyncMode.full_refresh, None))
+    other_slices = list(slicers[1].stream_slices(SyncMode.full_refresh, None))
+
+    assert [s["first_stream_id"] for s in first_slices] == [0, 1, 2, None]
+    assert [s["other_id"] for s in other_slices] == [0, 1, 2, None]
+    assert parent_stream.read_records.call_count == len(parent_slices)
@@ -2,12 +2,23 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import logging
+import threading
 from unittest import mock
 from unittest.mock import MagicMock, call
 
-from airbyte_cdk.models import SyncMode
+import pytest
+import requests
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
+from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import SUCCESS
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.sources.declarative.stream_slicers.cartesian_product_stream_slicer import CartesianProductStreamSlicer
+from airbyte_cdk.sources.declarative.stream_slicers.list_stream_slicer import ListStreamSlicer
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.auth import NoAuth
 
 
 def test_declarative_stream():
@@ -60,3 +71,145 @@ def test_declarative_stream():
         assert len(transformation.transform.call_args_list) == len(records)
         expected_calls = [call(record, config=config, stream_slice=input_slice, stream_state=state) for record in records]
         transformation.transform.assert_has_calls(expected_calls, any_order=False)
+
+
+def test_declarative_stream_transforms_pages_of_simple_retriever():
+    requester = MagicMock()
+    requester.should_retry.return_value = SUCCESS
+    record_selector = MagicMock()
+    records = [{"pk": 1234, "field": "value"}, {"pk": 4567, "field": "different_value"}]
+    record_selector.select_records.return_value = records
+    retriever = SimpleRetriever(name="stream", primary_key="pk", requester=requester, record_selector=record_selector, options={})
+
+    transformation = mock.create_autospec(spec=RecordTransformation)
+    transformation.transform_records = MagicMock(side_effect=lambda records, **kwargs: [{**record, "added": 1} for record in records])
+    config = {"api_key": "open_sesame"}
+    DeclarativeStream(
+        name="stream",
+        primary_key="pk",
+        schema_loader=MagicMock(),
+        retriever=retriever,
+        config=config,
+        transformations=[transformation],
+        options={},
+    )
+
+    stream_slice = {"date": "2021-01-01"}
+    parsed_records = retriever.parse_response(requests.Response(), stream_state={}, stream_slice=stream_slice)
+
+    assert parsed_records == [{**record, "added": 1} for record in records]
+    transformation.transform_records.assert_called_once_with(records, config=config, stream_state={}, stream_slice=stream_slice)
+    transformation.transform.assert_not_called()
+
+
+def test_declarative_stream_reads_concurrent_slices_with_copies_of_its_retriever():
+    retriever = MagicMock(spec=SimpleRetriever)
+    retriever_copy = retriever.copy.return_value
+    retriever_copy.read_records.return_value = [{"pk": 1234}]
+    stream = DeclarativeStream(
+        name="stream",
+        primary_key="pk",
+        schema_loader=MagicMock(),
+        retriever=retriever,
+        config={},
+        max_concurrent_slices=4,
+        options={},
+    )
+
+    assert stream.max_concurrent_slices == 4
+    assert list(stream.read_records(SyncMode.full_refresh, stream_slice={"id": 1})) == [{"pk": 1234}]
+    retriever.read_records.assert_not_called()
+
+
+def test_declarative_stream_reads_concurrent_slices_only_with_a_simple_retriever():
+    with pytest.raises(ValueError):
+        DeclarativeStream(
+            name="stream",
+            primary_key="pk",
+            schema_loader=MagicMock(),
+            retriever=MagicMock(),
+            config={},
+            max_concurrent_slices=4,
+            options={},
+        )
+
+
+@pytest.mark.parametrize(
+    "test_name, stream_max_concurrent_slices, expected_max_concurrent_slices",
+    [
+        ("test_stream_slicer_max_concurrent_slices", None, 8),
+        ("test_stream_max_concurrent_slices", 2, 2),
+    ],
+)
+def test_declarative_stream_reads_concurrent_slices_of_a_cartesian_product(
+    test_name, stream_max_concurrent_slices, expected_max_concurrent_slices
+):
+    retriever = MagicMock(spec=SimpleRetriever)
+    retriever.stream_slicer = CartesianProductStreamSlicer(stream_slicers=[], max_concurrent_slices=8, options={})
+    stream = DeclarativeStream(
+        name="stream",
+        primary_key="pk",
+        schema_loader=MagicMock(),
+        retriever=retriever,
+        config={},
+        max_concurrent_slices=stream_max_concurrent_slices,
+        options={},
+    )
+
+    assert stream.max_concurrent_slices == expected_max_concurrent_slices
+
+
+def test_incremental_read_of_concurrent_slices_checkpoints_the_cursor_in_slice_order():
+    class Source(AbstractSource):
+        def check_connection(self, logger, config):
+            return True, None
+
+        def streams(self, config):
+            return [stream]
+
+    days = ["2022-01-01", "2022-01-02", "2022-01-03", "2022-01-04"]
+    requester = MagicMock()
+    requester.get_authenticator.return_value = NoAuth()
+    retriever = SimpleRetriever(
+        name="stream",
+        primary_key="pk",
+        requester=requester,
+        record_selector=MagicMock(),
+        stream_slicer=ListStreamSlicer(slice_values=days, cursor_field="day", config={}, options={}),
+        options={},
+    )
+    schema_loader = MagicMock()
+    schema_loader.get_json_schema.return_value = {}
+    stream = DeclarativeStream(
+        name="stream",
+        primary_key="pk",
+        schema_loader=schema_loader,
+        retriever=retriever,
+        config={},
+        stream_cursor_field=["day"],
+        max_concurrent_slices=4,
+        options={},
+    )
+    last_day_read = threading.Event()
+
+    def read_records(retriever, sync_mode, cursor_field, stream_slice, stream_state):
+        # the slices are read in reverse order, the first one once the others are read
+        if stream_slice["day"] == days[0]:
+            assert last_day_read.wait(timeout=5)
+        yield {"pk": stream_slice["day"]}
+        if stream_slice["day"] == days[-1]:
+            last_day_read.set()
+
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=stream.as_airbyte_stream(), sync_mode=SyncMode.incremental, destination_sync_mode=DestinationSyncMode.append
+            )
+        ]
+    )
+    with mock.patch.object(HttpStream, "read_records", side_effect=read_records):
+        messages = list(Source().read(logging.getLogger("airbyte"), {}, catalog, state={}))
+
+    assert [message.record.data for message in messages if message.type == Type.RECORD] == [{"pk": day} for day in days]
+    assert [message.state.data["stream"] for message in messages if message.type == Type.STATE] == [{"day": day} for day in days]
+    assert stream.state == {"day": days[-1]}
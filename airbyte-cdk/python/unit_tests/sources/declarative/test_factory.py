@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import datetime
 from typing import List, Optional, Union
 
@@ -27,6 +28,7 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.composite_error_h
 from airbyte_cdk.sources.declarative.requesters.error_handlers.default_error_handler import DefaultErrorHandler
 from airbyte_cdk.sources.declarative.requesters.error_handlers.http_response_filter import HttpResponseFilter
 from airbyte_cdk.sources.declarative.requesters.http_requester import HttpRequester
+from airbyte_cdk.sources.declarative.requesters.paginators.adaptive_page_size import AdaptivePageSize
 from airbyte_cdk.sources.declarative.requesters.paginators.limit_paginator import LimitPaginator
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.request_options.interpolated_request_options_provider import (
@@ -378,6 +380,43 @@ check:
     assert stream.retriever.requester.path.default == "marketing/lists"
 
 
+def test_create_component_does_not_modify_definitions():
+    content = """
+    requester:
+      type: HttpRequester
+      url_base: "https://api.sendgrid.com/v3/"
+      path: "{{ options.name }}"
+      authenticator:
+        type: BearerAuthenticator
+        api_token: "{{ config['apikey'] }}"
+    lists_stream:
+      type: DeclarativeStream
+      $options:
+        name: "lists"
+        primary_key: "id"
+      schema_loader:
+        file_path: "./source_sendgrid/schemas/{{ options.name }}.json"
+      retriever:
+        requester: "*ref(requester)"
+        record_selector:
+          extractor:
+            field_pointer: ["result"]
+      cursor_field: []
+    """
+    config = parser.parse(content)
+    definitions = copy.deepcopy(config)
+
+    factory.create_component(config["lists_stream"], input_config, False)
+    first_stream = factory.create_component(config["lists_stream"], input_config)()
+    second_stream = factory.create_component(config["lists_stream"], input_config)()
+
+    assert config == definitions
+    assert first_stream.retriever.requester.path.eval(input_config) == "lists"
+    assert first_stream.retriever.requester.authenticator._token.eval(input_config) == "verysecrettoken"
+    assert [fp.eval(input_config) for fp in first_stream.retriever.record_selector.extractor.field_pointer] == ["result"]
+    assert first_stream.retriever.requester is not second_stream.retriever.requester
+
+
 def test_create_record_selector():
     content = """
     extractor:
@@ -548,6 +587,35 @@ def test_create_limit_paginator():
     assert page_token_option.inject_into == RequestOptionType.path
 
 
+def test_create_limit_paginator_with_adaptive_page_size():
+    content = """
+      paginator:
+        type: "LimitPaginator"
+        page_size: 10
+        url_base: "https://airbyte.io"
+        adaptive_page_size:
+          min_page_size: 10
+          max_page_size: 1000
+          max_response_time: 30
+        limit_option:
+          inject_into: request_parameter
+          field_name: page_size
+        page_token_option:
+          inject_into: path
+        pagination_strategy:
+          type: "CursorPagination"
+          cursor_value: "{{ response._metadata.next }}"
+    """
+    config = parser.parse(content)
+
+    factory.create_component(config["paginator"], input_config, False)
+
+    paginator = factory.create_component(config["paginator"], input_config)()
+    assert isinstance(paginator.adaptive_page_size, AdaptivePageSize)
+    assert paginator.adaptive_page_size.max_page_size == 1000
+    assert paginator.adaptive_page_size.max_response_time == 30
+
+
 class TestCreateTransformations:
     # the tabbing matters
     base_options = """
@@ -6,6 +6,7 @@ import json
 
 # import pytest
 # from airbyte_cdk.sources.declarative.exceptions import InvalidConnectorDefinitionException
+from airbyte_cdk.sources.declarative.parsers import manifest_cache
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
 
 # import os
@@ -386,3 +387,49 @@ def test_generate_schema():
     #
     # exponential_backoff_strategy = schema["definitions"]["ExponentialBackoffStrategy"]["allOf"][1]
     # assert exponential_backoff_strategy["properties"]["factor"]["type"] == "number"
+
+
+def test_manifest_is_validated_once(tmp_path, monkeypatch):
+    manifest = """
+    version: "version"
+    definitions:
+      check_stream_names: ["lists"]
+    streams: []
+    check:
+      type: CheckStream
+      stream_names: "*ref(definitions.check_stream_names)"
+    """
+    monkeypatch.setenv("AIRBYTE_MANIFEST_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(manifest_cache, "_package_version", lambda package: "0.1.0")
+    monkeypatch.setattr(YamlDeclarativeSource, "_read_yaml_file", lambda self, path_to_yaml_file: manifest)
+    validated_sources = []
+    monkeypatch.setattr(YamlDeclarativeSource, "_validate_source", lambda self: validated_sources.append(self))
+
+    first_source = YamlDeclarativeSource("manifest.yaml")
+    second_source = YamlDeclarativeSource("manifest.yaml")
+
+    assert validated_sources == [first_source]
+    assert second_source._source_config == first_source._source_config
+    assert second_source.connection_checker.stream_names == ["lists"]
+
+
+def test_manifest_is_not_cached_by_default(tmp_path, monkeypatch):
+    manifest = """
+    version: "version"
+    streams: []
+    check:
+      type: CheckStream
+      stream_names: ["lists"]
+    """
+    monkeypatch.delenv("AIRBYTE_MANIFEST_CACHE_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(manifest_cache, "_package_version", lambda package: "0.1.0")
+    monkeypatch.setattr(YamlDeclarativeSource, "_read_yaml_file", lambda self, path_to_yaml_file: manifest)
+    validated_sources = []
+    monkeypatch.setattr(YamlDeclarativeSource, "_validate_source", lambda self: validated_sources.append(self))
+
+    first_source = YamlDeclarativeSource("manifest.yaml")
+    second_source = YamlDeclarativeSource("manifest.yaml")
+
+    assert validated_sources == [first_source, second_source]
+    assert list(tmp_path.iterdir()) == []
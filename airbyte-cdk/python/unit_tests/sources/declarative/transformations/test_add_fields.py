@@ -108,3 +108,48 @@ def test_add_fields(
 ):
     inputs = [AddedFieldDefinition(path=v[0], value=v[1], options={}) for v in field]
     assert AddFields(fields=inputs, options={"alas": "i live"}).transform(input_record, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    ["input_records", "field", "expected"],
+    [
+        pytest.param(
+            [{"k": "v1"}, {"k": "v2"}],
+            [(["k2"], "{{ record.k }}-{{ config.shop }}")],
+            [{"k": "v1", "k2": "v1-in-n-out"}, {"k": "v2", "k2": "v2-in-n-out"}],
+            id="interpolate each record",
+        ),
+        pytest.param(
+            [{"k": "v"}, {"k": "v", "nested": {"other": 1}}],
+            [(["nested", "path"], "{{ stream_state.cursor }}")],
+            [{"k": "v", "nested": {"path": "t0"}}, {"k": "v", "nested": {"other": 1, "path": "t0"}}],
+            id="set nested paths",
+        ),
+        pytest.param([{"k": [0, 1]}], [(["k", 3], "v")], [{"k": [0, 1, None, "v"]}], id="set element inside array"),
+        pytest.param([{"k": "v"}, {"k": None}], [(["k2"], "{{ record.k }}")], [{"k": "v", "k2": "v"}, {"k": None, "k2": None}], id="null"),
+    ],
+)
+def test_add_fields_to_records(input_records, field, expected):
+    inputs = [AddedFieldDefinition(path=v[0], value=v[1], options={}) for v in field]
+    add_fields = AddFields(fields=inputs, options={})
+    kwargs = {"config": {"shop": "in-n-out"}, "stream_state": {"cursor": "t0"}, "stream_slice": {}}
+
+    assert add_fields.transform_records(input_records, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    ["input_record", "path"],
+    [
+        pytest.param({"k": None}, ["k", "nested"], id="null parent"),
+        pytest.param({"k": "v"}, ["k", "nested"], id="string parent"),
+        pytest.param({"k": [0, 1]}, ["k", "0"], id="array parent"),
+    ],
+)
+def test_add_fields_to_records_fails_like_transform(input_record, path):
+    add_fields = AddFields(fields=[AddedFieldDefinition(path=path, value="v", options={})], options={})
+
+    with pytest.raises(Exception) as transform_error:
+        add_fields.transform(dict(input_record))
+    with pytest.raises(Exception) as transform_records_error:
+        add_fields.transform_records([dict(input_record)])
+    assert transform_records_error.type == transform_error.type
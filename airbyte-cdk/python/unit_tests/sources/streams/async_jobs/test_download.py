@@ -0,0 +1,32 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+
+import requests
+from airbyte_cdk.sources.streams.async_jobs import iter_csv_records, iter_jsonl_records
+
+
+def test_iter_csv_records(requests_mock):
+    requests_mock.get("https://report.com/csv", content=b'id,name\n1,"multi\nline"\n2,plain\n')
+
+    response = requests.get("https://report.com/csv", stream=True)
+
+    assert list(iter_csv_records(response)) == [{"id": "1", "name": "multi\nline"}, {"id": "2", "name": "plain"}]
+
+
+def test_iter_gzipped_csv_records(requests_mock):
+    requests_mock.get("https://report.com/csv", content=gzip.compress(b"id;name\n1;a\n"), headers={"Content-Encoding": "gzip"})
+
+    response = requests.get("https://report.com/csv", stream=True)
+
+    assert list(iter_csv_records(response, delimiter=";")) == [{"id": "1", "name": "a"}]
+
+
+def test_iter_jsonl_records(requests_mock):
+    requests_mock.get("https://report.com/jsonl", content=b'{"id": 1}\n\n{"id": 2, "nested": {"a": [1]}}\n')
+
+    response = requests.get("https://report.com/jsonl", stream=True)
+
+    assert list(iter_jsonl_records(response)) == [{"id": 1}, {"id": 2, "nested": {"a": [1]}}]
@@ -0,0 +1,158 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import itertools
+from typing import Any, Iterable, List, Mapping
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.sources.streams.async_jobs import AsyncJob, AsyncJobError, AsyncJobManager, AsyncJobStatus
+
+
+class MockJob(AsyncJob):
+    """Job going through the given statuses, one per poll, the last one repeating"""
+
+    polled_batches: List[List[str]] = []
+
+    def __init__(self, name: str, statuses: List[AsyncJobStatus], smaller_jobs: List["MockJob"] = None):
+        super().__init__()
+        self.name = name
+        self._statuses = statuses
+        self._smaller_jobs = smaller_jobs or []
+        self.starts = 0
+
+    def start(self):
+        self.starts += 1
+
+    def poll_status(self) -> AsyncJobStatus:
+        return self._statuses.pop(0) if len(self._statuses) > 1 else self._statuses[0]
+
+    @classmethod
+    def poll_statuses(cls, jobs: List["AsyncJob"]) -> List[AsyncJobStatus]:
+        cls.polled_batches.append([job.name for job in jobs])
+        return super().poll_statuses(jobs)
+
+    def get_records(self) -> Iterable[Mapping[str, Any]]:
+        yield {"job": self.name}
+
+    def split(self) -> List["AsyncJob"]:
+        return self._smaller_jobs
+
+    def __str__(self):
+        return self.name
+
+
+RUNNING = AsyncJobStatus.RUNNING
+COMPLETED = AsyncJobStatus.COMPLETED
+FAILED = AsyncJobStatus.FAILED
+
+
+@pytest.fixture(autouse=True)
+def sleep():
+    MockJob.polled_batches = []
+    with patch("airbyte_cdk.sources.streams.async_jobs.job_manager.time.sleep") as sleep:
+        yield sleep
+
+
+def completed_job_names(job_manager: AsyncJobManager) -> List[str]:
+    return [job.name for job in job_manager.completed_jobs()]
+
+
+def test_jobs_complete_in_the_order_they_complete():
+    jobs = [MockJob("slow", [RUNNING, RUNNING, COMPLETED]), MockJob("fast", [COMPLETED]), MockJob("medium", [RUNNING, COMPLETED])]
+
+    assert completed_job_names(AsyncJobManager(jobs)) == ["fast", "medium", "slow"]
+    assert all(job.starts == 1 for job in jobs)
+
+
+def test_jobs_complete_in_job_order():
+    jobs = [MockJob("slow", [RUNNING, RUNNING, COMPLETED]), MockJob("fast", [COMPLETED]), MockJob("medium", [RUNNING, COMPLETED])]
+
+    assert [job.name for job in AsyncJobManager(jobs).completed_jobs(in_job_order=True)] == ["slow", "fast", "medium"]
+
+
+def test_smaller_jobs_of_a_split_take_the_place_of_the_failed_job_in_job_order():
+    smaller_jobs = [MockJob("small_0", [RUNNING, COMPLETED]), MockJob("small_1", [COMPLETED])]
+    jobs = [MockJob("first", [RUNNING, RUNNING, RUNNING, COMPLETED]), MockJob("large", [FAILED], smaller_jobs=smaller_jobs)]
+    job_manager = AsyncJobManager(jobs + [MockJob("last", [COMPLETED])], split_after_attempts=1)
+
+    assert [job.name for job in job_manager.completed_jobs(in_job_order=True)] == ["first", "small_0", "small_1", "last"]
+
+
+def test_running_jobs_are_bounded():
+    jobs = [MockJob(f"job_{i}", [RUNNING, COMPLETED]) for i in range(5)]
+
+    assert completed_job_names(AsyncJobManager(jobs, max_running_jobs=2)) == [f"job_{i}" for i in range(5)]
+    assert all(len(batch) <= 2 for batch in MockJob.polled_batches)
+
+
+def test_jobs_are_polled_in_batches():
+    jobs = [MockJob(f"job_{i}", [COMPLETED]) for i in range(5)]
+
+    completed_job_names(AsyncJobManager(jobs, max_running_jobs=5, poll_batch_size=2))
+
+    assert MockJob.polled_batches == [["job_0", "job_1"], ["job_2", "job_3"], ["job_4"]]
+
+
+def test_poll_interval_is_adaptive(sleep):
+    jobs = [MockJob("first", [RUNNING, RUNNING, RUNNING, RUNNING, COMPLETED]), MockJob("second", [RUNNING, RUNNING, COMPLETED])]
+
+    completed_job_names(AsyncJobManager(jobs, max_running_jobs=1, min_poll_interval=1, max_poll_interval=5))
+
+    assert [sleep_call.args[0] for sleep_call in sleep.call_args_list] == [1, 2, 4, 5, 1, 2]
+
+
+def test_failed_job_is_restarted_then_split():
+    smaller_jobs = [MockJob("small_0", [COMPLETED]), MockJob("small_1", [FAILED, COMPLETED])]
+    job = MockJob("large", [FAILED], smaller_jobs=smaller_jobs)
+
+    assert completed_job_names(AsyncJobManager([job, MockJob("next", [COMPLETED])], max_running_jobs=1)) == [
+        "small_0",
+        "small_1",
+        "next",
+    ]
+    assert job.starts == 2
+    assert smaller_jobs[1].starts == 2
+
+
+def test_job_failing_too_many_times_raises():
+    job = MockJob("failing", [FAILED])
+
+    with pytest.raises(AsyncJobError) as error:
+        completed_job_names(AsyncJobManager([job], max_attempts=3))
+    assert error.value.job is job
+    assert job.starts == 3
+
+
+def test_job_timeout():
+    job = MockJob("job", [RUNNING, RUNNING, COMPLETED])
+    # the job starts at 0 and is still running at 100, its restart at 100 completes in time
+    monotonic = itertools.chain([0], itertools.repeat(100))
+    with patch("airbyte_cdk.sources.streams.async_jobs.job_manager.time.monotonic", side_effect=monotonic):
+        assert completed_job_names(AsyncJobManager([job], job_timeout=60)) == ["job"]
+    assert job.starts == 2
+
+
+def test_throttled_jobs_start_once_allowed(sleep):
+    class ThrottledJobManager(AsyncJobManager):
+        allowed_starts = [False, True, False, True]
+
+        def can_start_job(self) -> bool:
+            return self.allowed_starts.pop(0) if self.allowed_starts else True
+
+    jobs = [MockJob("first", [COMPLETED]), MockJob("second", [COMPLETED])]
+
+    assert completed_job_names(ThrottledJobManager(jobs)) == ["first", "second"]
+
+
+@pytest.mark.parametrize(
+    "test_name, kwargs",
+    [
+        ("test_no_running_jobs", {"max_running_jobs": 0}),
+        ("test_min_poll_interval_above_max", {"min_poll_interval": 10, "max_poll_interval": 1}),
+    ],
+)
+def test_invalid_job_manager(test_name, kwargs):
+    with pytest.raises(ValueError):
+        AsyncJobManager([], **kwargs)
@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.async_jobs import AsyncJob, AsyncJobManager, AsyncJobStatus, AsyncJobStream
+
+
+class ReportJob(AsyncJob):
+    def __init__(self, day: int, polls_until_completed: int):
+        super().__init__()
+        self.day = day
+        self._polls_until_completed = polls_until_completed
+
+    def start(self):
+        pass
+
+    def poll_status(self) -> AsyncJobStatus:
+        self._polls_until_completed -= 1
+        return AsyncJobStatus.COMPLETED if self._polls_until_completed <= 0 else AsyncJobStatus.RUNNING
+
+    def get_records(self) -> Iterable[Mapping[str, Any]]:
+        yield from ({"day": self.day, "id": i} for i in range(2))
+
+
+class ReportStream(AsyncJobStream):
+    primary_key = "id"
+
+    def create_jobs(
+        self, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
+    ) -> Iterable[AsyncJob]:
+        start_day = (stream_state or {}).get("day", 0)
+        return [ReportJob(day, polls_until_completed=3 - day) for day in range(start_day, 3)]
+
+    def create_job_manager(self, jobs: Iterable[AsyncJob]) -> AsyncJobManager:
+        return AsyncJobManager(jobs, min_poll_interval=0.001, max_poll_interval=0.001)
+
+
+@pytest.mark.parametrize(
+    "sync_mode, expected_days",
+    [
+        # the job of the last day is the first to complete
+        (SyncMode.full_refresh, [2, 1]),
+        # the state checkpointed after a job never moves past a job still running
+        (SyncMode.incremental, [1, 2]),
+    ],
+)
+def test_async_job_stream(sync_mode, expected_days):
+    stream = ReportStream()
+
+    records = [
+        record
+        for stream_slice in stream.stream_slices(sync_mode=sync_mode, stream_state={"day": 1})
+        for record in stream.read_records(sync_mode, stream_slice=stream_slice)
+    ]
+
+    assert records == [{"day": day, "id": i} for day in expected_days for i in range(2)]
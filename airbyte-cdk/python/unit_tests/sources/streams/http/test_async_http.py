@@ -0,0 +1,180 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+import pytest
+import requests
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode, Type
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
+
+httpx = pytest.importorskip("httpx")
+
+
+class StubAsyncHttpStream(AsyncHttpStream):
+    url_base = "https://api.example.com/v1/"
+    primary_key = "id"
+    retry_factor = 0
+
+    def __init__(self, handler, **kwargs):
+        super().__init__(**kwargs)
+        self.handler = handler
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+    def create_async_client(self) -> "httpx.AsyncClient":
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return f"parents/{stream_slice['parent_id']}/children" if stream_slice else "children"
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["data"]
+
+
+def paginated_handler(pages: int = 3):
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        page = int(request.url.params.get("page", 1))
+        data = [{"id": f"{request.url.path}-{page}"}]
+        return httpx.Response(200, json={"data": data, "next_page": page + 1 if page < pages else None})
+
+    return handler
+
+
+def test_read_records_follows_pagination():
+    stream = StubAsyncHttpStream(paginated_handler())
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"id": "/v1/children-1"}, {"id": "/v1/children-2"}, {"id": "/v1/children-3"}]
+    assert stream._async_clients == {}
+
+
+def test_metrics_of_requests():
+    stream = StubAsyncHttpStream(paginated_handler())
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert stream.metrics.request_count == 3
+    assert sum(stream.metrics.request_latency_counts) == 3
+    assert stream.metrics.bytes_received > 0
+    assert stream.metrics.backoff_time == 0
+
+
+class StubIncrementalAsyncHttpStream(StubAsyncHttpStream):
+    cursor_field = "updated_at"
+
+
+def test_incremental_streams_read_slices_one_after_another_by_default():
+    assert StubAsyncHttpStream(paginated_handler()).max_concurrent_slices == 10
+    assert StubIncrementalAsyncHttpStream(paginated_handler()).max_concurrent_slices is None
+
+
+def test_default_backoff_retries():
+    responses = iter([httpx.Response(500), httpx.Response(429), httpx.Response(200, json={"data": [{"id": 1}]})])
+    stream = StubAsyncHttpStream(lambda request: next(responses))
+
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == [{"id": 1}]
+
+
+def test_max_retries(mocker):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    mocker.patch.object(StubAsyncHttpStream, "max_retries", 2)
+    stream = StubAsyncHttpStream(handler)
+
+    with pytest.raises(DefaultBackoffException):
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert len(calls) == 3
+
+
+def test_user_defined_backoff(mocker):
+    sleep = mocker.patch("asyncio.sleep", side_effect=lambda *args: mocker.AsyncMock()())
+    mocker.patch.object(StubAsyncHttpStream, "max_retries", 1)
+    stream = StubAsyncHttpStream(lambda request: httpx.Response(429))
+    stream.backoff_time = lambda response: 5
+
+    with pytest.raises(UserDefinedBackoffException):
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    sleep.assert_called_once_with(6)
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404, json={"message": "not found"})
+
+    with pytest.raises(requests.HTTPError):
+        list(StubAsyncHttpStream(handler).read_records(sync_mode=SyncMode.full_refresh))
+    assert len(calls) == 1
+
+
+def test_connection_errors_are_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"data": [{"id": 1}]})
+
+    assert list(StubAsyncHttpStream(handler).read_records(sync_mode=SyncMode.full_refresh)) == [{"id": 1}]
+    assert len(calls) == 2
+
+
+class StubSource(AbstractSource):
+    def __init__(self, streams):
+        self._streams = streams
+
+    def check_connection(self, *args, **kwargs) -> Tuple[bool, Optional[Any]]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return self._streams
+
+
+class StubSubstream(StubAsyncHttpStream):
+    max_concurrent_slices = 5
+
+    def stream_slices(self, **kwargs):
+        return [{"parent_id": i} for i in range(20)]
+
+
+def test_abstract_source_reads_slices_concurrently():
+    stream = StubSubstream(paginated_handler(pages=2))
+    source = StubSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog.parse_obj(
+        {
+            "streams": [
+                {
+                    "stream": {"name": stream.name, "json_schema": {}, "supported_sync_modes": ["full_refresh"]},
+                    "sync_mode": "full_refresh",
+                    "destination_sync_mode": "overwrite",
+                }
+            ]
+        }
+    )
+
+    messages = list(source.read(logging.getLogger("airbyte"), {}, catalog))
+
+    records = [message.record.data for message in messages if message.type == Type.RECORD]
+    assert records == [{"id": f"/v1/parents/{i}/children-{page}"} for i in range(20) for page in (1, 2)]
@@ -4,18 +4,22 @@
 
 
 import json
+import time
 from http import HTTPStatus
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, Mapping, MutableMapping, Optional
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import requests
+import vcr
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.streams.http.response_cache import ResponseCache
+from vcr.cassette import Cassette
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -69,6 +73,74 @@ def test_request_kwargs_used(mocker, requests_mock):
     assert send_mock.call_count == 1
 
 
+class StreamedPagesHttpStream(StubBasicReadHttpStream):
+    stream_response = True
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json()["next"]
+        return {"page": next_page} if next_page else None
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs) -> MutableMapping[str, Any]:
+        return next_page_token or {}
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        return self.parse_json_records(response, ["data", "records"])
+
+
+def test_streamed_responses_are_parsed_as_they_are_read(mocker, requests_mock):
+    pytest.importorskip("ijson")
+    stream = StreamedPagesHttpStream()
+    send_mock = mocker.patch.object(stream._session, "send", wraps=stream._session.send)
+    requests_mock.get("https://test_base_url.com/", json={"data": {"records": [{"id": 1}, {"id": 2}]}, "next": 2})
+    requests_mock.get("https://test_base_url.com/?page=2", json={"data": {"records": [{"id": 3}]}, "next": None})
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+    send_mock.assert_any_call(ANY, stream=True)
+    assert send_mock.call_count == 2
+
+
+class JsonPagesHttpStream(StreamedPagesHttpStream):
+    stream_response = False
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        return response.json()["data"]["records"]
+
+
+def test_metrics_of_requests(requests_mock):
+    stream = JsonPagesHttpStream()
+    first_page = json.dumps({"data": {"records": [{"id": 1}, {"id": 2}]}, "next": 2})
+    second_page = json.dumps({"data": {"records": [{"id": 3}]}, "next": None})
+    requests_mock.get("https://test_base_url.com/", text=first_page)
+    requests_mock.get("https://test_base_url.com/?page=2", text=second_page)
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert stream.metrics.request_count == 2
+    assert sum(stream.metrics.request_latency_counts) == 2
+    assert stream.metrics.bytes_received == len(first_page) + len(second_page)
+    assert stream.metrics.parse_time > 0
+    assert stream.metrics.backoff_time == 0
+
+
+def test_metrics_of_backoff(mocker):
+    sleep = time.sleep
+    mocker.patch("time.sleep", side_effect=lambda seconds: sleep(0.01))
+    stream = StubCustomBackoffHttpStream()
+    throttled_response = requests.Response()
+    throttled_response.status_code = HTTPStatus.TOO_MANY_REQUESTS
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response._content = b"{}"
+    mocker.patch.object(requests.Session, "send", side_effect=[throttled_response, response])
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    assert stream.metrics.request_count == 2
+    assert stream.metrics.backoff_time >= 0.01
+
+
 def test_stub_basic_read_http_stream_read_records(mocker):
     stream = StubBasicReadHttpStream()
     blank_response = {}  # Send a blank response is fine as we ignore the response in `parse_response anyway.
@@ -373,7 +445,7 @@ class CacheHttpSubStream(HttpSubStream):
 
 def test_caching_filename():
     stream = CacheHttpStream()
-    assert stream.cache_filename == f"{stream.name}.yml"
+    assert stream.cache_filename == f"{stream.name}.sqlite"
 
 
 def test_caching_cassettes_are_different():
@@ -390,13 +462,16 @@ def test_parent_attribute_exist():
     assert child_stream.parent == parent_stream
 
 
-def test_cache_response(mocker):
+def test_cache_response(mocker, requests_mock, tmp_path):
+    mocker.patch.object(CacheHttpStream, "cache_filename", str(tmp_path / "cache.sqlite"))
+    requests_mock.get("https://test_base_url.com/", text="cached")
     stream = CacheHttpStream()
-    mocker.patch.object(stream, "url_base", "https://google.com/")
+
     list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    list(CacheHttpStream().read_records(sync_mode=SyncMode.full_refresh))
 
-    with open(stream.cache_filename, "r") as f:
-        assert f.read()
+    assert requests_mock.call_count == 1
+    assert (tmp_path / "cache.sqlite").exists()
 
 
 class CacheHttpStreamWithSlices(CacheHttpStream):
@@ -414,19 +489,51 @@ class CacheHttpStreamWithSlices(CacheHttpStream):
 
 
 @patch("airbyte_cdk.sources.streams.core.logging", MagicMock())
-def test_using_cache(mocker):
+def test_using_cache(mocker, requests_mock, tmp_path):
+    mocker.patch.object(CacheHttpStreamWithSlices, "cache_filename", str(tmp_path / "parent.sqlite"))
+    requests_mock.get("https://test_base_url.com/", text="root")
+    requests_mock.get("https://test_base_url.com/search", text="search results")
     parent_stream = CacheHttpStreamWithSlices()
-    mocker.patch.object(parent_stream, "url_base", "https://google.com/")
 
     for _slice in parent_stream.stream_slices():
         list(parent_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=_slice))
+    assert requests_mock.call_count == 2
 
-    child_stream = CacheHttpSubStream(parent=parent_stream)
+    child_stream = CacheHttpSubStream(parent=CacheHttpStreamWithSlices())
+
+    parent_records = [_slice["parent"] for _slice in child_stream.stream_slices(sync_mode=SyncMode.full_refresh)]
+
+    assert parent_records == [{"value": 4}, {"value": 14}]
+    assert requests_mock.call_count == 2
+
+
+def test_cache_is_not_used_after_ttl(mocker, requests_mock, tmp_path):
+    mocker.patch.object(CacheHttpStream, "request_cache", lambda self: ResponseCache(str(tmp_path / "ttl.sqlite"), ttl=60))
+    requests_mock.get("https://test_base_url.com/", text="cached")
+    now = mocker.patch("airbyte_cdk.sources.streams.http.response_cache.time.time", return_value=1000)
+    stream = CacheHttpStream()
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert requests_mock.call_count == 1
+
+    now.return_value = 1061
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    assert requests_mock.call_count == 2
+
+
+def test_vcr_cassette_cache_is_deprecated_but_used(mocker, requests_mock, tmp_path):
+    cassette = vcr.use_cassette(str(tmp_path / "cache.yml"), record_mode="new_episodes", serializer="yaml")
+    mocker.patch.object(CacheHttpStream, "request_cache", lambda self: cassette)
+    requests_mock.get("https://test_base_url.com/", text="cached")
 
-    for _slice in child_stream.stream_slices(sync_mode=SyncMode.full_refresh):
-        pass
+    with pytest.warns(DeprecationWarning, match="vcr cassette"):
+        stream = CacheHttpStream()
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
 
-    assert parent_stream.cassete.play_count != 0
+    assert len(records) == 1
+    assert isinstance(stream.cassete, Cassette)
+    assert stream._response_cache is None
 
 
 class AutoFailTrueHttpStream(StubBasicReadHttpStream):
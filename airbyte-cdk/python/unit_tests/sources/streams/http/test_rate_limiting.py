@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpTransport, RateLimiter
+from airbyte_cdk.sources.streams.http.rate_limiting import TokenBucket
+
+from .test_transport import OtherHostStream, StubHttpStream
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [0.0]
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def request(url: str) -> requests.PreparedRequest:
+    return requests.Request("GET", url).prepare()
+
+
+def test_token_bucket_allows_bursts_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    # tokens reserved ahead of time are served in order
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    clock[0] = 10
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_rate, expected_burst",
+    [
+        ({"requests_per_second": 5}, 5, 5),
+        ({"requests_per_minute": 30}, 0.5, 1),
+        ({"requests_per_minute": 600, "burst": 20}, 10, 20),
+    ],
+)
+def test_rate_limiter_configuration(kwargs, expected_rate, expected_burst):
+    limiter = RateLimiter(**kwargs)
+
+    assert limiter.rate == expected_rate
+    assert limiter.burst == expected_burst
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"requests_per_second": 1, "requests_per_minute": 60}, {"requests_per_second": 0}, {"requests_per_second": 1, "burst": 0}],
+)
+def test_rate_limiter_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+@pytest.mark.parametrize("per_endpoint, expected_sleeps", [(False, [1.0, 2.0]), (True, [1.0])])
+def test_rate_limiter_buckets(mocker, clock, per_endpoint, expected_sleeps):
+    sleep = mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep")
+    limiter = RateLimiter(requests_per_second=1, per_endpoint=per_endpoint)
+
+    for url in ["https://api.example.com/users", "https://api.example.com/users?page=2", "https://api.example.com/groups"]:
+        limiter.acquire(request(url))
+    limiter.acquire(request("https://other.example.com/users"))
+
+    assert [c.args[0] for c in sleep.call_args_list] == expected_sleeps
+
+
+def test_streams_of_a_transport_share_its_rate_limit(mocker, clock, requests_mock):
+    sleep = mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep")
+    requests_mock.get("https://api.example.com/v1/stub", json={"id": 1})
+    requests_mock.get("https://other.example.com/stub", json={"id": 2})
+    transport = HttpTransport(rate_limiter=RateLimiter(requests_per_second=10, burst=1))
+
+    for stream in [StubHttpStream(transport=transport), StubHttpStream(transport=transport), OtherHostStream(transport=transport)]:
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    list(StubHttpStream().read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [c.args[0] for c in sleep.call_args_list] == [pytest.approx(0.1)]
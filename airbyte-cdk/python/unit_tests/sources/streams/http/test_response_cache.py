@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import requests
+from airbyte_cdk.sources.streams.http.response_cache import ResponseCache
+
+
+def request(url: str, method: str = "GET", body: str = None) -> requests.PreparedRequest:
+    return requests.Request(method, url, data=body).prepare()
+
+
+def response(content: bytes, status_code: int = 200) -> requests.Response:
+    built = requests.Response()
+    built._content = content
+    built.status_code = status_code
+    built.reason = "OK"
+    built.url = "https://api.example.com/users"
+    built.headers["Content-Type"] = "application/json; charset=utf-8"
+    return built
+
+
+def test_responses_are_replayed(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    users = request("https://api.example.com/users?page=1")
+    cache.set(users, response(b'{"id": 1}'))
+
+    cached = cache.get(request("https://api.example.com/users?page=1"))
+
+    assert cached.json() == {"id": 1}
+    assert cached.status_code == 200
+    assert cached.headers["content-type"] == "application/json; charset=utf-8"
+    assert cached.encoding == "utf-8"
+    assert cache.get(request("https://api.example.com/users?page=2")) is None
+    assert cache.get(request("https://api.example.com/users?page=1", method="POST", body="page=2")) is None
+
+
+def test_request_body_is_part_of_the_key(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    cache.set(request("https://api.example.com/graphql", method="POST", body="query 1"), response(b"1"))
+    cache.set(request("https://api.example.com/graphql", method="POST", body="query 2"), response(b"2"))
+
+    assert cache.get(request("https://api.example.com/graphql", method="POST", body="query 1")).content == b"1"
+    assert cache.get(request("https://api.example.com/graphql", method="POST", body="query 2")).content == b"2"
+
+
+def test_oldest_responses_are_evicted_over_max_size(mocker, tmp_path):
+    now = mocker.patch("airbyte_cdk.sources.streams.http.response_cache.time.time", return_value=0)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_size=25)
+    for page in range(4):
+        now.return_value = page
+        cache.set(request(f"https://api.example.com/users?page={page}"), response(b"x" * 10))
+
+    cached_pages = [page for page in range(4) if cache.get(request(f"https://api.example.com/users?page={page}"))]
+
+    assert cached_pages == [2, 3]
+
+
+def test_file_is_emptied_once_per_process(tmp_path):
+    filename = str(tmp_path / "cache.sqlite")
+    cache = ResponseCache(filename)
+    cache.set(request("https://api.example.com/users"), response(b"[]"))
+    cache.close()
+
+    # other streams sharing the file don't delete its responses
+    assert ResponseCache(filename).get(request("https://api.example.com/users")).content == b"[]"
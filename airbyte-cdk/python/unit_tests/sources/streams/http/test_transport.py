@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream, HttpTransport
+from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.sources.streams.http.transport import Http2Adapter
+
+
+class StubHttpStream(HttpStream):
+    url_base = "https://api.example.com/v1/"
+    primary_key = "id"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def path(self, **kwargs) -> str:
+        return "stub"
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield response.json()
+
+
+class OtherHostStream(StubHttpStream):
+    url_base = "https://other.example.com/"
+
+
+def test_streams_of_the_same_host_share_a_session():
+    transport = HttpTransport()
+
+    first, second, other = StubHttpStream(transport=transport), StubHttpStream(transport=transport), OtherHostStream(transport=transport)
+
+    assert first._session is second._session
+    assert first._session is not other._session
+    assert StubHttpStream()._session is not StubHttpStream()._session
+
+
+def test_session_key_is_the_origin():
+    assert HttpTransport.session_key("https://API.example.com/v1/") == HttpTransport.session_key("https://api.example.com/v2/users")
+    assert HttpTransport.session_key("http://api.example.com/") != HttpTransport.session_key("https://api.example.com/")
+
+
+def test_pool_configuration():
+    session = HttpTransport(pool_connections=2, pool_maxsize=20, pool_block=True, keep_alive=False).get_session("https://api.example.com")
+    adapter = session.get_adapter("https://api.example.com")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 20
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "close"
+
+
+def test_authentication_is_applied_per_request(requests_mock):
+    transport = HttpTransport()
+    requests_mock.get("https://api.example.com/v1/stub", json={"id": 1})
+    first = StubHttpStream(authenticator=TokenAuthenticator("first-token"), transport=transport)
+    second = StubHttpStream(authenticator=TokenAuthenticator("second-token"), transport=transport)
+
+    list(first.read_records(sync_mode=SyncMode.full_refresh))
+    list(second.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert first._session.auth is None
+    assert [request.headers["Authorization"] for request in requests_mock.request_history] == ["Bearer first-token", "Bearer second-token"]
+
+
+def test_http2_adapter_builds_requests_responses():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        assert request.headers["X-Test"] == "value"
+        return httpx.Response(200, json={"id": 1}, headers={"X-Response": "value"})
+
+    adapter = Http2Adapter(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    response = session.get("https://api.example.com/v1/stub", headers={"X-Test": "value"})
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+    assert response.headers["x-response"] == "value"
+    assert list(response.iter_content(chunk_size=4))
+
+
+def test_http2_adapter_raises_requests_exceptions():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    session = requests.Session()
+    session.mount("https://", Http2Adapter(client=httpx.Client(transport=httpx.MockTransport(handler))))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get("https://api.example.com/v1/stub")
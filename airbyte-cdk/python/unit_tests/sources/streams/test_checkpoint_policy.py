@@ -0,0 +1,52 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.sources.streams import CheckpointPolicy
+
+
+def emitted_records(checkpoint_policy, records):
+    """Returns the number of records emitted when each checkpoint happens"""
+    checkpoints = []
+    for record_counter, record in enumerate(records, start=1):
+        if checkpoint_policy.record_emitted(record):
+            checkpoints.append(record_counter)
+            checkpoint_policy.reset()
+    return checkpoints
+
+
+@pytest.mark.parametrize(
+    "test_name, checkpoint_policy, records, expected_checkpoints",
+    [
+        ("test_no_interval", CheckpointPolicy(), [{"id": i} for i in range(10)], []),
+        ("test_record_interval", CheckpointPolicy(record_interval=3), [{"id": i} for i in range(10)], [3, 6, 9]),
+        ("test_byte_interval", CheckpointPolicy(byte_interval=100), [{"data": "x" * 40}] * 10, [2, 4, 6, 8, 10]),
+        ("test_huge_records", CheckpointPolicy(record_interval=3, byte_interval=100), [{"data": "x" * 1000}] * 3, [1, 2, 3]),
+        ("test_tiny_records", CheckpointPolicy(record_interval=3, byte_interval=100), [{}] * 6, [3, 6]),
+    ],
+)
+def test_checkpoint_policy(test_name, checkpoint_policy, records, expected_checkpoints):
+    assert emitted_records(checkpoint_policy, records) == expected_checkpoints
+
+
+def test_time_interval():
+    with patch("airbyte_cdk.sources.streams.checkpoint_policy.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        checkpoint_policy = CheckpointPolicy(record_interval=100, time_interval=60)
+
+        monotonic.return_value = 30
+        assert not checkpoint_policy.record_emitted({})
+        monotonic.return_value = 60
+        assert checkpoint_policy.record_emitted({})
+        checkpoint_policy.reset()
+        monotonic.return_value = 90
+        assert not checkpoint_policy.record_emitted({})
+
+
+@pytest.mark.parametrize("interval", ["record_interval", "byte_interval", "time_interval"])
+def test_invalid_interval(interval):
+    with pytest.raises(ValueError):
+        CheckpointPolicy(**{interval: 0})
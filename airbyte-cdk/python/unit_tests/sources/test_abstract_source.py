@@ -2,7 +2,9 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import logging
+import threading
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from unittest.mock import call
@@ -13,17 +15,22 @@ from airbyte_cdk.models import (
     AirbyteConnectionStatus,
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateBlob,
     AirbyteStateMessage,
+    AirbyteStateType,
     AirbyteStream,
+    AirbyteStreamState,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
     DestinationSyncMode,
     Status,
+    StreamDescriptor,
     SyncMode,
+    TraceType,
     Type,
 )
 from airbyte_cdk.sources import AbstractSource
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import CheckpointPolicy, Stream
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 logger = logging.getLogger("airbyte")
@@ -253,6 +260,12 @@ def _state(state_data: Dict[str, Any]):
     return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data=state_data))
 
 
+def _increasing_states():
+    """get_updated_state side effect returning a new state for every record read"""
+    cursor = itertools.count(1)
+    return lambda stream_state, latest_record: {"cursor": next(cursor)}
+
+
 class TestIncrementalRead:
     def test_with_state_attribute(self, mocker):
         """Test correct state passing for the streams that have a state attribute"""
@@ -318,8 +331,7 @@ class TestIncrementalRead:
             [({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)],
             name="s2",
         )
-        state = {"cursor": "value"}
-        mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=_increasing_states())
         mocker.patch.object(MockStream, "supports_incremental", return_value=True)
         mocker.patch.object(MockStream, "get_json_schema", return_value={})
         # Tell the source to output one state message per record
@@ -340,15 +352,14 @@ class TestIncrementalRead:
 
         expected = [
             _as_record("s1", stream_output[0]),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 1}}),
             _as_record("s1", stream_output[1]),
-            _state({"s1": state}),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 2}}),
+            # the state at the end of the slice is the one of the last checkpoint, it isn't emitted again
             _as_record("s2", stream_output[0]),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 2}, "s2": {"cursor": 3}}),
             _as_record("s2", stream_output[1]),
-            _state({"s1": state, "s2": state}),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 2}, "s2": {"cursor": 4}}),
         ]
         messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
@@ -423,8 +434,7 @@ class TestIncrementalRead:
             ],
             name="s2",
         )
-        state = {"cursor": "value"}
-        mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=_increasing_states())
         mocker.patch.object(MockStream, "supports_incremental", return_value=True)
         mocker.patch.object(MockStream, "get_json_schema", return_value={})
         mocker.patch.object(MockStream, "stream_slices", return_value=slices)
@@ -440,16 +450,16 @@ class TestIncrementalRead:
         expected = [
             # stream 1 slice 1
             *_as_records("s1", stream_output),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 3}}),
             # stream 1 slice 2
             *_as_records("s1", stream_output),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 6}}),
             # stream 2 slice 1
             *_as_records("s2", stream_output),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 9}}),
             # stream 2 slice 2
             *_as_records("s2", stream_output),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 12}}),
         ]
 
         messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
@@ -561,8 +571,7 @@ class TestIncrementalRead:
             ],
             name="s2",
         )
-        state = {"cursor": "value"}
-        mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=_increasing_states())
         mocker.patch.object(MockStream, "supports_incremental", return_value=True)
         mocker.patch.object(MockStream, "get_json_schema", return_value={})
         mocker.patch.object(MockStream, "stream_slices", return_value=slices)
@@ -585,29 +594,361 @@ class TestIncrementalRead:
             # stream 1 slice 1
             _as_record("s1", stream_output[0]),
             _as_record("s1", stream_output[1]),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 2}}),
             _as_record("s1", stream_output[2]),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 3}}),
             # stream 1 slice 2
             _as_record("s1", stream_output[0]),
             _as_record("s1", stream_output[1]),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 5}}),
             _as_record("s1", stream_output[2]),
-            _state({"s1": state}),
+            _state({"s1": {"cursor": 6}}),
             # stream 2 slice 1
             _as_record("s2", stream_output[0]),
             _as_record("s2", stream_output[1]),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 8}}),
             _as_record("s2", stream_output[2]),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 9}}),
             # stream 2 slice 2
             _as_record("s2", stream_output[0]),
             _as_record("s2", stream_output[1]),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 11}}),
             _as_record("s2", stream_output[2]),
-            _state({"s1": state, "s2": state}),
+            _state({"s1": {"cursor": 6}, "s2": {"cursor": 12}}),
+        ]
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+        assert expected == messages
+
+    def test_unchanged_state_is_not_checkpointed(self, mocker):
+        slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+        stream_output = [{"k1": "v1"}]
+        s1 = MockStream(
+            [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices],
+            name="s1",
+        )
+        state = {"cursor": "value"}
+        mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+        src = MockSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+        expected = [
+            _as_record("s1", stream_output[0]),
+            _state({"s1": state}),
+            _as_record("s1", stream_output[0]),
+            _as_record("s1", stream_output[0]),
+        ]
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+        assert expected == messages
+
+    def test_per_stream_state(self, mocker):
+        stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+        s1 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s1")
+        s2 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s2")
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=_increasing_states())
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+        src = MockPerStreamStateSource(streams=[s1, s2])
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                _configured_stream(s1, SyncMode.incremental),
+                _configured_stream(s2, SyncMode.incremental),
+            ]
+        )
+
+        expected = [
+            *_as_records("s1", stream_output),
+            _stream_state("s1", {"cursor": 2}),
+            *_as_records("s2", stream_output),
+            _stream_state("s2", {"cursor": 4}),
+        ]
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+        assert expected == messages
+
+    def test_with_checkpoint_policy(self, mocker):
+        """Tests that an incremental read checkpoints state whenever the checkpoint policy of the stream tells it to"""
+        stream_output = [{"k": "v" * 100}, {"k": "v"}, {"k": "v"}, {"k": "v"}, {"k": "v" * 100}]
+        s1 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s1")
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=_increasing_states())
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(
+            MockStream,
+            "checkpoint_policy",
+            new_callable=mocker.PropertyMock,
+            return_value=CheckpointPolicy(record_interval=3, byte_interval=100),
+        )
+
+        src = MockSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+        expected = [
+            _as_record("s1", stream_output[0]),
+            _state({"s1": {"cursor": 1}}),
+            _as_record("s1", stream_output[1]),
+            _as_record("s1", stream_output[2]),
+            _as_record("s1", stream_output[3]),
+            _state({"s1": {"cursor": 4}}),
+            _as_record("s1", stream_output[4]),
+            _state({"s1": {"cursor": 5}}),
+        ]
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+        assert expected == messages
+
+
+def _stream_state(stream_name: str, stream_state: Dict[str, Any]):
+    state_message = AirbyteStateMessage(
+        type=AirbyteStateType.STREAM,
+        stream=AirbyteStreamState(
+            stream_descriptor=StreamDescriptor(name=stream_name), stream_state=AirbyteStateBlob.parse_obj(stream_state)
+        ),
+    )
+    return AirbyteMessage(type=Type.STATE, state=state_message)
+
+
+class MockPerStreamStateSource(MockSource):
+    per_stream_state_enabled = True
+
+
+class MockConcurrentSource(MockSource):
+    max_concurrent_streams = 2
+
+
+class MockConcurrentPerStreamStateSource(MockConcurrentSource):
+    per_stream_state_enabled = True
+
+
+class TestConcurrentRead:
+    def test_full_refresh_reads_all_streams(self, mocker):
+        stream_output = [{"k": i} for i in range(100)]
+        streams = [MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name=f"s{i}") for i in range(3)]
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+        src = MockConcurrentSource(streams=streams)
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s, SyncMode.full_refresh) for s in streams])
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+        assert len(messages) == 300
+        for stream in streams:
+            assert [m for m in messages if m.record.stream == stream.name] == _as_records(stream.name, stream_output)
+
+    def test_incremental_state_is_emitted_after_its_records(self, mocker):
+        slices = [{"1": "1"}, {"2": "2"}]
+        stream_output = [{"cursor": i} for i in range(1, 51)]
+        streams = [
+            MockStream(
+                [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices],
+                name=f"s{i}",
+            )
+            for i in range(3)
         ]
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"cursor": record["cursor"]})
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+        mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=7)
+
+        src = MockConcurrentSource(streams=streams)
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s, SyncMode.incremental) for s in streams])
+
+        latest_cursors = {}
+        state_messages = []
+        for message in src.read(logger, {}, catalog, state=defaultdict(dict)):
+            if message.type == Type.RECORD:
+                latest_cursors[message.record.stream] = message.record.data["cursor"]
+            else:
+                state_messages.append(message.state.data)
+                for stream_name, stream_state in message.state.data.items():
+                    # a checkpoint may lag behind, but never account for records which were not emitted yet
+                    assert stream_state["cursor"] <= latest_cursors[stream_name]
+
+        assert state_messages[-1] == {s.name: {"cursor": 50} for s in streams}
+
+    def test_per_stream_state(self, mocker):
+        stream_output = [{"cursor": i} for i in range(1, 51)]
+        streams = [MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name=f"s{i}") for i in range(3)]
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"cursor": record["cursor"]})
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=10)
+
+        src = MockConcurrentPerStreamStateSource(streams=streams)
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s, SyncMode.incremental) for s in streams])
+
+        state_messages = [message.state for message in src.read(logger, {}, catalog, state=defaultdict(dict)) if message.type == Type.STATE]
+
+        for stream in streams:
+            stream_states = [m.stream.stream_state.dict() for m in state_messages if m.stream.stream_descriptor.name == stream.name]
+            assert stream_states == [{"cursor": cursor} for cursor in range(10, 51, 10)]
+        assert all(state_message.data is None for state_message in state_messages)
+
+    def test_stream_error_is_raised(self, mocker):
+        ok_stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v"}])], name="ok")
+        failing_stream = MockStream(name="failing")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(failing_stream, "read_records", side_effect=RuntimeError("oh no!"))
+        mocker.patch.object(MockStream, "get_error_display_message", return_value="my message")
+
+        src = MockConcurrentSource(streams=[ok_stream, failing_stream])
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[_configured_stream(ok_stream, SyncMode.full_refresh), _configured_stream(failing_stream, SyncMode.full_refresh)]
+        )
+
+        with pytest.raises(AirbyteTracedException, match="oh no!") as exc:
+            list(src.read(logger, {}, catalog))
+        assert exc.value.message == "my message"
+
+    def test_nonexistent_stream_raises_before_reading(self, mocker):
+        s1 = MockStream(name="s1")
+        s2 = MockStream(name="this_stream_doesnt_exist_in_the_source")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        read_records = mocker.patch.object(MockStream, "read_records")
+
+        src = MockConcurrentSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+        )
+        with pytest.raises(KeyError):
+            list(src.read(logger, {}, catalog))
+        read_records.assert_not_called()
+
+    def test_incremental_with_concurrent_slices(self, mocker):
+        slices = [{"slice": i} for i in range(10)]
+        s1 = MockStream(
+            [
+                ({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, [{"cursor": s["slice"]}])
+                for s in slices
+            ],
+            name="s1",
+        )
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"cursor": record["cursor"]})
+        mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+        mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=4)
+
+        src = MockSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
 
+        expected = []
+        for s in slices:
+            expected += [_as_record("s1", {"cursor": s["slice"]}), _state({"s1": {"cursor": s["slice"]}})]
         messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
         assert expected == messages
+
+    def test_stream_updating_its_state_reads_slices_one_after_another(self, mocker):
+        slices = [{"slice": i} for i in range(10)]
+        read_threads = set()
+
+        class StreamUpdatingItsState(MockStreamWithState):
+            def read_records(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+                read_threads.add(threading.current_thread())
+                record = {"cursor": stream_slice["slice"]}
+                self._state = record
+                yield record
+
+        s1 = StreamUpdatingItsState([], name="s1")
+        mocker.patch.object(StreamUpdatingItsState, "get_json_schema", return_value={})
+        mocker.patch.object(StreamUpdatingItsState, "stream_slices", return_value=slices)
+        mocker.patch.object(StreamUpdatingItsState, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=4)
+
+        src = MockSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+        expected = []
+        for s in slices:
+            expected += [_as_record("s1", {"cursor": s["slice"]}), _state({"s1": {"cursor": s["slice"]}})]
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+        assert expected == messages
+        assert read_threads == {threading.current_thread()}
+
+
+class MockStreamMetricsSource(MockSource):
+    stream_metrics_interval = 10
+
+
+class MockConcurrentStreamMetricsSource(MockConcurrentSource):
+    stream_metrics_interval = 10
+
+
+def _metrics_of(message: AirbyteMessage):
+    assert message.type == Type.TRACE and message.trace.type == TraceType.METRICS
+    return message.trace.metrics
+
+
+class TestStreamMetrics:
+    def test_metrics_are_emitted_periodically(self, mocker):
+        stream_output = [{"k": "v1"}, {"k": "v2"}, {"k": "v3"}]
+        s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        # the stream starts at 0, its second record is emitted 10 seconds later
+        mocker.patch(
+            "airbyte_cdk.sources.abstract_source.time.monotonic", side_effect=itertools.chain([0, 5, 10, 10], itertools.repeat(15))
+        )
+
+        src = MockStreamMetricsSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+        assert messages[:2] == _as_records("s1", stream_output[:2])
+        assert _metrics_of(messages[2]).stream_descriptor == StreamDescriptor(name="s1")
+        assert _metrics_of(messages[2]).records_emitted == 2
+        assert messages[3] == _as_record("s1", stream_output[2])
+        assert _metrics_of(messages[4]).records_emitted == 3
+        assert len(messages) == 5
+
+    def test_metrics_are_reset_for_each_read(self, mocker):
+        stream_output = [{"k": "v1"}, {"k": "v2"}]
+        s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+        src = MockStreamMetricsSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+        list(src.read(logger, {}, catalog))
+        messages = list(src.read(logger, {}, catalog))
+
+        assert _metrics_of(messages[-1]).records_emitted == 2
+
+    def test_records_are_not_timed_without_metrics(self, mocker):
+        s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v1"}, {"k": "v2"}])], name="s1")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        mocker.patch("airbyte_cdk.sources.abstract_source.time.perf_counter", side_effect=itertools.count())
+
+        src = MockSource(streams=[s1])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+        messages = list(src.read(logger, {}, catalog))
+
+        assert [message.type for message in messages] == [Type.RECORD, Type.RECORD]
+        assert s1.metrics.records_emitted == 2
+        assert s1.metrics.transform_time == 0
+        assert s1.metrics.output_time == 0
+
+    def test_metrics_of_streams_read_concurrently(self, mocker):
+        s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v1"}])], name="s1")
+        s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k": "v1"}, {"k": "v2"}])], name="s2")
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+        src = MockConcurrentStreamMetricsSource(streams=[s1, s2])
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+        )
+        messages = list(src.read(logger, {}, catalog))
+
+        records_emitted = {
+            message.trace.metrics.stream_descriptor.name: message.trace.metrics.records_emitted
+            for message in messages
+            if message.type == Type.TRACE
+        }
+        assert records_emitted == {"s1": 1, "s2": 2}
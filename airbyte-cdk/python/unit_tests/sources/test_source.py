@@ -103,6 +103,19 @@ def test_read_state(source):
         assert state == actual
 
 
+def test_read_per_stream_state(source):
+    state = [
+        {"type": "STREAM", "stream": {"stream_descriptor": {"name": "s1"}, "stream_state": {"updated_at": "yesterday"}}},
+        {"type": "STREAM", "stream": {"stream_descriptor": {"name": "s2"}}},
+    ]
+
+    with tempfile.NamedTemporaryFile("w") as state_file:
+        state_file.write(json.dumps(state))
+        state_file.flush()
+        actual = source.read_state(state_file.name)
+        assert actual == {"s1": {"updated_at": "yesterday"}, "s2": {}}
+
+
 def test_read_state_nonexistent(source):
     assert {} == source.read_state("")
 
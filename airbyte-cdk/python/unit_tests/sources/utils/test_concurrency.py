@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+from airbyte_cdk.sources.utils.concurrency import read_slices, read_slices_async
+
+
+def _read_slice(stream_slice):
+    # slow slices finish last, records must still come out in slice order
+    time.sleep(random.random() / 100)
+    return [{"slice": stream_slice["id"], "record": i} for i in range(3)]
+
+
+@pytest.mark.parametrize("max_concurrent_slices", [None, 1, 4])
+def test_read_slices_keeps_slice_order(max_concurrent_slices):
+    slices = [{"id": i} for i in range(20)]
+
+    result = [(stream_slice, list(records)) for stream_slice, records in read_slices(slices, _read_slice, max_concurrent_slices)]
+
+    assert result == [(stream_slice, _read_slice(stream_slice)) for stream_slice in slices]
+
+
+def test_read_slices_reads_ahead():
+    started = set()
+    all_started = threading.Event()
+
+    def read_slice(stream_slice):
+        started.add(stream_slice)
+        if len(started) == 3:
+            all_started.set()
+        # the first slice only finishes once every slice has been scheduled
+        assert all_started.wait(timeout=5)
+        yield stream_slice
+
+    records = [record for _, slice_records in read_slices([1, 2, 3], read_slice, max_concurrent_slices=3) for record in slice_records]
+
+    assert records == [1, 2, 3]
+
+
+def test_read_slices_bounds_buffered_records():
+    def read_slice(stream_slice):
+        yield from range(100)
+
+    sliced_records = read_slices([1, 2], read_slice, max_concurrent_slices=2, buffer_size=5)
+    _, first_records = next(sliced_records)
+    assert next(iter(first_records)) == 0
+    # stop consuming, workers blocked on their full buffers must be released
+    sliced_records.close()
+
+
+def test_read_slices_raises_slice_error():
+    def read_slice(stream_slice):
+        if stream_slice == 2:
+            raise RuntimeError("oh no!")
+        yield stream_slice
+
+    sliced_records = read_slices([1, 2, 3], read_slice, max_concurrent_slices=2)
+    _, records = next(sliced_records)
+    assert list(records) == [1]
+    _, records = next(sliced_records)
+    with pytest.raises(RuntimeError, match="oh no!"):
+        list(records)
+
+
+def test_read_slices_async_keeps_slice_order_and_runs_cleanup():
+    running = 0
+    max_running = 0
+    cleaned_up = []
+
+    async def read_slice(stream_slice):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(random.random() / 100)
+        running -= 1
+        for i in range(3):
+            yield {"slice": stream_slice["id"], "record": i}
+
+    async def cleanup():
+        cleaned_up.append(threading.current_thread().name)
+
+    slices = [{"id": i} for i in range(20)]
+
+    result = [(stream_slice, list(records)) for stream_slice, records in read_slices_async(slices, read_slice, 5, cleanup=cleanup)]
+
+    assert result == [(stream_slice, [{"slice": stream_slice["id"], "record": i} for i in range(3)]) for stream_slice in slices]
+    assert 1 < max_running <= 5
+    assert cleaned_up == ["slice-reader-loop"]
+
+
+def test_read_slices_async_raises_slice_error():
+    async def read_slice(stream_slice):
+        if stream_slice == 2:
+            raise RuntimeError("oh no!")
+        yield stream_slice
+
+    sliced_records = read_slices_async([1, 2, 3], read_slice, max_concurrent_slices=2)
+    _, records = next(sliced_records)
+    assert list(records) == [1]
+    _, records = next(sliced_records)
+    with pytest.raises(RuntimeError, match="oh no!"):
+        list(records)
+    sliced_records.close()
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+import pytest
+import requests
+from airbyte_cdk.sources.utils.json_stream import RecordStream, iter_records, iter_response_records
+
+ijson = pytest.importorskip("ijson")
+
+
+class UnseekableFile(io.RawIOBase):
+    """Reads the bytes a few at a time, like a response read from a socket"""
+
+    def __init__(self, content: bytes, chunk_size: int = 7):
+        self._content = io.BytesIO(content)
+        self._chunk_size = chunk_size
+
+    def readinto(self, buffer) -> int:
+        chunk = self._content.read(min(len(buffer), self._chunk_size))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+
+@pytest.mark.parametrize("file_type", [io.BytesIO, UnseekableFile])
+@pytest.mark.parametrize(
+    "path, document, expected_records",
+    [
+        (["data"], b'{"meta": {"data": [0]}, "data": [{"id": 1}, {"id": 2.5}], "next": "token"}', [{"id": 1}, {"id": 2.5}]),
+        (["data", "records"], b'{"data": {"records": [1, [2], {}]}}', [1, [2], {}]),
+        (["data"], b'{"data": {"item": [1]}}', [{"item": [1]}]),
+        (["data"], b'{"data": 0}', []),
+        ([], b'[{"id": 1}]', [{"id": 1}]),
+        (["data"], b"[]", []),
+    ],
+)
+def test_iter_records(file_type, path, document, expected_records):
+    assert list(iter_records(file_type(document), path)) == expected_records
+
+
+def test_records_are_parsed_as_they_are_read():
+    body = io.BytesIO(b'{"data": [{"id": 1}, {"id": 2}, ' + b" " * 1_000_000 + b"]}")
+    records = iter_records(body, ["data"])
+
+    assert next(records) == {"id": 1}
+    assert body.tell() < 1_000_000
+
+
+def test_malformed_document_fails():
+    with pytest.raises(ijson.JSONError):
+        list(iter_records(io.BytesIO(b'{"data": [{"id": 1}'), ["data"]))
+
+
+@pytest.mark.parametrize(
+    "path, document, expected_records, expected_rest",
+    [
+        (
+            ["data", "records"],
+            b'{"meta": {"records": [0]}, "data": {"records": [{"id": 1}, {"id": [2.5]}], "count": 2}, "next": "token"}',
+            [{"id": 1}, {"id": [2.5]}],
+            {"meta": {"records": [0]}, "data": {"records": [], "count": 2}, "next": "token"},
+        ),
+        (["data"], b'{"data": {"id": 1}, "next": null}', [{"id": 1}], {"data": None, "next": None}),
+        (["data"], b'{"data": {}}', [], {"data": None}),
+        (["data"], b'{"other": [1]}', [], {"other": [1]}),
+        ([], b'[{"id": 1}, {"id": 2}]', [{"id": 1}, {"id": 2}], []),
+    ],
+)
+def test_record_stream(path, document, expected_records, expected_rest):
+    records = RecordStream(UnseekableFile(document), path)
+
+    assert list(records) == expected_records
+    assert records.rest == expected_rest
+
+
+def create_streamed_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = UnseekableFile(body)
+    return response
+
+
+def test_iter_response_records_reads_the_body_as_records_are_consumed():
+    body = b'{"data": [{"id": 1}, ' + b" " * 1_000_000 + b'{"id": 2}], "next": "token"}'
+    response = create_streamed_response(body)
+    records = iter_response_records(response, ["data"], chunk_size=1000)
+
+    assert next(records) == {"id": 1}
+    assert response.raw._content.tell() < 1_000_000
+    assert list(records) == [{"id": 2}]
+    assert response.json() == {"data": [], "next": "token"}
+
+
+def test_iter_response_records_leaves_read_content_unchanged():
+    response = create_streamed_response(b'{"data": [{"id": 1}], "next": "token"}')
+    response.content
+
+    assert list(iter_response_records(response, ["data"])) == [{"id": 1}]
+    assert response.json() == {"data": [{"id": 1}], "next": "token"}
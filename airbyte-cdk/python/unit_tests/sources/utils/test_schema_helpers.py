@@ -10,11 +10,20 @@ import sys
 import traceback
 from collections.abc import Mapping
 from pathlib import Path
+from unittest.mock import patch
 
 import jsonref
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification
-from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader, check_config_against_spec_or_exit
+from airbyte_cdk.sources.utils import schema_helpers
+from airbyte_cdk.sources.utils.bundle_schemas import main as bundle_schemas_main
+from airbyte_cdk.sources.utils.schema_helpers import (
+    BUNDLED_SCHEMAS_FILE,
+    ResourceSchemaLoader,
+    bundle_schemas,
+    check_config_against_spec_or_exit,
+    clear_schema_cache,
+)
 from pytest import fixture
 from pytest import raises as pytest_raises
 
@@ -34,6 +43,25 @@ def create_and_teardown_schemas_dir():
     shutil.rmtree(SCHEMAS_ROOT)
 
 
+@fixture(autouse=True)
+def clear_schemas_cache():
+    # Tests write schema files with the same names and different contents
+    clear_schema_cache()
+    yield
+    bundled_schemas_path = SCHEMAS_ROOT.parent / BUNDLED_SCHEMAS_FILE
+    if bundled_schemas_path.exists():
+        os.remove(bundled_schemas_path)
+    clear_schema_cache()
+
+
+@fixture
+def empty_schemas_dir():
+    # Bundling resolves all the schemas of the directory, including the ones left by other tests
+    shutil.rmtree(SCHEMAS_ROOT)
+    os.mkdir(SCHEMAS_ROOT)
+    os.mkdir(SCHEMAS_ROOT / "shared")
+
+
 def create_schema(name: str, content: Mapping):
     with open(SCHEMAS_ROOT / f"{name}.json", "w") as f:
         f.write(json.dumps(content))
@@ -185,3 +213,76 @@ class TestResourceSchemaLoader:
         # Make sure generated schema is JSON serializable
         assert json.dumps(actual_schema)
         assert jsonref.JsonRef.replace_refs(actual_schema)
+
+    @staticmethod
+    def test_schema_is_cached():
+        schema = {"type": ["null", "object"], "properties": {"str": {"type": "string"}}}
+        create_schema("cached_schema", schema)
+        resolver = ResourceSchemaLoader(MODULE_NAME)
+
+        assert resolver.get_schema("cached_schema") == schema
+        with patch.object(schema_helpers.pkgutil, "get_data") as get_data:
+            assert ResourceSchemaLoader(MODULE_NAME).get_schema("cached_schema") == schema
+        get_data.assert_not_called()
+
+    @staticmethod
+    def test_cached_schema_is_copied():
+        schema = {"type": ["null", "object"], "properties": {"str": {"type": "string"}}}
+        create_schema("cached_schema", schema)
+        resolver = ResourceSchemaLoader(MODULE_NAME)
+
+        resolver.get_schema("cached_schema")["properties"]["added"] = {"type": "string"}
+        assert resolver.get_schema("cached_schema") == schema
+
+    @staticmethod
+    def test_shared_schemas_are_loaded_once():
+        referenced_schema = {"type": ["null", "object"], "properties": {"k1": {"type": "string"}}}
+        create_schema("shared/shared_schema", referenced_schema)
+        create_schema("first_schema", {"type": "object", "properties": {"obj": {"$ref": "shared_schema.json"}}})
+        create_schema("second_schema", {"type": "object", "properties": {"other_obj": {"$ref": "shared_schema.json"}}})
+        resolver = ResourceSchemaLoader(MODULE_NAME)
+
+        with patch.object(schema_helpers.json, "load", wraps=json.load) as load:
+            assert resolver.get_schema("first_schema")["properties"]["obj"] == referenced_schema
+            assert resolver.get_schema("second_schema")["properties"]["other_obj"] == referenced_schema
+        assert load.call_count == 1
+
+    @staticmethod
+    def test_bundled_schemas(empty_schemas_dir):
+        create_schema("shared/shared_schema", {"type": "string"})
+        create_schema("bundled_schema", {"type": "object", "properties": {"str": {"$ref": "shared_schema.json"}}})
+        expected_schema = {"type": "object", "properties": {"str": {"type": "string"}}}
+
+        path = bundle_schemas(MODULE_NAME)
+
+        assert path == str(SCHEMAS_ROOT.parent / BUNDLED_SCHEMAS_FILE)
+        with open(path) as file:
+            assert json.load(file)["bundled_schema"] == expected_schema
+        # Schemas are read from the bundle, not from their files
+        os.remove(SCHEMAS_ROOT / "bundled_schema.json")
+        assert ResourceSchemaLoader(MODULE_NAME).get_schema("bundled_schema") == expected_schema
+
+    @staticmethod
+    def test_schemas_missing_from_bundle_are_resolved(empty_schemas_dir):
+        create_schema("bundled_schema", {"type": "object"})
+        bundle_schemas(MODULE_NAME)
+        create_schema("unbundled_schema", {"type": "string"})
+
+        assert ResourceSchemaLoader(MODULE_NAME).get_schema("unbundled_schema") == {"type": "string"}
+
+    @staticmethod
+    def test_schemas_of_a_namespace_package_cannot_be_bundled(tmp_path, monkeypatch):
+        (tmp_path / "namespace_package").mkdir()
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with pytest_raises(ValueError, match="namespace_package"):
+            bundle_schemas("namespace_package")
+
+    @staticmethod
+    def test_bundle_schemas_command(empty_schemas_dir, capsys):
+        create_schema("bundled_schema", {"type": "object"})
+
+        bundle_schemas_main([MODULE_NAME])
+
+        assert BUNDLED_SCHEMAS_FILE in capsys.readouterr().out
+        assert (SCHEMAS_ROOT.parent / BUNDLED_SCHEMAS_FILE).exists()
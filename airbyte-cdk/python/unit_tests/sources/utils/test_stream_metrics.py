@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import itertools
+
+from airbyte_cdk.models import StreamDescriptor, TraceType, Type
+from airbyte_cdk.sources.utils.stream_metrics import LATENCY_BUCKETS_MS, StreamMetrics
+
+
+def test_request_latency_histogram():
+    metrics = StreamMetrics()
+
+    for latency in [0.01, 0.05, 0.3, 120]:
+        metrics.request_sent(latency)
+
+    assert metrics.request_count == 4
+    assert metrics.request_latency_counts == [2, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]
+    histogram = metrics.as_airbyte_message("stream").trace.metrics.request_latency_histogram
+    assert [bucket.upper_bound_ms for bucket in histogram] == [*LATENCY_BUCKETS_MS, None]
+    assert [bucket.count for bucket in histogram] == metrics.request_latency_counts
+
+
+def test_parsing_time_excludes_the_consumer(mocker):
+    metrics = StreamMetrics()
+    # every call to perf_counter moves the clock by a second
+    mocker.patch("airbyte_cdk.sources.utils.stream_metrics.time.perf_counter", side_effect=itertools.count())
+
+    for _ in metrics.timed_parsing(lambda: [{"id": 1}, {"id": 2}]):
+        metrics.transform_time += 10
+
+    # 1 second to call parse and 1 second for each of the 3 calls to next, the time between them is the consumer's
+    assert metrics.parse_time == 4
+
+
+def test_parsing_time_is_counted_when_reading_stops():
+    metrics = StreamMetrics()
+
+    records = metrics.timed_parsing(lambda: iter([{"id": 1}, {"id": 2}]))
+    next(records)
+    records.close()
+
+    assert metrics.parse_time > 0
+
+
+def test_backoff():
+    metrics = StreamMetrics()
+
+    metrics.backed_off(1.5)
+    metrics.backed_off(0)
+
+    assert metrics.backoff_time == 1.5
+
+
+def test_as_airbyte_message():
+    metrics = StreamMetrics()
+    metrics.request_sent(0.2)
+    metrics.response_read(1000)
+    metrics.records_emitted = 10
+    metrics.transform_time = 0.5
+
+    message = metrics.as_airbyte_message("stream")
+
+    assert message.type == Type.TRACE
+    assert message.trace.type == TraceType.METRICS
+    trace_metrics = message.trace.metrics
+    assert trace_metrics.stream_descriptor == StreamDescriptor(name="stream")
+    assert trace_metrics.request_count == 1
+    assert trace_metrics.request_time_ms == 200
+    assert trace_metrics.bytes_received == 1000
+    assert trace_metrics.records_emitted == 10
+    assert trace_metrics.transform_time_ms == 500
+    assert trace_metrics.elapsed_ms > 0
+
+
+def test_reset():
+    metrics = StreamMetrics()
+    metrics.request_sent(0.2)
+    metrics.records_emitted = 10
+
+    metrics.reset()
+
+    assert metrics.request_count == 0
+    assert metrics.request_latency_counts == [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    assert metrics.records_emitted == 0
@@ -5,6 +5,7 @@
 import json
 
 import pytest
+from airbyte_cdk.sources.utils import transform as transform_module
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
@@ -124,6 +125,13 @@ VERY_NESTED_SCHEMA = {
             {"value": "12"},
             "{'value': '12'} is not of type 'integer'",
         ),
+        (
+            # False schema does not allow anything
+            False,
+            {"value": 12},
+            {"value": 12},
+            "False schema does not allow {'value': 12}",
+        ),
         (
             # More than one type except null, no conversion should happen
             {"type": "object", "properties": {"value": {"type": ["string", "boolean", "null"]}}},
@@ -210,3 +218,39 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_transform_recursive_schema():
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#"}}},
+    }
+    obj = {"name": 1, "children": [{"name": 2, "children": [{"name": 3}]}]}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(obj, schema)
+
+    assert obj == {"name": "1", "children": [{"name": "2", "children": [{"name": "3"}]}]}
+
+
+def test_transform_reuses_compiled_schema(mocker):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compiler = mocker.spy(transform_module, "_SchemaCompiler")
+
+    for value in range(3):
+        obj = {"value": value}
+        t.transform(obj, SIMPLE_SCHEMA)
+        assert obj == {"value": str(value)}
+    t.transform({"value": 1}, COMPLEX_SCHEMA)
+
+    assert compiler.call_count == 2
+
+
+def test_overridden_default_convert_is_used():
+    class UpperCaseTransformer(TypeTransformer):
+        @staticmethod
+        def default_convert(original_item, subschema):
+            return str(original_item).upper()
+
+    obj = {"value": "abc"}
+    UpperCaseTransformer(TransformConfig.DefaultSchemaNormalization).transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": "ABC"}
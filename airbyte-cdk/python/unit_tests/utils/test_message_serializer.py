@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import json
+import math
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Level, Type
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import airbyte_message_to_json
+
+
+@pytest.fixture
+def stdlib_json(mocker):
+    mocker.patch.object(message_serializer, "dumps", message_serializer._dumps_json)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data={"a": 1, "b": [{"c": None}]}, emitted_at=1)),
+            id="record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace="n", stream="s", data={}, emitted_at=1)),
+            id="record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(stream="s", data={"a": "b"}, emitted_at=1)),
+            id="constructed_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data={}, emitted_at=1, extra_field="x")),
+            id="record_with_extra_field",
+        ),
+        pytest.param(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"s": {"cursor": 1}})), id="state"),
+        pytest.param(AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="hi")), id="log"),
+    ],
+)
+def test_same_output_as_pydantic(stdlib_json, message):
+    assert airbyte_message_to_json(message) == message.json(exclude_unset=True)
+
+
+def test_record_with_non_json_types(stdlib_json):
+    data = {"date": datetime.date(2022, 1, 1), "amount": Decimal("1.5")}
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data=data, emitted_at=1))
+
+    assert airbyte_message_to_json(message) == message.json(exclude_unset=True)
+
+
+def test_orjson_output_is_equivalent():
+    pytest.importorskip("orjson")
+    data = {"a": 1, "date": datetime.datetime(2022, 1, 1, 10, 0), "amount": Decimal("1.5"), 1: "non str key"}
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data=data, emitted_at=1))
+
+    assert json.loads(message_serializer._dumps_orjson(message.dict(exclude_unset=True))) == json.loads(message.json(exclude_unset=True))
+
+
+@pytest.mark.parametrize("value", [2**64, -(2**63) - 1])
+def test_orjson_falls_back_to_json_for_big_integers(value):
+    pytest.importorskip("orjson")
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data={"id": value}, emitted_at=1))
+
+    assert message_serializer._dumps_orjson(message.dict(exclude_unset=True)) == message.json(exclude_unset=True)
+
+
+def test_loads_reads_json_nan():
+    assert math.isnan(message_serializer.loads(message_serializer._dumps_json({"a": float("nan")}))["a"])
+
+
+def test_loads_raises_on_malformed_input():
+    with pytest.raises(ValueError):
+        message_serializer.loads('{"a": ')
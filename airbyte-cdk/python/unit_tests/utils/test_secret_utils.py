@@ -121,3 +121,23 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    "secrets, string, expected",
+    [
+        (["x", "xk"], "xk", "****"),
+        (["xk", "x"], "xk", "****"),
+        (["abc", "bcd"], "abcd", "****"),
+        (["abc", "cde"], "abc cde abcde", "**** **** ****"),
+        (["abc"], "abcabc", "********"),
+        (["aa"], "aaa", "****"),
+        (["a.c"], "abc a.c", "abc ****"),
+        ([12345], "code 12345", "code ****"),
+        (["secret"], "no match", "no match"),
+    ],
+)
+def test_secret_filtering_masks_overlapping_secrets(secrets, string, expected):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected
+    update_secrets([])
@@ -198,6 +198,7 @@ module.exports = {
             'connector-development/cdk-python/http-streams',
             'connector-development/cdk-python/python-concepts',
             'connector-development/cdk-python/stream-slices',
+            'connector-development/cdk-python/async-jobs',
           ]
         },
         'connector-development/cdk-faros-js',